@@ -0,0 +1,39 @@
+"""Per-conversation turn counter
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "conversations",
+        sa.Column("turn_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill from existing turns
+    op.execute(
+        """
+        UPDATE conversations
+        SET turn_count = COALESCE(
+            (SELECT MAX(turns.turn_number) FROM turns WHERE turns.conversation_id = conversations.id),
+            0
+        )
+        """
+    )
+    # uq_turn_number on turns (conversation_id, turn_number) is created in 001
+
+
+def downgrade() -> None:
+    op.drop_column("conversations", "turn_count")
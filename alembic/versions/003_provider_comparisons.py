@@ -0,0 +1,43 @@
+"""Provider comparison rows from offline replay runs
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "provider_comparisons",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("run_id", sa.String(64), nullable=False),
+        sa.Column("turn_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("turns.id"), nullable=False),
+        sa.Column("language", sa.String(5), nullable=False),
+        sa.Column("openai_text", sa.Text(), nullable=True),
+        sa.Column("openai_confidence", sa.Numeric(5, 4), nullable=True),
+        sa.Column("openai_latency_ms", sa.Integer(), nullable=True),
+        sa.Column("openai_error", sa.Text(), nullable=True),
+        sa.Column("google_text", sa.Text(), nullable=True),
+        sa.Column("google_confidence", sa.Numeric(5, 4), nullable=True),
+        sa.Column("google_latency_ms", sa.Integer(), nullable=True),
+        sa.Column("google_error", sa.Text(), nullable=True),
+        sa.Column("provider_wer", sa.Numeric(5, 4), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("run_id", "turn_id", name="uq_comparison_run_turn"),
+    )
+    op.create_index("ix_provider_comparisons_run_id", "provider_comparisons", ["run_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("provider_comparisons")
@@ -0,0 +1,26 @@
+"""Provider actually used per turn
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("turns", sa.Column("stt_provider_used", sa.String(20), nullable=True))
+    op.add_column("turns", sa.Column("tts_provider_used", sa.String(20), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("turns", "tts_provider_used")
+    op.drop_column("turns", "stt_provider_used")
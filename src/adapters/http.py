@@ -0,0 +1,32 @@
+"""Shared HTTP client construction for provider adapters."""
+
+import importlib.util
+
+import httpx
+
+from src.config import get_settings
+
+
+def create_http_client(timeout: float = 30.0) -> httpx.AsyncClient:
+    """Create a pooled, keep-alive HTTP client for provider calls.
+    
+    Pool sizes, keep-alive expiry and HTTP/2 are tuned via settings.
+    HTTP/2 is only enabled when the optional ``h2`` package is installed.
+    
+    Args:
+        timeout: Default request timeout in seconds
+        
+    Returns:
+        Configured httpx.AsyncClient (caller owns it and must close it)
+    """
+    settings = get_settings()
+    http2 = settings.http2_enabled and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+    )
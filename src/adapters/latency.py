@@ -0,0 +1,28 @@
+"""Rolling latency statistics for provider calls."""
+
+from collections import deque
+from typing import Optional
+
+
+class LatencyWindow:
+    """Keeps the last N latencies of a provider and answers percentiles."""
+
+    def __init__(self, size: int = 200):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    @property
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return len(self._samples)
+
+    def record(self, latency_ms: float) -> None:
+        """Add one latency sample."""
+        self._samples.append(latency_ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Get the q-th percentile (0-100), or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
@@ -0,0 +1,118 @@
+"""Process-wide registry of long-lived STT/TTS adapters.
+
+Started and closed in the application lifespan. Each provider gets one
+adapter instance for the whole process, and adapters talking to the same
+host share one pooled keep-alive HTTP client, so turns do not pay for TCP
+and TLS setup again.
+"""
+
+from typing import Literal, Optional
+
+import httpx
+
+from src.adapters.http import create_http_client
+from src.adapters.stt.base import STTAdapter
+from src.adapters.stt.hedged import HedgedSTTAdapter
+from src.adapters.tts.base import TTSAdapter
+from src.config import get_settings
+
+
+class AdapterRegistry:
+    """Holds one adapter per provider and the shared HTTP connection pools."""
+
+    def __init__(self):
+        self.started = False
+        self._http_clients: dict[str, httpx.AsyncClient] = {}
+        self._stt_adapters: dict[str, STTAdapter] = {}
+        self._hedged_stt_adapters: dict[str, HedgedSTTAdapter] = {}
+        self._tts_adapters: dict[str, TTSAdapter] = {}
+
+    def start(self) -> None:
+        """Mark registry as active; adapters and pools are created on first use."""
+        self.started = True
+        self._hedged_stt_adapters.clear()  # rebuilt on the pooled adapters
+
+    def get_http_client(self, name: str) -> httpx.AsyncClient:
+        """Get shared HTTP client for an upstream host (e.g. "openai", "openrouter")."""
+        if name not in self._http_clients:
+            self._http_clients[name] = create_http_client()
+        return self._http_clients[name]
+
+    def get_stt_adapter(self, provider: Literal["openai", "google"]) -> STTAdapter:
+        """Get long-lived STT adapter for provider."""
+        if provider not in self._stt_adapters:
+            self._stt_adapters[provider] = self._create_stt_adapter(provider, pooled=True)
+        return self._stt_adapters[provider]
+
+    def _create_stt_adapter(self, provider: str, pooled: bool) -> STTAdapter:
+        if provider == "openai":
+            from src.adapters.stt.openai_adapter import OpenAISTTAdapter
+            return OpenAISTTAdapter(http_client=self.get_http_client("openai") if pooled else None)
+        elif provider == "google":
+            from src.adapters.stt.google_adapter import GoogleSTTAdapter
+            return GoogleSTTAdapter(
+                http_client=self.get_http_client("openrouter") if pooled else None
+            )
+        raise ValueError(f"Unknown STT provider: {provider}")
+
+    def get_hedged_stt_adapter(
+        self,
+        primary: Literal["openai", "google"],
+        secondary: Literal["openai", "google"],
+    ) -> HedgedSTTAdapter:
+        """Get long-lived hedged STT adapter (keeps its latency history).
+
+        Also kept before start(), with unpooled provider adapters, so the
+        hedge delay and rate cap learn in scripts and tests too.
+        """
+        if primary not in self._hedged_stt_adapters:
+            settings = get_settings()
+            if self.started:
+                adapters = self.get_stt_adapter(primary), self.get_stt_adapter(secondary)
+            else:
+                adapters = (
+                    self._create_stt_adapter(primary, pooled=False),
+                    self._create_stt_adapter(secondary, pooled=False),
+                )
+            self._hedged_stt_adapters[primary] = HedgedSTTAdapter(
+                primary=adapters[0],
+                secondary=adapters[1],
+                max_hedge_rate=settings.stt_hedge_max_rate,
+                default_delay_ms=settings.stt_hedge_default_delay_ms,
+                min_delay_ms=settings.stt_hedge_min_delay_ms,
+            )
+        return self._hedged_stt_adapters[primary]
+
+    def get_tts_adapter(self, provider: Literal["openai", "google"]) -> TTSAdapter:
+        """Get long-lived TTS adapter for provider."""
+        if provider not in self._tts_adapters:
+            if provider == "openai":
+                from src.adapters.tts.openai_adapter import OpenAITTSAdapter
+                adapter = OpenAITTSAdapter(http_client=self.get_http_client("openai"))
+            elif provider == "google":
+                from src.adapters.tts.google_adapter import GoogleTTSAdapter
+                adapter = GoogleTTSAdapter()
+            else:
+                raise ValueError(f"Unknown TTS provider: {provider}")
+            self._tts_adapters[provider] = adapter
+        return self._tts_adapters[provider]
+
+    async def aclose(self) -> None:
+        """Close all pooled connections and drop adapters."""
+        self.started = False
+        self._stt_adapters.clear()
+        self._hedged_stt_adapters.clear()
+        self._tts_adapters.clear()
+        for client in self._http_clients.values():
+            await client.aclose()
+        self._http_clients.clear()
+
+
+_adapter_registry: Optional[AdapterRegistry] = None
+
+
+def get_adapter_registry() -> AdapterRegistry:
+    global _adapter_registry
+    if _adapter_registry is None:
+        _adapter_registry = AdapterRegistry()
+    return _adapter_registry
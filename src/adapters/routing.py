@@ -0,0 +1,350 @@
+"""Health-aware provider routing with circuit breakers.
+
+Every STT/TTS call made through a routed adapter is recorded per
+provider: rolling p50/p95 latency and error rate over the last N calls.
+When a provider's error rate or p95 crosses its threshold the circuit
+opens and calls go to the other provider. After a cooldown one probe
+call is let through (half-open) while concurrent calls skip the
+provider; success closes the circuit again.
+
+Only provider-side failures count against health: 5xx answers, timeouts
+and connection errors. Client errors (invalid audio, text too long,
+other 4xx) and rate limits still fail over but leave the circuit alone,
+so one user's bad input cannot open it for everyone.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from typing import Literal, Optional
+
+import httpx
+
+from src.adapters.latency import LatencyWindow
+from src.adapters.stt.base import (
+    STTAdapter,
+    STTInvalidAudioError,
+    STTRateLimitError,
+    STTResult,
+    STTTimeoutError,
+)
+from src.adapters.tts.base import (
+    TTSAdapter,
+    TTSRateLimitError,
+    TTSResult,
+    TTSTextTooLongError,
+    TTSTimeoutError,
+)
+from src.config import get_settings
+
+PROVIDERS = ("openai", "google")
+
+ProviderKind = Literal["stt", "tts"]
+
+
+class ProviderUnavailableError(Exception):
+    """Provider skipped: its circuit is half-open and the probe is in flight."""
+
+    def __init__(self, kind: str, provider: str):
+        super().__init__(f"{kind} provider {provider} is being probed")
+        self.provider = provider
+
+
+class ProviderHealth:
+    """Rolling health window and circuit breaker of one provider."""
+
+    def __init__(
+        self,
+        window_size: int = 50,
+        min_calls: int = 10,
+        error_rate_threshold: float = 0.5,
+        latency_threshold_ms: float = 10000,
+        cooldown_seconds: float = 30.0,
+    ):
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_threshold_ms = latency_threshold_ms
+        self.cooldown_seconds = cooldown_seconds
+        self.latency = LatencyWindow(window_size)
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self.state: Literal["closed", "open", "half_open"] = "closed"
+        self._opened_at = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed calls in the window."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def is_available(self) -> bool:
+        """Whether calls should go to this provider (does not claim the probe)."""
+        if self.state == "open":
+            return time.monotonic() - self._opened_at >= self.cooldown_seconds
+        return self.state == "closed"
+
+    def acquire(self) -> bool:
+        """Claim a call; after the cooldown the first caller becomes the probe.
+
+        Returns:
+            False if the circuit is open, or half-open with a probe in flight
+        """
+        if self.state == "open" and self.is_available():
+            self.state = "half_open"
+            return True
+        return self.state == "closed"
+
+    def release(self) -> None:
+        """Give back a probe whose call ended without an outcome."""
+        if self.state == "half_open":
+            self.state = "open"  # cooldown already passed; the next caller probes
+
+    def record(self, success: bool, latency_ms: float) -> None:
+        """Record a call outcome and update the circuit."""
+        if self.state == "half_open":
+            if success:
+                self._reset()
+            else:
+                self._open()
+            return
+
+        self._outcomes.append(success)
+        if success:
+            self.latency.record(latency_ms)
+
+        if self.state == "closed" and len(self._outcomes) >= self.min_calls:
+            p95 = self.latency.percentile(95)
+            if self.error_rate >= self.error_rate_threshold or (
+                p95 is not None and p95 >= self.latency_threshold_ms
+            ):
+                self._open()
+
+    def _open(self) -> None:
+        self.state = "open"
+        self._opened_at = time.monotonic()
+
+    def _reset(self) -> None:
+        self.state = "closed"
+        self._outcomes.clear()
+        self.latency = LatencyWindow(self._outcomes.maxlen or 50)
+
+    def stats(self) -> dict:
+        """Current health figures."""
+        return {
+            "state": self.state,
+            "calls": len(self._outcomes),
+            "error_rate": self.error_rate,
+            "p50_ms": self.latency.percentile(50),
+            "p95_ms": self.latency.percentile(95),
+        }
+
+
+class ProviderRouter:
+    """Orders providers by health for each call."""
+
+    def __init__(self, **health_options):
+        self._health_options = health_options
+        self._health: dict[tuple[str, str], ProviderHealth] = {}
+
+    def health(self, kind: ProviderKind, provider: str) -> ProviderHealth:
+        """Health tracker of a provider for STT or TTS."""
+        key = (kind, provider)
+        if key not in self._health:
+            self._health[key] = ProviderHealth(**self._health_options)
+        return self._health[key]
+
+    def order(self, kind: ProviderKind, preferred: str) -> list[str]:
+        """Providers to try in order: healthy ones first, preferred before others.
+
+        Providers with an open circuit are kept at the end as a last resort,
+        so a call is still attempted when every circuit is open.
+        """
+        candidates = [preferred] + [p for p in PROVIDERS if p != preferred]
+        available = [p for p in candidates if self.health(kind, p).is_available()]
+        return available + [p for p in candidates if p not in available]
+
+    def record(self, kind: ProviderKind, provider: str, success: bool, latency_ms: float) -> None:
+        """Record outcome of a call."""
+        self.health(kind, provider).record(success, latency_ms)
+
+    @contextmanager
+    def attempt(self, kind: ProviderKind, provider: str) -> Iterator[None]:
+        """Track one call to provider made in the block.
+
+        Claims the half-open probe, records success or a provider failure,
+        and releases the probe on client errors and cancellation. While
+        another call is the probe, raises ProviderUnavailableError so the
+        caller moves on to the next provider. A circuit still cooling down
+        is let through as the last resort order() makes it.
+        """
+        health = self.health(kind, provider)
+        probe = health.state == "open" and health.is_available()
+        if not health.acquire() and health.state == "half_open":
+            raise ProviderUnavailableError(kind, provider)
+        start_time = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if is_provider_failure(e):
+                health.record(False, _elapsed_ms(start_time))
+            elif probe:
+                health.release()
+            raise
+        except BaseException:
+            if probe:
+                health.release()
+            raise
+        health.record(True, _elapsed_ms(start_time))
+
+    def stats(self) -> dict[str, dict]:
+        """Health of all providers seen so far, keyed "kind:provider"."""
+        return {f"{kind}:{provider}": h.stats() for (kind, provider), h in self._health.items()}
+
+
+class RoutedSTTAdapter(STTAdapter):
+    """STT adapter that picks a healthy provider and fails over on errors."""
+
+    def __init__(
+        self,
+        router: ProviderRouter,
+        preferred: str,
+        get_adapter: Callable[[str], STTAdapter],
+    ):
+        self.router = router
+        self.preferred = preferred
+        self.get_adapter = get_adapter
+
+    async def transcribe(
+        self,
+        audio: bytes,
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+    ) -> STTResult:
+        """Transcribe with the first healthy provider; result.provider tells which."""
+        last_error: Optional[Exception] = None
+        for provider in self.router.order("stt", self.preferred):
+            try:
+                with self.router.attempt("stt", provider):
+                    result = await self.get_adapter(provider).transcribe(audio, language, hints)
+            except Exception as e:
+                last_error = e
+                continue
+            result.provider = result.provider or provider
+            return result
+        raise last_error
+
+    def get_provider_name(self) -> str:
+        return self.preferred
+
+
+class RoutedTTSAdapter(TTSAdapter):
+    """TTS adapter that picks a healthy provider and fails over on errors."""
+
+    def __init__(
+        self,
+        router: ProviderRouter,
+        preferred: str,
+        get_adapter: Callable[[str], TTSAdapter],
+    ):
+        self.router = router
+        self.preferred = preferred
+        self.get_adapter = get_adapter
+
+    async def synthesize(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> TTSResult:
+        """Synthesize with the first healthy provider; result.provider tells which."""
+        last_error: Optional[Exception] = None
+        for provider in self.router.order("tts", self.preferred):
+            try:
+                with self.router.attempt("tts", provider):
+                    result = await self.get_adapter(provider).synthesize(text, language, voice, speed)
+            except Exception as e:
+                last_error = e
+                continue
+            result.provider = result.provider or provider
+            return result
+        raise last_error
+
+    async def synthesize_stream(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """Stream from the first healthy provider.
+
+        Fails over only until the first chunk is out; after that an error
+        is raised to the caller. Latency recorded is time to first chunk.
+        """
+        last_error: Optional[Exception] = None
+        for provider in self.router.order("tts", self.preferred):
+            stream = self.get_adapter(provider).synthesize_stream(text, language, voice, speed)
+            try:
+                with self.router.attempt("tts", provider):
+                    first_chunk = await anext(stream, None)
+            except Exception as e:
+                last_error = e
+                continue
+            if first_chunk is None:
+                return
+
+            try:
+                yield first_chunk
+                async for chunk in stream:
+                    yield chunk
+            finally:
+                await stream.aclose()
+            return
+        raise last_error
+
+    def get_provider_name(self) -> str:
+        return self.preferred
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    """Whether error says the provider is unhealthy rather than the request bad.
+
+    5xx answers, timeouts and connection errors count; client errors
+    (4xx, invalid audio, text too long) and rate limits do not.
+    """
+    if isinstance(error, (STTTimeoutError, TTSTimeoutError, asyncio.TimeoutError)):
+        return True
+    if isinstance(error, (STTInvalidAudioError, TTSTextTooLongError)):
+        return False
+    if isinstance(error, (STTRateLimitError, TTSRateLimitError)):
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    status_code = getattr(error, "details", {}).get("status_code")
+    if status_code is not None:
+        return status_code >= 500
+    return True  # no response at all: connection error or provider outage
+
+
+def _elapsed_ms(start_time: float) -> float:
+    return (time.perf_counter() - start_time) * 1000
+
+
+_provider_router: Optional[ProviderRouter] = None
+
+
+def get_provider_router() -> ProviderRouter:
+    global _provider_router
+    if _provider_router is None:
+        settings = get_settings()
+        _provider_router = ProviderRouter(
+            window_size=settings.provider_health_window,
+            min_calls=settings.provider_health_min_calls,
+            error_rate_threshold=settings.provider_error_rate_threshold,
+            latency_threshold_ms=settings.provider_latency_threshold_ms,
+            cooldown_seconds=settings.provider_circuit_cooldown_seconds,
+        )
+    return _provider_router
@@ -0,0 +1,369 @@
+"""Provider call scheduler: per-provider token buckets with priorities.
+
+Every outgoing STT, TTS and LLM request goes through
+``get_provider_scheduler().run(provider, call)``. Each provider (upstream
+host: "openai", "openrouter", "groq", "edge") has a token bucket refilled
+at its configured requests per second.
+
+Priorities: calls default to INTERACTIVE. Background work (provider
+replay, dual-provider comparisons) runs inside ``call_priority(BATCH)``;
+the priority travels through asyncio tasks via a context variable, so
+adapters need no extra argument. Waiting interactive calls are always
+served before waiting batch calls, and batch calls may not use the last
+``batch_reserve`` share of the bucket, which keeps headroom for live
+turns while batch work uses the rest.
+
+Rate limits: when a provider answers 429, its bucket is paused for the
+``Retry-After`` period and the call is queued again (up to
+``max_retries`` times and only for short waits; otherwise the error is
+raised so routing can fail over).
+
+Transient failures (5xx, 408/409 and connection errors) are retried up
+to ``transient_retries`` times with exponential backoff, as the OpenAI
+SDK does on its own; its built-in retries are turned off so 429s are
+only handled here. Timeouts are not retried: each attempt already waited
+the full timeout, and routing fails over faster than a retry would.
+
+Providers without a configured rate (or with a rate of 0) are not
+throttled; with ``provider_rate_limits = {}`` (the default) calls are
+only retried, never queued.
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Optional, TypeVar
+
+import httpx
+import openai
+
+from src.adapters.latency import LatencyWindow
+from src.adapters.stt.base import STTRateLimitError
+from src.adapters.tts.base import TTSRateLimitError
+from src.config import get_settings
+
+T = TypeVar("T")
+
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 8.0
+
+
+class Priority(IntEnum):
+    """Call priority; lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "provider_call_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def call_priority(priority: Priority) -> Iterator[None]:
+    """Run provider calls made in this block (and its tasks) at priority."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def retry_after_seconds(headers: httpx.Headers) -> Optional[float]:
+    """Parse Retry-After (seconds or HTTP date) or retry-after-ms headers."""
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _rate_limit_delay(error: Exception) -> Optional[float]:
+    """Seconds to wait if error is a provider rate limit, else None."""
+    if isinstance(error, (STTRateLimitError, TTSRateLimitError)):
+        return error.details.get("retry_after") or DEFAULT_RETRY_AFTER_SECONDS
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+        return retry_after_seconds(error.response.headers) or DEFAULT_RETRY_AFTER_SECONDS
+    return None
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether error is a server-side or connection failure worth retrying."""
+    if isinstance(error, (openai.APITimeoutError, httpx.TimeoutException)):
+        # A hung provider would hold the caller for every retry's full
+        # timeout; fail now so routing and failover see it
+        return False
+    if isinstance(error, (openai.APIConnectionError, httpx.TransportError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        status_code = error.status_code
+    elif isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+    else:
+        return False
+    return status_code >= 500 or status_code in (408, 409)
+
+
+class ProviderLimiter:
+    """Token bucket with a priority wait queue for one provider."""
+
+    def __init__(self, rate: float, burst: int = 10, batch_reserve: float = 0.3):
+        """Initialize limiter.
+
+        Args:
+            rate: Requests per second
+            burst: Bucket capacity
+            batch_reserve: Share of the bucket only interactive calls may use
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.reserved_tokens = min(batch_reserve * self.burst, self.burst - 1)
+        self.tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[Priority, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def waiting(self) -> int:
+        """Number of calls waiting for a token."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now > self._updated_at:  # no refill while paused
+            self.tokens = min(self.burst, self.tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+    def _tokens_needed(self, priority: Priority) -> float:
+        return 1 + (self.reserved_tokens if priority == Priority.BATCH else 0)
+
+    def _try_take(self, priority: Priority) -> bool:
+        if time.monotonic() < self._paused_until:
+            return False
+        self._refill()
+        if self.tokens < self._tokens_needed(priority):
+            return False
+        self.tokens -= 1
+        return True
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """Wait for a token; higher priority waiters are served first."""
+        if (not self._waiters or self._waiters[0][0] > priority) and self._try_take(priority):
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.tokens += 1  # granted after cancellation, give it back
+            self._dispatch()
+            raise
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for seconds (provider sent Retry-After)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+        self._updated_at = self._paused_until
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant tokens to waiters in priority order and schedule the next wakeup."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_take(priority):
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+        if self._waiters:
+            now = time.monotonic()
+            missing = self._tokens_needed(self._waiters[0][0]) - self.tokens
+            delay = max(self._paused_until - now, missing / self.rate, 0.001)
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def stats(self) -> dict:
+        """Current bucket state."""
+        self._refill()
+        return {
+            "rate": self.rate,
+            "tokens": round(self.tokens, 2),
+            "waiting": self.waiting,
+            "paused_for_s": round(max(0.0, self._paused_until - time.monotonic()), 2),
+        }
+
+
+class ProviderScheduler:
+    """Runs provider calls through per-provider limiters and records queue times."""
+
+    def __init__(
+        self,
+        rate_limits: Optional[dict[str, float]] = None,
+        burst: int = 10,
+        batch_reserve: float = 0.3,
+        max_retries: int = 2,
+        max_retry_after_seconds: float = 10.0,
+        transient_retries: int = 2,
+        backoff_seconds: float = 0.5,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            rate_limits: Requests per second by provider; others (and rates
+                of 0) are unlimited
+            burst: Bucket capacity of each limiter
+            batch_reserve: Share of each bucket kept for interactive calls
+            max_retries: Re-queues of a call after a 429
+            max_retry_after_seconds: Longer Retry-After waits fail the call
+            transient_retries: Retries of a call after a 5xx or connection error
+            backoff_seconds: Wait before the first such retry, doubled after each
+        """
+        self.max_retries = max_retries
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self.transient_retries = transient_retries
+        self.backoff_seconds = backoff_seconds
+        self._limiters = {
+            provider: ProviderLimiter(rate, burst, batch_reserve)
+            for provider, rate in (rate_limits or {}).items()
+            if rate > 0
+        }
+        self._queue_ms: dict[tuple[str, Priority], LatencyWindow] = {}
+        self._calls: dict[str, int] = {}
+        self._rate_limited: dict[str, int] = {}
+        self._retried: dict[str, int] = {}
+
+    def limiter(self, provider: str) -> Optional[ProviderLimiter]:
+        """Limiter of provider, None if it is unlimited."""
+        return self._limiters.get(provider)
+
+    async def run(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        priority: Optional[Priority] = None,
+    ) -> T:
+        """Run call when provider has capacity.
+
+        Args:
+            provider: Upstream provider name
+            call: Function making one provider request
+            priority: Defaults to the priority of the current context
+
+        Returns:
+            Result of call
+        """
+        priority = _current_priority.get() if priority is None else priority
+        limiter = self.limiter(provider)
+        attempt = 0
+        transient_attempt = 0
+        while True:
+            queued_at = time.perf_counter()
+            if limiter is not None:
+                await limiter.acquire(priority)
+            self._record_queue_time(provider, priority, (time.perf_counter() - queued_at) * 1000)
+
+            try:
+                return await call()
+            except Exception as e:
+                delay = _rate_limit_delay(e)
+                if delay is None:
+                    if not _is_transient(e) or transient_attempt >= self.transient_retries:
+                        raise
+                    transient_attempt += 1
+                    self._retried[provider] = self._retried.get(provider, 0) + 1
+                    await asyncio.sleep(self._backoff(transient_attempt))
+                    continue
+                self._rate_limited[provider] = self._rate_limited.get(provider, 0) + 1
+                if limiter is not None:
+                    limiter.pause(delay)
+                if attempt >= self.max_retries or delay > self.max_retry_after_seconds:
+                    raise
+                attempt += 1
+                if limiter is None:
+                    await asyncio.sleep(delay)
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter before retry number attempt."""
+        delay = min(self.backoff_seconds * 2 ** (attempt - 1), MAX_BACKOFF_SECONDS)
+        return delay * (1 - 0.25 * random.random())
+
+    def _record_queue_time(self, provider: str, priority: Priority, queue_ms: float) -> None:
+        self._calls[provider] = self._calls.get(provider, 0) + 1
+        key = (provider, priority)
+        if key not in self._queue_ms:
+            self._queue_ms[key] = LatencyWindow(200)
+        self._queue_ms[key].record(queue_ms)
+
+    def stats(self) -> dict[str, dict]:
+        """Calls, 429s, retries, queue time percentiles and bucket state per provider."""
+        stats = {}
+        for provider, calls in self._calls.items():
+            provider_stats = {
+                "calls": calls,
+                "rate_limited": self._rate_limited.get(provider, 0),
+                "retried": self._retried.get(provider, 0),
+            }
+            for priority in Priority:
+                window = self._queue_ms.get((provider, priority))
+                if window is not None:
+                    provider_stats[f"queue_ms_{priority.name.lower()}"] = {
+                        "p50": window.percentile(50),
+                        "p95": window.percentile(95),
+                    }
+            limiter = self.limiter(provider)
+            if limiter is not None:
+                provider_stats.update(limiter.stats())
+            stats[provider] = provider_stats
+        return stats
+
+
+_provider_scheduler: Optional[ProviderScheduler] = None
+
+
+def get_provider_scheduler() -> ProviderScheduler:
+    global _provider_scheduler
+    if _provider_scheduler is None:
+        settings = get_settings()
+        _provider_scheduler = ProviderScheduler(
+            rate_limits=settings.provider_rate_limits,
+            burst=settings.provider_rate_burst,
+            batch_reserve=settings.provider_batch_reserve,
+            max_retries=settings.provider_rate_limit_retries,
+            max_retry_after_seconds=settings.provider_max_retry_after_seconds,
+            transient_retries=settings.provider_transient_retries,
+        )
+    return _provider_scheduler
@@ -24,6 +24,8 @@ class STTResult:
     words: list[STTWord] = field(default_factory=list)
     language: str = "ru"
     latency_ms: int = 0
+    provider: Optional[str] = None  # provider that actually answered
+    word_timings_estimated: bool = False  # words spread evenly, not real offsets
 
 
 class STTAdapter(ABC):
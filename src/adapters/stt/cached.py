@@ -0,0 +1,93 @@
+"""Content-addressed STT result cache.
+
+Re-uploads of the same recording (common on flaky mobile links) are
+answered from cache instead of a paid provider call. The key is a BLAKE2b
+hash of the audio bytes plus provider, language and hints.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import asdict
+from typing import Literal, Optional
+
+from src.adapters.stt.base import STTAdapter, STTResult, STTWord
+from src.cache import TieredCache
+from src.config import get_settings
+
+
+class CachedSTTAdapter(STTAdapter):
+    """Wraps an STT adapter with a result cache."""
+
+    def __init__(self, adapter: STTAdapter, cache: TieredCache):
+        """Initialize cached adapter.
+        
+        Args:
+            adapter: Adapter called on cache misses
+            cache: Cache holding serialized STTResults
+        """
+        self.adapter = adapter
+        self.cache = cache
+
+    @staticmethod
+    def cache_key(
+        audio: bytes,
+        provider: str,
+        language: str,
+        hints: Optional[list[str]] = None,
+    ) -> str:
+        """Cache key of a transcription request."""
+        digest = hashlib.blake2b(audio, digest_size=32)
+        for part in (provider, language, *sorted(hints or [])):
+            digest.update(b"\x00" + part.encode())
+        return digest.hexdigest()
+
+    async def transcribe(
+        self,
+        audio: bytes,
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+    ) -> STTResult:
+        """Return cached transcription, or transcribe and cache it."""
+        start_time = time.perf_counter()
+        key = self.cache_key(audio, self.get_provider_name(), language, hints)
+
+        cached = await self.cache.get(key)
+        if cached is not None:
+            result = _decode_result(cached)
+            result.latency_ms = int((time.perf_counter() - start_time) * 1000)
+            return result
+
+        result = await self.adapter.transcribe(audio, language, hints)
+        await self.cache.set(key, _encode_result(result))
+        return result
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
+
+
+def _encode_result(result: STTResult) -> bytes:
+    return json.dumps(asdict(result), ensure_ascii=False).encode()
+
+
+def _decode_result(data: bytes) -> STTResult:
+    fields = json.loads(data)
+    fields["words"] = [STTWord(**word) for word in fields["words"]]
+    return STTResult(**fields)
+
+
+_stt_cache: Optional[TieredCache] = None
+
+
+def get_stt_cache() -> TieredCache:
+    """Process-wide STT result cache."""
+    global _stt_cache
+    if _stt_cache is None:
+        settings = get_settings()
+        _stt_cache = TieredCache(
+            name="stt",
+            max_bytes=settings.stt_cache_max_bytes,
+            default_ttl_seconds=settings.stt_cache_ttl_seconds,
+            redis_url=settings.redis_url if settings.stt_cache_redis_enabled else None,
+        )
+    return _stt_cache
@@ -0,0 +1,237 @@
+"""Chunked STT for long recordings.
+
+Long voice messages hit provider upload and duration limits and take long
+to transcribe in one request. ChunkedSTTAdapter splits PCM WAV longer
+than ``max_segment_seconds`` at the quietest point near each limit,
+extends every segment by ``overlap_seconds`` on both sides so words at a
+cut are heard whole, and transcribes the segments concurrently.
+
+Stitching: each segment owns the span between its cuts. Word offsets are
+shifted by the segment start, and a word is kept only by the segment
+owning its midpoint, which removes the copies heard in the overlaps.
+Segment texts are joined dropping the longest repeated word run at each
+seam; words whose timings are only estimated (spread evenly over the
+text, as the OpenRouter Whisper adapter returns them) are joined the same
+way, since their midpoints say nothing about the seam. Compressed formats
+cannot be split and are transcribed whole.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+import numpy as np
+
+from src.adapters.stt.base import STTAdapter, STTResult, STTWord
+from src.audio_formats import decode_wav, encode_wav
+
+SILENCE_FRAME_MS = 20
+MAX_TEXT_OVERLAP_WORDS = 8
+
+
+@dataclass
+class AudioSegment:
+    """Segment of a long recording, times in seconds of the original."""
+
+    audio: bytes
+    offset: float  # start of the segment audio, including overlap
+    start: float  # start of the owned span
+    end: float  # end of the owned span
+
+
+def split_audio(
+    audio: bytes,
+    max_segment_seconds: float = 30.0,
+    overlap_seconds: float = 1.0,
+) -> list[AudioSegment]:
+    """Split long PCM WAV at silences into overlapping mono segments.
+
+    CPU-bound; call via asyncio.to_thread from async code.
+
+    Each cut is placed at the quietest 20 ms frame in the last third of
+    the allowed segment length (the latest one on ties).
+
+    Returns:
+        Segments in order, or an empty list if the audio is not WAV or
+        short enough to transcribe whole
+    """
+    decoded = decode_wav(audio)
+    if decoded is None:
+        return []
+
+    samples, sample_rate = decoded
+    samples = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+    max_len = int(max_segment_seconds * sample_rate)
+    if len(samples) <= max_len:
+        return []
+
+    frame_size = sample_rate * SILENCE_FRAME_MS // 1000
+    n_frames = len(samples) // frame_size
+    frames = samples[: n_frames * frame_size].reshape(n_frames, frame_size)
+    energy = np.mean(np.square(frames, dtype=np.float64), axis=1)
+
+    bounds = [0]
+    while len(samples) - bounds[-1] > max_len:
+        first = (bounds[-1] + max_len * 2 // 3) // frame_size
+        last = max(first + 1, (bounds[-1] + max_len) // frame_size)
+        # Latest of the quietest frames, keeping segments long
+        quietest = last - 1 - int(np.argmin(energy[first:last][::-1]))
+        bounds.append(quietest * frame_size + frame_size // 2)
+    bounds.append(len(samples))
+
+    overlap = int(overlap_seconds * sample_rate)
+    segments = []
+    for start, end in zip(bounds, bounds[1:]):
+        audio_start = max(0, start - overlap)
+        audio_end = min(len(samples), end + overlap)
+        segments.append(
+            AudioSegment(
+                audio=encode_wav(samples[audio_start:audio_end], sample_rate),
+                offset=audio_start / sample_rate,
+                start=start / sample_rate,
+                end=end / sample_rate,
+            )
+        )
+    return segments
+
+
+class ChunkedSTTAdapter(STTAdapter):
+    """Transcribes long audio as concurrent overlapping segments."""
+
+    def __init__(
+        self,
+        adapter: STTAdapter,
+        max_segment_seconds: float = 30.0,
+        overlap_seconds: float = 1.0,
+        concurrency: int = 4,
+    ):
+        """Initialize chunked adapter.
+
+        Args:
+            adapter: Adapter transcribing each segment
+            max_segment_seconds: Audio up to this long is sent whole
+            overlap_seconds: Audio added on each side of a cut
+            concurrency: Segments transcribed at the same time
+        """
+        self.adapter = adapter
+        self.max_segment_seconds = max_segment_seconds
+        self.overlap_seconds = overlap_seconds
+        self.concurrency = concurrency
+
+    async def transcribe(
+        self,
+        audio: bytes,
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+    ) -> STTResult:
+        """Transcribe audio, splitting it first when it is long."""
+        start_time = time.perf_counter()
+        segments = await asyncio.to_thread(
+            split_audio, audio, self.max_segment_seconds, self.overlap_seconds
+        )
+        if not segments:
+            return await self.adapter.transcribe(audio, language, hints)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def transcribe_segment(segment: AudioSegment) -> STTResult:
+            async with semaphore:
+                return await self.adapter.transcribe(segment.audio, language, hints)
+
+        tasks = [asyncio.create_task(transcribe_segment(s)) for s in segments]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        result = merge_segment_results(segments, results)
+        result.language = language
+        result.latency_ms = int((time.perf_counter() - start_time) * 1000)
+        return result
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
+
+
+def merge_segment_results(
+    segments: list[AudioSegment],
+    results: list[STTResult],
+) -> STTResult:
+    """Stitch per-segment results into one result on the original timeline."""
+    words: list[STTWord] = []
+    text = ""
+    weighted_confidence = 0.0
+
+    for segment, result in zip(segments, results):
+        shifted_words = [
+            STTWord(
+                word=word.word,
+                start=round(word.start + segment.offset, 3),
+                end=round(word.end + segment.offset, 3),
+                confidence=word.confidence,
+            )
+            for word in result.words
+        ]
+        if result.word_timings_estimated:
+            overlap = _seam_overlap([w.word for w in words], [w.word for w in shifted_words])
+            words.extend(shifted_words[overlap:])
+        else:
+            for shifted in shifted_words:
+                midpoint = (shifted.start + shifted.end) / 2
+                if segment.start <= midpoint < segment.end or (
+                    segment is segments[-1] and midpoint >= segment.end
+                ):
+                    _append_word(words, shifted)
+
+        text = _join_texts(text, result.text)
+        weighted_confidence += result.confidence * (segment.end - segment.start)
+
+    total = segments[-1].end - segments[0].start
+    return STTResult(
+        text=text,
+        confidence=weighted_confidence / total if total else 0.0,
+        words=words,
+        language=results[0].language,
+        provider=next((r.provider for r in results if r.provider), None),
+        word_timings_estimated=any(r.word_timings_estimated for r in results),
+    )
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w]", "", word.lower())
+
+
+def _append_word(words: list[STTWord], word: STTWord) -> None:
+    """Append word unless it repeats the previous one across a seam."""
+    if words:
+        previous = words[-1]
+        if (
+            _normalize_word(previous.word) == _normalize_word(word.word)
+            and word.start < previous.end
+        ):
+            if word.confidence > previous.confidence:
+                words[-1] = word
+            return
+    words.append(word)
+
+
+def _join_texts(left: str, right: str) -> str:
+    """Join segment texts, dropping words the overlap made both segments hear."""
+    left_words = left.split()
+    right_words = right.split()
+    return " ".join(left_words + right_words[_seam_overlap(left_words, right_words):])
+
+
+def _seam_overlap(left: list[str], right: list[str]) -> int:
+    """Length of the longest word run that ends ``left`` and starts ``right``."""
+    left_norm = [_normalize_word(w) for w in left]
+    right_norm = [_normalize_word(w) for w in right]
+    max_overlap = min(len(left), len(right), MAX_TEXT_OVERLAP_WORDS)
+    for size in range(max_overlap, 0, -1):
+        if left_norm[-size:] == right_norm[:size]:
+            return size
+    return 0
@@ -0,0 +1,73 @@
+"""Transport encoding of audio uploaded to STT providers.
+
+PCM WAV is re-encoded to Opus in an OGG container at a speech bitrate
+(24 kbps by default, about a tenth of 16 kHz 16-bit WAV) when the
+provider accepts OGG. Other inputs are uploaded as they are, with the
+file name and MIME type detected from their content instead of always
+claiming WAV.
+
+Opus is encoded with ``soundfile`` (src.audio_formats); if its
+libsndfile lacks Opus, WAV is uploaded unchanged.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.audio_formats import (
+    FORMATS,
+    decode_wav,
+    detect_audio_format,
+    encode_opus,
+    opus_available,
+)
+
+
+@dataclass
+class UploadAudio:
+    """Audio as sent to a provider."""
+
+    data: bytes
+    format: str
+
+    @property
+    def filename(self) -> str:
+        return f"audio.{self.format}"
+
+    @property
+    def content_type(self) -> str:
+        return FORMATS.get(self.format, "application/octet-stream")
+
+
+def prepare_upload(
+    audio: bytes,
+    accepted_formats: list[str],
+    opus_bitrate: int = 24000,
+) -> UploadAudio:
+    """Encode audio for upload.
+
+    CPU-bound; call via asyncio.to_thread from async code.
+
+    Args:
+        audio: Audio as received (after preprocessing)
+        accepted_formats: Formats the provider accepts
+        opus_bitrate: Target Opus bitrate in bits per second (0 disables)
+
+    Returns:
+        Opus/OGG when WAV can be encoded smaller, otherwise the input with
+        its detected format
+    """
+    audio_format = detect_audio_format(audio)
+    if audio_format == "wav" and opus_bitrate and "ogg" in accepted_formats and opus_available():
+        encoded = _encode_opus(audio, opus_bitrate)
+        if encoded is not None and len(encoded) < len(audio):
+            return UploadAudio(data=encoded, format="ogg")
+    return UploadAudio(data=audio, format=audio_format)
+
+
+def _encode_opus(audio: bytes, bitrate: int) -> Optional[bytes]:
+    """Encode PCM WAV to mono Opus/OGG, or None if it cannot be encoded."""
+    decoded = decode_wav(audio)
+    if decoded is None:
+        return None
+    samples, sample_rate = decoded
+    return encode_opus(samples, sample_rate, bitrate)
@@ -3,17 +3,23 @@
 Uses OpenRouter's Whisper model for speech-to-text.
 """
 
+import asyncio
 import time
-import base64
 import httpx
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Literal, Optional
 
+from src.adapters.scheduler import get_provider_scheduler, retry_after_seconds
 from src.adapters.stt.base import (
     STTAdapter,
     STTResult,
     STTWord,
     STTError,
+    STTTimeoutError,
+    STTRateLimitError,
 )
+from src.adapters.stt.encoding import prepare_upload
 from src.config import get_settings
 
 
@@ -21,12 +27,26 @@ class GoogleSTTAdapter(STTAdapter):
     """STT adapter using OpenRouter Whisper API."""
 
     PROVIDER_NAME = "google"
+    SUPPORTED_FORMATS = ["flac", "mp3", "mp4", "ogg", "wav", "webm"]
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize STT adapter."""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize STT adapter.
+        
+        Args:
+            api_key: Unused, the OpenRouter key comes from settings
+            http_client: Shared pooled HTTP client. If not provided, a
+                short-lived client is opened per request.
+        """
         settings = get_settings()
         self.api_key = settings.openrouter_api_key
-        
+        self.base_url = settings.openrouter_base_url
+        self.opus_bitrate = settings.stt_upload_opus_bitrate
+        self.http_client = http_client
+
     async def transcribe(
         self,
         audio: bytes,
@@ -41,23 +61,37 @@ class GoogleSTTAdapter(STTAdapter):
             return self._demo_transcribe(audio, language, start_time)
         
         try:
-            # Encode audio to base64
-            audio_b64 = base64.b64encode(audio).decode('utf-8')
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://openrouter.ai/api/v1/audio/transcriptions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                    },
-                    files={
-                        "file": ("audio.wav", audio, "audio/wav"),
-                    },
-                    data={
-                        "model": "openai/whisper-large-v3",
-                        "language": language,
-                    }
-                )
+            # Opus/OGG for WAV input, detected format otherwise
+            upload = await asyncio.to_thread(
+                prepare_upload, audio, self.SUPPORTED_FORMATS, self.opus_bitrate
+            )
+
+            async with self._client() as client:
+                async def request() -> httpx.Response:
+                    response = await client.post(
+                        f"{self.base_url}/audio/transcriptions",
+                        headers={
+                            "Authorization": f"Bearer {self.api_key}",
+                        },
+                        files={
+                            "file": (upload.filename, upload.data, upload.content_type),
+                        },
+                        data={
+                            "model": "openai/whisper-large-v3",
+                            "language": language,
+                        }
+                    )
+                    if response.status_code == 429:
+                        raise STTRateLimitError(
+                            message="Rate limit exceeded",
+                            provider=self.PROVIDER_NAME,
+                            details={"retry_after": retry_after_seconds(response.headers)},
+                        )
+                    if response.status_code >= 500:
+                        response.raise_for_status()  # scheduler retries 5xx
+                    return response
+
+                response = await get_provider_scheduler().run("openrouter", request)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -77,14 +111,43 @@ class GoogleSTTAdapter(STTAdapter):
                         words=word_results,
                         language=language,
                         latency_ms=latency_ms,
+                        word_timings_estimated=True,
                     )
                 else:
-                    print(f"OpenRouter STT error: {response.status_code} - {response.text}")
-                    return self._demo_transcribe(audio, language, start_time)
+                    raise STTError(
+                        message=f"OpenRouter returned {response.status_code}",
+                        provider=self.PROVIDER_NAME,
+                        details={"status_code": response.status_code, "body": response.text[:500]},
+                    )
                     
-        except Exception as e:
-            print(f"STT error: {e}")
-            return self._demo_transcribe(audio, language, start_time)
+        except httpx.TimeoutException as e:
+            raise STTTimeoutError(
+                message=f"Request timed out: {e}",
+                provider=self.PROVIDER_NAME,
+            )
+        except httpx.HTTPStatusError as e:
+            raise STTError(
+                message=f"OpenRouter returned {e.response.status_code}",
+                provider=self.PROVIDER_NAME,
+                details={
+                    "status_code": e.response.status_code,
+                    "body": e.response.text[:500],
+                },
+            )
+        except httpx.HTTPError as e:
+            raise STTError(
+                message=f"Request failed: {e}",
+                provider=self.PROVIDER_NAME,
+            )
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared client, or a one-off client if none was given."""
+        if self.http_client is not None:
+            yield self.http_client
+            return
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            yield client
 
     def _demo_transcribe(self, audio: bytes, language: str, start_time: float) -> STTResult:
         """Demo mode transcription."""
@@ -106,6 +169,7 @@ class GoogleSTTAdapter(STTAdapter):
             ],
             language=language,
             latency_ms=latency_ms,
+            word_timings_estimated=True,
         )
 
     def get_provider_name(self) -> str:
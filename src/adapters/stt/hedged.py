@@ -0,0 +1,136 @@
+"""Hedged STT: race a secondary provider against a slow primary.
+
+The primary provider gets the request first. If it has not answered after
+its adaptive p95 latency, the same audio is sent to the secondary provider,
+the first successful result wins and the other request is cancelled. A
+primary that fails fails over to the secondary immediately.
+
+Hedging doubles the cost of a request, so the share of hedged requests
+over the recent window is capped by max_hedge_rate. Past the cap a slow
+primary is awaited alone, but still fails over if it fails.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Literal, Optional
+
+from src.adapters.latency import LatencyWindow
+from src.adapters.stt.base import STTAdapter, STTResult
+
+# Primary latencies needed before the p95 replaces the default delay
+MIN_LATENCY_SAMPLES = 20
+
+
+class HedgedSTTAdapter(STTAdapter):
+    """STT adapter that hedges a primary provider with a secondary one."""
+
+    def __init__(
+        self,
+        primary: STTAdapter,
+        secondary: STTAdapter,
+        max_hedge_rate: float = 0.1,
+        default_delay_ms: int = 3000,
+        min_delay_ms: int = 300,
+        window_size: int = 200,
+    ):
+        """Initialize hedged adapter.
+        
+        Args:
+            primary: Adapter of the user's provider
+            secondary: Adapter raced against the primary when it is slow
+            max_hedge_rate: Maximum share of recent requests that may hedge
+            default_delay_ms: Hedge delay until enough latencies are known
+            min_delay_ms: Lower bound for the adaptive hedge delay
+            window_size: Number of recent requests/latencies tracked
+        """
+        self.primary = primary
+        self.secondary = secondary
+        self.max_hedge_rate = max_hedge_rate
+        self.default_delay_ms = default_delay_ms
+        self.min_delay_ms = min_delay_ms
+        self.latency = LatencyWindow(window_size)
+        self._recent_hedges: deque[bool] = deque(maxlen=window_size)
+        self.request_count = 0
+        self.hedge_count = 0
+        self.secondary_win_count = 0
+
+    def hedge_delay_ms(self) -> float:
+        """Current delay before the secondary provider is started."""
+        if self.latency.count < MIN_LATENCY_SAMPLES:
+            return self.default_delay_ms
+        return max(self.min_delay_ms, self.latency.percentile(95))
+
+    def _may_hedge(self) -> bool:
+        hedged = sum(self._recent_hedges)
+        return (hedged + 1) / (len(self._recent_hedges) + 1) <= self.max_hedge_rate
+
+    async def transcribe(
+        self,
+        audio: bytes,
+        language: Literal["ru", "kk"] = "ru",
+        hints: Optional[list[str]] = None,
+    ) -> STTResult:
+        """Transcribe with the primary, hedging with the secondary if it is slow."""
+        self.request_count += 1
+        start_time = time.perf_counter()
+        primary_task = asyncio.create_task(self.primary.transcribe(audio, language, hints))
+        tasks = {primary_task}
+
+        try:
+            await asyncio.wait(tasks, timeout=self.hedge_delay_ms() / 1000)
+
+            if primary_task.done():
+                self._recent_hedges.append(False)
+                if primary_task.exception() is None:
+                    self._record_primary(start_time)
+                    return primary_task.result()
+                # Primary failed: fail over without waiting
+                tasks.discard(primary_task)
+            elif not self._may_hedge():
+                self._recent_hedges.append(False)
+                await asyncio.wait(tasks)
+                if primary_task.exception() is None:
+                    self._record_primary(start_time)
+                    return primary_task.result()
+                # Over the hedge budget, but a failure still fails over
+                tasks.discard(primary_task)
+            else:
+                self._recent_hedges.append(True)
+                self.hedge_count += 1
+
+            secondary_task = asyncio.create_task(
+                self.secondary.transcribe(audio, language, hints)
+            )
+            tasks.add(secondary_task)
+
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    result = task.result()
+                    if task is primary_task:
+                        self._record_primary(start_time)
+                        result.provider = result.provider or self.primary.get_provider_name()
+                    else:
+                        self.secondary_win_count += 1
+                        result.provider = result.provider or self.secondary.get_provider_name()
+                    return result
+
+            # Both providers failed; report the primary's error
+            raise primary_task.exception()
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    if task is primary_task:
+                        # Cancelled primary: its latency is at least this long
+                        self._record_primary(start_time)
+
+    def _record_primary(self, start_time: float) -> None:
+        self.latency.record((time.perf_counter() - start_time) * 1000)
+
+    def get_provider_name(self) -> str:
+        return self.primary.get_provider_name()
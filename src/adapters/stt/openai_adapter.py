@@ -1,11 +1,13 @@
 """OpenAI Whisper STT Adapter implementation."""
 
-import io
+import asyncio
 import time
 from typing import Literal, Optional
 
+import httpx
 from openai import AsyncOpenAI, APIError, APITimeoutError, RateLimitError
 
+from src.adapters.scheduler import get_provider_scheduler, retry_after_seconds
 from src.adapters.stt.base import (
     STTAdapter,
     STTResult,
@@ -15,6 +17,7 @@ from src.adapters.stt.base import (
     STTInvalidAudioError,
     STTRateLimitError,
 )
+from src.adapters.stt.encoding import prepare_upload
 from src.config import get_settings
 
 
@@ -25,17 +28,30 @@ class OpenAISTTAdapter(STTAdapter):
     """
 
     PROVIDER_NAME = "openai"
-    SUPPORTED_FORMATS = ["mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"]
+    SUPPORTED_FORMATS = ["flac", "mp3", "mp4", "mpeg", "mpga", "m4a", "ogg", "wav", "webm"]
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize OpenAI STT adapter.
         
         Args:
             api_key: OpenAI API key. If not provided, uses settings.
+            http_client: Shared pooled HTTP client. If not provided, the
+                OpenAI SDK creates its own.
         """
         settings = get_settings()
-        self.client = AsyncOpenAI(api_key=api_key or settings.openai_api_key)
         self.timeout = 30.0
+        self.opus_bitrate = settings.stt_upload_opus_bitrate
+        self.client = AsyncOpenAI(
+            api_key=api_key or settings.openai_api_key,
+            base_url=settings.openai_base_url or None,
+            timeout=self.timeout,
+            max_retries=0,  # 429s and transient errors are retried by the provider scheduler
+            http_client=http_client,
+        )
 
     async def transcribe(
         self,
@@ -58,20 +74,34 @@ class OpenAISTTAdapter(STTAdapter):
         # Prepare prompt from hints
         prompt = " ".join(hints) if hints else None
 
-        # Create file-like object for API
-        audio_file = io.BytesIO(audio)
-        audio_file.name = "audio.wav"
+        # Opus/OGG for WAV input, detected format otherwise
+        upload = await asyncio.to_thread(
+            prepare_upload, audio, self.SUPPORTED_FORMATS, self.opus_bitrate
+        )
+
+        async def request():
+            try:
+                # Use verbose_json for word-level timestamps
+                return await self.client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=(upload.filename, upload.data, upload.content_type),
+                    language=language,
+                    prompt=prompt,
+                    response_format="verbose_json",
+                    timestamp_granularities=["word"],
+                )
+            except RateLimitError as e:
+                raise STTRateLimitError(
+                    message="Rate limit exceeded",
+                    provider=self.PROVIDER_NAME,
+                    details={
+                        "error": str(e),
+                        "retry_after": retry_after_seconds(e.response.headers),
+                    },
+                ) from e
 
         try:
-            # Use verbose_json for word-level timestamps
-            response = await self.client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language=language,
-                prompt=prompt,
-                response_format="verbose_json",
-                timestamp_granularities=["word"],
-            )
+            response = await get_provider_scheduler().run("openai", request)
 
             latency_ms = int((time.perf_counter() - start_time) * 1000)
 
@@ -107,13 +137,6 @@ class OpenAISTTAdapter(STTAdapter):
                 details={"timeout": self.timeout},
             ) from e
 
-        except RateLimitError as e:
-            raise STTRateLimitError(
-                message="Rate limit exceeded",
-                provider=self.PROVIDER_NAME,
-                details={"error": str(e)},
-            ) from e
-
         except APIError as e:
             if "Invalid file format" in str(e):
                 raise STTInvalidAudioError(
@@ -1,6 +1,7 @@
 """Base TTS Adapter interface and data classes."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Literal, Optional
 
@@ -13,6 +14,7 @@ class TTSResult:
     format: Literal["mp3", "wav", "ogg"]
     duration_ms: int
     latency_ms: int
+    provider: Optional[str] = None  # provider that actually answered
 
 
 class TTSAdapter(ABC):
@@ -46,12 +48,35 @@ class TTSAdapter(ABC):
         """
         pass
 
+    async def synthesize_stream(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """Synthesize text to speech, yielding audio chunks as they arrive.
+        
+        Concatenated chunks form the same audio synthesize() returns.
+        Providers without native streaming yield the whole audio at once.
+        
+        Raises:
+            TTSError: If synthesis fails
+        """
+        result = await self.synthesize(text, language, voice, speed)
+        yield result.audio
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get the name of this TTS provider."""
         pass
 
 
+def estimate_duration_ms(text: str, speed: float = 1.0) -> int:
+    """Estimate speech duration from text (~150 words per minute)."""
+    return int((len(text.split()) / 150) * 60 * 1000 / speed)
+
+
 class TTSError(Exception):
     """Base exception for TTS errors."""
 
@@ -0,0 +1,122 @@
+"""Chunked TTS for long texts.
+
+OpenAI rejects texts over MAX_TEXT_LENGTH, and Edge TTS takes about as
+long to answer as the speech it produces. ChunkedTTSAdapter splits text
+longer than ``max_chars`` (capped by the provider's MAX_TEXT_LENGTH) at
+sentence boundaries, synthesizes the pieces concurrently and joins the
+MP3 outputs at frame boundaries without re-encoding, so a long answer
+takes about as long as its slowest piece. The duration reported is read
+from the joined frame headers.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Literal, Optional
+
+from src.adapters.tts.base import TTSAdapter, TTSError, TTSResult
+from src.adapters.tts.mp3 import concat_mp3, mp3_duration_ms, mp3_frames
+from src.adapters.tts.sentences import split_text
+
+
+class ChunkedTTSAdapter(TTSAdapter):
+    """Synthesizes long text as concurrent pieces joined into one MP3."""
+
+    def __init__(
+        self,
+        adapter: TTSAdapter,
+        max_chars: int = 500,
+        concurrency: int = 4,
+    ):
+        """Initialize chunked adapter.
+
+        Args:
+            adapter: Adapter synthesizing each piece
+            max_chars: Text up to this long is sent whole
+            concurrency: Pieces synthesized at the same time
+        """
+        self.adapter = adapter
+        limit = getattr(adapter, "MAX_TEXT_LENGTH", None)
+        self.max_chars = min(max_chars, limit) if limit else max_chars
+        self.concurrency = concurrency
+
+    async def synthesize(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> TTSResult:
+        """Synthesize text, splitting it first when it is long."""
+        start_time = time.perf_counter()
+        pieces = split_text(text, self.max_chars)
+        if len(pieces) <= 1:
+            return await self.adapter.synthesize(text, language, voice, speed)
+
+        tasks = self._start(pieces, language, voice, speed)
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return self._join(results, start_time)
+
+    async def synthesize_stream(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """Stream the first piece as it arrives, the rest as they complete."""
+        pieces = split_text(text, self.max_chars)
+        if len(pieces) <= 1:
+            async for chunk in self.adapter.synthesize_stream(text, language, voice, speed):
+                yield chunk
+            return
+
+        tasks = self._start(pieces[1:], language, voice, speed)
+        try:
+            async for chunk in self.adapter.synthesize_stream(pieces[0], language, voice, speed):
+                yield chunk
+            for task in tasks:
+                yield mp3_frames((await task).audio)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _start(
+        self,
+        pieces: list[str],
+        language: str,
+        voice: Optional[str],
+        speed: float,
+    ) -> list[asyncio.Task]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def synthesize_piece(piece: str) -> TTSResult:
+            async with semaphore:
+                return await self.adapter.synthesize(piece, language, voice, speed)
+
+        return [asyncio.create_task(synthesize_piece(piece)) for piece in pieces]
+
+    def _join(self, results: list[TTSResult], start_time: float) -> TTSResult:
+        if any(r.format != "mp3" for r in results):
+            raise TTSError(
+                message="Only MP3 pieces can be joined",
+                provider=self.get_provider_name(),
+                details={"formats": sorted({r.format for r in results})},
+            )
+        audio = concat_mp3(r.audio for r in results)
+        return TTSResult(
+            audio=audio,
+            format="mp3",
+            duration_ms=mp3_duration_ms(audio) or sum(r.duration_ms for r in results),
+            latency_ms=int((time.perf_counter() - start_time) * 1000),
+            provider=next((r.provider for r in results if r.provider), None),
+        )
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
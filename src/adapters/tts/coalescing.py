@@ -0,0 +1,134 @@
+"""Single-flight coalescing of identical concurrent TTS requests.
+
+When many sessions ask for the same phrase at once (greetings at session
+start, fallback replies during an LLM outage), only the first request
+calls the provider; the others wait on that in-flight call and get a
+copy of its TTSResult. Requests are identical when text, language,
+voice, speed and provider match. Nothing is kept after the call
+finishes - repeated phrases are cached by TTSPhraseCache.
+
+Streaming synthesis is passed through: chunks are tied to one consumer.
+"""
+
+import asyncio
+import dataclasses
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Literal, Optional
+
+from src.adapters.tts.base import TTSAdapter, TTSResult
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its result."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self._waiters: dict[Hashable, int] = {}
+        self.requests = 0
+        self.upstream_calls = 0
+        self.coalesced = 0
+        self.max_waiters = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[TTSResult]]) -> TTSResult:
+        """Return the result of call(), joining an in-flight call for key.
+
+        The upstream call is cancelled only when every waiter has gone;
+        a failure is raised to all of them.
+        """
+        self.requests += 1
+        task = self._calls.get(key)
+        if task is None:
+            self.upstream_calls += 1
+            task = asyncio.create_task(call())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda _: self._done(key, task))
+        else:
+            self.coalesced += 1
+
+        self._waiters[key] += 1
+        self.max_waiters = max(self.max_waiters, self._waiters[key])
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and self._waiters.get(key) == 1:
+                task.cancel()
+            raise
+        finally:
+            if key in self._waiters and self._calls.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
+        if not task.cancelled():
+            task.exception()  # retrieved by the waiters; avoid "never retrieved"
+
+    def stats(self) -> dict:
+        """Waiter counts and coalescing rate."""
+        return {
+            "requests": self.requests,
+            "upstream_calls": self.upstream_calls,
+            "coalesced": self.coalesced,
+            "coalesce_rate": self.coalesced / self.requests if self.requests else 0.0,
+            "in_flight": len(self._calls),
+            "waiting": sum(self._waiters.values()),
+            "max_waiters": self.max_waiters,
+        }
+
+
+class CoalescingTTSAdapter(TTSAdapter):
+    """Wraps a TTS adapter so identical concurrent requests share one call."""
+
+    def __init__(self, adapter: TTSAdapter, flight: SingleFlight):
+        """Initialize coalescing adapter.
+
+        Args:
+            adapter: Adapter making the upstream call
+            flight: Group of in-flight calls, shared across adapters
+        """
+        self.adapter = adapter
+        self.flight = flight
+
+    async def synthesize(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> TTSResult:
+        """Synthesize, or wait for an identical request already in flight."""
+        start_time = time.perf_counter()
+        key = (text.strip(), language, voice, round(speed, 2), self.get_provider_name())
+        result = await self.flight.do(
+            key, lambda: self.adapter.synthesize(text, language, voice, speed)
+        )
+        # Each caller gets its own copy with the time it actually waited
+        return dataclasses.replace(
+            result, latency_ms=int((time.perf_counter() - start_time) * 1000)
+        )
+
+    def synthesize_stream(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        return self.adapter.synthesize_stream(text, language, voice, speed)
+
+    def get_provider_name(self) -> str:
+        return self.adapter.get_provider_name()
+
+
+_tts_single_flight: Optional[SingleFlight] = None
+
+
+def get_tts_single_flight() -> SingleFlight:
+    """Process-wide group of in-flight TTS calls."""
+    global _tts_single_flight
+    if _tts_single_flight is None:
+        _tts_single_flight = SingleFlight()
+    return _tts_single_flight
@@ -3,12 +3,13 @@
 Uses edge-tts for text-to-speech synthesis (free, fast, high quality).
 """
 
-import asyncio
-import io
 import time
+from collections.abc import AsyncIterator
 from typing import Literal, Optional
 
-from src.adapters.tts.base import TTSAdapter, TTSResult, TTSError
+from src.adapters.scheduler import get_provider_scheduler
+from src.adapters.tts.base import TTSAdapter, TTSResult, TTSError, estimate_duration_ms
+from src.adapters.tts.mp3 import mp3_duration_ms
 
 
 class GoogleTTSAdapter(TTSAdapter):
@@ -34,43 +35,60 @@ class GoogleTTSAdapter(TTSAdapter):
         speed: float = 1.0,
     ) -> TTSResult:
         """Synthesize speech using edge-tts."""
+        start_time = time.perf_counter()
+        
+        audio_data = b"".join(
+            [chunk async for chunk in self.synthesize_stream(text, language, voice, speed)]
+        )
+        
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        
+        return TTSResult(
+            audio=audio_data,
+            format="mp3",  # edge-tts outputs MP3
+            duration_ms=mp3_duration_ms(audio_data) or estimate_duration_ms(text) or 1000,
+            latency_ms=latency_ms,
+        )
+
+    async def synthesize_stream(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """Synthesize speech, yielding MP3 chunks as edge-tts receives them."""
         import edge_tts
         
-        start_time = time.perf_counter()
+        # Select voice
+        voice_name = voice or self.VOICES.get(language, self.VOICES["ru"])
         
+        # The connection is made when the stream is first read, so the
+        # scheduled call reads up to the first audio chunk; rate limits and
+        # retries then cover the request, not just building the generator
+        async def request():
+            stream = edge_tts.Communicate(text, voice_name).stream()
+            async for chunk in stream:
+                if chunk["type"] == "audio":
+                    return stream, chunk["data"]
+            return stream, None
+
+        stream = None
         try:
-            # Select voice
-            voice_name = voice or self.VOICES.get(language, self.VOICES["ru"])
-            
-            # Create communicate object
-            communicate = edge_tts.Communicate(text, voice_name)
-            
-            # Collect audio chunks
-            audio_chunks = []
-            async for chunk in communicate.stream():
+            stream, first_chunk = await get_provider_scheduler().run("edge", request)
+            if first_chunk is not None:
+                yield first_chunk
+            async for chunk in stream:
                 if chunk["type"] == "audio":
-                    audio_chunks.append(chunk["data"])
-            
-            audio_data = b"".join(audio_chunks)
-            
-            latency_ms = int((time.perf_counter() - start_time) * 1000)
-            
-            # Estimate duration (rough: ~150 words per minute)
-            word_count = len(text.split())
-            duration_ms = int((word_count / 150) * 60 * 1000) or 1000
-            
-            return TTSResult(
-                audio=audio_data,
-                format="mp3",  # edge-tts outputs MP3
-                duration_ms=duration_ms,
-                latency_ms=latency_ms,
-            )
-            
+                    yield chunk["data"]
         except Exception as e:
             raise TTSError(
                 message=str(e),
                 provider=self.PROVIDER_NAME,
             ) from e
+        finally:
+            if stream is not None:
+                await stream.aclose()
 
     def get_provider_name(self) -> str:
         return self.PROVIDER_NAME
@@ -0,0 +1,114 @@
+"""MP3 frame parsing for joining synthesized audio without re-encoding.
+
+MP3 is a sequence of self-contained frames, each with a 4-byte header
+giving its length and number of samples. Audio from several TTS calls is
+joined by concatenating their frames, dropping ID3 tags and the
+Xing/Info/VBRI header frame (its frame count would describe one part
+only). Duration is the sum of frame samples over the sample rate.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Optional
+
+# Bitrates in kbps by (MPEG-1?, layer)
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates by version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+_VBR_TAGS = (b"Xing", b"Info", b"VBRI")
+
+
+@dataclass
+class MP3Frame:
+    """Position and timing of one frame."""
+
+    offset: int
+    length: int
+    samples: int
+    sample_rate: int
+
+
+def parse_frame_header(header: bytes) -> Optional[tuple[int, int, int]]:
+    """Parse a 4-byte frame header.
+
+    Returns:
+        (frame length in bytes, samples, sample rate), or None if the
+        bytes are not a valid header
+    """
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = 4 - ((header[1] >> 1) & 0x03)
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    padding = (header[2] >> 1) & 0x01
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None  # reserved values or free format
+
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+    samples = 1152 if layer == 2 or mpeg1 else 576
+    return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate
+
+
+def _id3v2_size(data: bytes, offset: int) -> int:
+    """Size of an ID3v2 tag at offset (0 if there is none)."""
+    if data[offset:offset + 3] != b"ID3" or len(data) < offset + 10:
+        return 0
+    size = 0
+    for byte in data[offset + 6:offset + 10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if data[offset + 5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def iter_frames(data: bytes) -> Iterator[MP3Frame]:
+    """Yield complete audio frames, skipping tags, VBR header frames and junk."""
+    offset = _id3v2_size(data, 0)
+    first = True
+    while offset + 4 <= len(data):
+        parsed = parse_frame_header(data[offset:offset + 4])
+        if parsed is None:
+            tag_size = _id3v2_size(data, offset) or (128 if data[offset:offset + 3] == b"TAG" else 0)
+            offset += tag_size or 1  # skip a tag, or resync on the next frame header
+            continue
+        length, samples, sample_rate = parsed
+        if offset + length > len(data):
+            break  # truncated last frame
+        frame = MP3Frame(offset, length, samples, sample_rate)
+        if not (first and any(tag in data[offset + 4:offset + 40] for tag in _VBR_TAGS)):
+            yield frame
+        first = False
+        offset += length
+
+
+def mp3_frames(data: bytes) -> bytes:
+    """Audio frames of data only, or data unchanged if it has none."""
+    frames = [data[f.offset:f.offset + f.length] for f in iter_frames(data)]
+    return b"".join(frames) if frames else data
+
+
+def concat_mp3(parts: Iterable[bytes]) -> bytes:
+    """Join MP3 files at frame boundaries, without re-encoding."""
+    return b"".join(mp3_frames(part) for part in parts)
+
+
+def mp3_duration_ms(data: bytes) -> int:
+    """Playback duration from frame headers (0 if data has no MP3 frames)."""
+    return round(sum(f.samples * 1000 / f.sample_rate for f in iter_frames(data)))
@@ -1,10 +1,14 @@
 """OpenAI TTS Adapter implementation."""
 
 import time
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
 from typing import Literal, Optional
 
+import httpx
 from openai import AsyncOpenAI, APIError, APITimeoutError, RateLimitError
 
+from src.adapters.scheduler import get_provider_scheduler, retry_after_seconds
 from src.adapters.tts.base import (
     TTSAdapter,
     TTSResult,
@@ -12,7 +16,9 @@ from src.adapters.tts.base import (
     TTSTimeoutError,
     TTSTextTooLongError,
     TTSRateLimitError,
+    estimate_duration_ms,
 )
+from src.adapters.tts.mp3 import mp3_duration_ms
 from src.config import get_settings
 
 
@@ -24,20 +30,33 @@ class OpenAITTSAdapter(TTSAdapter):
 
     PROVIDER_NAME = "openai"
     MAX_TEXT_LENGTH = 4096
+    STREAM_CHUNK_BYTES = 4096
     
     # Available voices
     VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
     DEFAULT_VOICE = "nova"  # Good for Russian
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize OpenAI TTS adapter.
         
         Args:
             api_key: OpenAI API key. If not provided, uses settings.
+            http_client: Shared pooled HTTP client. If not provided, the
+                OpenAI SDK creates its own.
         """
         settings = get_settings()
-        self.client = AsyncOpenAI(api_key=api_key or settings.openai_api_key)
         self.timeout = 30.0
+        self.client = AsyncOpenAI(
+            api_key=api_key or settings.openai_api_key,
+            base_url=settings.openai_base_url or None,
+            timeout=self.timeout,
+            max_retries=0,  # 429s and transient errors are retried by the provider scheduler
+            http_client=http_client,
+        )
 
     async def synthesize(
         self,
@@ -58,67 +77,107 @@ class OpenAITTSAdapter(TTSAdapter):
             TTSResult with MP3 audio
         """
         start_time = time.perf_counter()
+        params = self._speech_params(text, voice, speed)
 
-        # Validate text length
-        if len(text) > self.MAX_TEXT_LENGTH:
-            raise TTSTextTooLongError(
-                message=f"Text exceeds maximum length of {self.MAX_TEXT_LENGTH} characters",
-                provider=self.PROVIDER_NAME,
-                details={"text_length": len(text), "max_length": self.MAX_TEXT_LENGTH},
-            )
-
-        # Select voice
-        selected_voice = voice if voice in self.VOICES else self.DEFAULT_VOICE
-
-        # Clamp speed to valid range
-        speed = max(0.25, min(4.0, speed))
+        async def request():
+            try:
+                return await self.client.audio.speech.create(**params)
+            except RateLimitError as e:
+                raise self._rate_limit_error(e) from e
 
         try:
-            response = await self.client.audio.speech.create(
-                model="tts-1",
-                voice=selected_voice,
-                input=text,
-                speed=speed,
-                response_format="mp3",
-            )
+            response = await get_provider_scheduler().run("openai", request)
 
             # Read audio content
             audio_content = response.content
 
             latency_ms = int((time.perf_counter() - start_time) * 1000)
 
-            # Estimate duration (rough estimate based on text length and speed)
-            # Average speaking rate: ~150 words per minute
-            word_count = len(text.split())
-            estimated_duration_ms = int((word_count / 150) * 60 * 1000 / speed)
-
             return TTSResult(
                 audio=audio_content,
                 format="mp3",
-                duration_ms=estimated_duration_ms,
+                duration_ms=(
+                    mp3_duration_ms(audio_content) or estimate_duration_ms(text, params["speed"])
+                ),
                 latency_ms=latency_ms,
             )
 
-        except APITimeoutError as e:
-            raise TTSTimeoutError(
-                message="Request timed out",
-                provider=self.PROVIDER_NAME,
-                details={"timeout": self.timeout},
-            ) from e
+        except (APITimeoutError, APIError) as e:
+            raise self._error(e) from e
 
-        except RateLimitError as e:
-            raise TTSRateLimitError(
-                message="Rate limit exceeded",
+    async def synthesize_stream(
+        self,
+        text: str,
+        language: Literal["ru", "kk"] = "ru",
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """Synthesize text, yielding MP3 chunks as OpenAI sends them."""
+        params = self._speech_params(text, voice, speed)
+
+        async with AsyncExitStack() as stack:
+            # The response is closed with the stack, also when the consumer stops early
+            async def request():
+                try:
+                    return await stack.enter_async_context(
+                        self.client.audio.speech.with_streaming_response.create(**params)
+                    )
+                except RateLimitError as e:
+                    raise self._rate_limit_error(e) from e
+
+            try:
+                response = await get_provider_scheduler().run("openai", request)
+            except (APITimeoutError, APIError) as e:
+                raise self._error(e) from e
+
+            try:
+                async for chunk in response.iter_bytes(self.STREAM_CHUNK_BYTES):
+                    yield chunk
+            except (APITimeoutError, APIError, httpx.HTTPError) as e:
+                raise TTSError(message=str(e), provider=self.PROVIDER_NAME) from e
+
+    def _speech_params(self, text: str, voice: Optional[str], speed: float) -> dict:
+        """Validate input and build speech API parameters."""
+        # Validate text length
+        if len(text) > self.MAX_TEXT_LENGTH:
+            raise TTSTextTooLongError(
+                message=f"Text exceeds maximum length of {self.MAX_TEXT_LENGTH} characters",
                 provider=self.PROVIDER_NAME,
-                details={"error": str(e)},
-            ) from e
+                details={"text_length": len(text), "max_length": self.MAX_TEXT_LENGTH},
+            )
 
-        except APIError as e:
-            raise TTSError(
-                message=str(e),
+        return {
+            "model": "tts-1",
+            # Select voice
+            "voice": voice if voice in self.VOICES else self.DEFAULT_VOICE,
+            "input": text,
+            # Clamp speed to valid range
+            "speed": max(0.25, min(4.0, speed)),
+            "response_format": "mp3",
+        }
+
+    def _rate_limit_error(self, e: RateLimitError) -> TTSRateLimitError:
+        return TTSRateLimitError(
+            message="Rate limit exceeded",
+            provider=self.PROVIDER_NAME,
+            details={
+                "error": str(e),
+                "retry_after": retry_after_seconds(e.response.headers),
+            },
+        )
+
+    def _error(self, e: APIError) -> TTSError:
+        if isinstance(e, APITimeoutError):
+            return TTSTimeoutError(
+                message="Request timed out",
                 provider=self.PROVIDER_NAME,
-                details={"status_code": getattr(e, "status_code", None)},
-            ) from e
+                details={"timeout": self.timeout},
+            )
+        return TTSError(
+            message=str(e),
+            provider=self.PROVIDER_NAME,
+            details={"status_code": getattr(e, "status_code", None)},
+        )
 
     def get_provider_name(self) -> str:
         """Get provider name."""
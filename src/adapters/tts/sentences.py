@@ -0,0 +1,71 @@
+"""Sentence splitting for chunked TTS synthesis."""
+
+import re
+
+# Sentence ends at . ! ? or … (optionally followed by closing quotes/brackets)
+_SENTENCE_END = re.compile(r"(?:(?<=[.!?…])|(?<=[.!?…][\"»)]))\s+")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences for independent synthesis.
+
+    Args:
+        text: Text to split (Russian or Kazakh)
+
+    Returns:
+        Non-empty sentences in original order
+    """
+    return [s.strip() for s in _SENTENCE_END.split(text.strip()) if s.strip()]
+
+
+def split_text(text: str, max_chars: int) -> list[str]:
+    """Split text into pieces of at most max_chars at sentence boundaries.
+
+    Consecutive sentences are packed into one piece while they fit. A
+    sentence longer than max_chars is split between words, and a word
+    longer than that is cut.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum piece length in characters
+
+    Returns:
+        Non-empty pieces in original order
+    """
+    pieces: list[str] = []
+    current = ""
+    for sentence in split_sentences(text):
+        for part in _split_long(sentence, max_chars):
+            if current and len(current) + 1 + len(part) <= max_chars:
+                current = f"{current} {part}"
+            else:
+                if current:
+                    pieces.append(current)
+                current = part
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _split_long(sentence: str, max_chars: int) -> list[str]:
+    """Split a sentence between words so every part fits max_chars."""
+    if len(sentence) <= max_chars:
+        return [sentence]
+    parts: list[str] = []
+    current = ""
+    for word in sentence.split():
+        while len(word) > max_chars:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(word[:max_chars])
+            word = word[max_chars:]
+        if current and len(current) + 1 + len(word) <= max_chars:
+            current = f"{current} {word}"
+        else:
+            if current:
+                parts.append(current)
+            current = word
+    if current:
+        parts.append(current)
+    return parts
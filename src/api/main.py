@@ -75,8 +75,39 @@ async def lifespan(app: FastAPI):
         
         await session.commit()
     
+    # Long-lived provider adapters with pooled keep-alive connections
+    from src.adapters.registry import get_adapter_registry
+    adapter_registry = get_adapter_registry()
+    adapter_registry.start()
+    
+    # LLM calls share one pooled client too
+    from src.services.llm import get_llm_service
+    llm_service = get_llm_service()
+    llm_service.start()
+    
+    # Background worker for deferred bookkeeping writes
+    from src.services.work_queue import get_work_queue
+    work_queue = get_work_queue()
+    work_queue.start()
+    
+    # Pre-synthesize canned replies without delaying startup
+    import asyncio
+    from src.services.tts_cache import warm_tts_phrase_cache
+    warm_task = None
+    if get_settings().tts_phrase_cache_enabled:
+        warm_task = asyncio.create_task(warm_tts_phrase_cache())
+    
     yield
     # Shutdown
+    if warm_task is not None:
+        warm_task.cancel()
+    from src.services.provider_replay import stop_background_replays
+    await stop_background_replays()
+    await work_queue.stop()
+    await adapter_registry.aclose()
+    await llm_service.aclose()
+    from src.cache import close_caches
+    await close_caches()
 
 
 def custom_openapi(app: FastAPI):
@@ -204,9 +235,16 @@ def create_app() -> FastAPI:
 
     # Audio file serving endpoint
     @app.get("/api/audio/{path:path}", tags=["system"])
-    async def serve_audio(path: str):
-        """Serve audio files from local storage."""
+    async def serve_audio(path: str, request: Request):
+        """Serve audio files from local storage.
+        
+        A client whose Accept header prefers Opus/OGG gets the OGG variant
+        stored next to the file, if one was produced when the response
+        was generated. Nothing is transcoded or written here.
+        """
         from fastapi.responses import Response
+        from src.audio_formats import FORMATS, detect_audio_format
+        from src.services.audio_delivery import negotiate_output_format, variant_key
         from src.services.storage import StorageService
         
         storage = StorageService()
@@ -218,14 +256,19 @@ def create_app() -> FastAPI:
                 content={"detail": "Audio file not found"},
             )
         
-        # Determine content type
-        content_type = "audio/mpeg" if path.endswith(".mp3") else "audio/wav"
+        # Content type from the audio itself, not the file extension
+        audio_format = detect_audio_format(audio_data)
+        if audio_format != "ogg" and negotiate_output_format(request.headers.get("accept")) == "ogg":
+            variant = storage.get_local_file(variant_key(path, "ogg"))
+            if variant is not None:
+                path, audio_data, audio_format = variant_key(path, "ogg"), variant, "ogg"
         
         return Response(
             content=audio_data,
-            media_type=content_type,
+            media_type=FORMATS.get(audio_format, "application/octet-stream"),
             headers={
                 "Content-Disposition": f"inline; filename={path.split('/')[-1]}",
+                "Vary": "Accept",
             },
         )
 
@@ -11,7 +11,11 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.adapters.routing import get_provider_router
+from src.adapters.scheduler import get_provider_scheduler
+from src.adapters.tts.coalescing import get_tts_single_flight
 from src.api.auth import get_current_admin
+from src.cache import get_cache_stats
 from src.api.schemas import (
     UserResponse,
     UserUpdate,
@@ -22,11 +26,16 @@ from src.api.schemas import (
     UnknownTermResponse,
     UnknownTermCreate,
     UnknownTermApprove,
+    ProviderReplayRequest,
+    ProviderReplayStatus,
 )
 from src.models.database import get_db
 from src.models.entities import User, Conversation, Turn
-from src.models.entities_ext import UnknownTerm, AuditLog
+from src.models.entities_ext import UnknownTerm, AuditLog, ProviderComparison
+from src.services.llm_cache import get_llm_response_cache
 from src.services.normalization import NormalizationService
+from src.services.provider_replay import get_background_replay, start_background_replay
+from src.services.tts_cache import get_tts_phrase_cache
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -379,6 +388,93 @@ async def get_analytics(
     return {"metrics": metrics, "top_unknown_terms": top_terms}
 
 
+@router.get("/cache-stats")
+async def get_cache_stats_endpoint(
+    current_admin: User = Depends(get_current_admin),
+):
+    """Get hit/miss counters of the result caches and TTS coalescing rates."""
+    return {
+        **get_cache_stats(),
+        "tts_phrases": get_tts_phrase_cache().stats(),
+        "tts_coalescing": get_tts_single_flight().stats(),
+        "llm_responses": get_llm_response_cache().stats(),
+    }
+
+
+@router.get("/provider-health")
+async def get_provider_health(
+    current_admin: User = Depends(get_current_admin),
+):
+    """Get rolling latency, error rate and circuit state per provider."""
+    return get_provider_router().stats()
+
+
+@router.get("/provider-scheduler")
+async def get_provider_scheduler_stats(
+    current_admin: User = Depends(get_current_admin),
+):
+    """Get queue times, 429 counts and token bucket state per provider."""
+    return get_provider_scheduler().stats()
+
+
+# Provider replay endpoints
+@router.post("/provider-replay", response_model=ProviderReplayStatus)
+async def start_provider_replay(
+    request: ProviderReplayRequest,
+    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Start an offline replay of stored turn audio through both STT providers.
+    
+    Runs in the background; starting an existing run_id resumes it from
+    its checkpoint.
+    
+    Validates: Requirements 9.4
+    """
+    run_id = request.run_id or str(uuid.uuid4())
+    start_background_replay(run_id, concurrency=request.concurrency, limit=request.limit)
+
+    await _log_action(
+        db, current_admin.id, "start_provider_replay", "provider_replay", None, {"run_id": run_id}
+    )
+
+    return await _get_replay_status(db, run_id)
+
+
+@router.get("/provider-replay/{run_id}", response_model=ProviderReplayStatus)
+async def get_provider_replay(
+    run_id: str,
+    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get progress of a provider replay run.
+    
+    Validates: Requirements 9.4
+    """
+    return await _get_replay_status(db, run_id)
+
+
+async def _get_replay_status(db: AsyncSession, run_id: str) -> ProviderReplayStatus:
+    result = await db.execute(
+        select(func.count(ProviderComparison.id)).where(ProviderComparison.run_id == run_id)
+    )
+    status_response = ProviderReplayStatus(
+        run_id=run_id,
+        running=False,
+        compared_turns=result.scalar() or 0,
+    )
+
+    background = get_background_replay(run_id)
+    if background:
+        task, summary = background
+        status_response.running = not task.done()
+        status_response.failed = summary.failed
+        status_response.missing_audio = summary.missing_audio
+        if task.done() and not task.cancelled() and task.exception():
+            status_response.error = str(task.exception())
+    return status_response
+
+
 async def _log_action(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -389,6 +485,9 @@ async def _log_action(
 ):
     """Log admin action to audit log.
     
+    Written in the request's transaction, not through the work queue:
+    audit entries must not be lost on a crash or a full queue.
+    
     Validates: Requirements 10.4
     """
     log = AuditLog(
@@ -3,13 +3,29 @@
 Validates: Requirements 11.1, 11.2, 11.3, 11.4, 11.5
 """
 
+import json
+import logging
+import os
+import time
 import uuid
 from typing import Annotated, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.auth import get_current_user, get_optional_user
+from src.api.auth import decode_token, get_current_user, get_optional_user
 from src.api.schemas import (
     SessionCreateRequest,
     SessionResponse,
@@ -22,25 +38,68 @@ from src.api.schemas import (
     TextProcessRequest,
     TextProcessResponse,
 )
-from src.models.database import get_db
-from src.models.entities import User
+from src.models.database import async_session_maker, get_db
+from src.models.entities import Turn, User
+from src.services.entity_context import EntityContext
 from src.services.voice_session import VoiceSessionService
 from src.services.llm import get_llm_service
 
 router = APIRouter(prefix="/api/voice", tags=["voice"])
 
+# Audio limits
+MAX_AUDIO_BYTES = 10 * 1024 * 1024
+MIN_AUDIO_BYTES = 500
+STREAM_AUDIO_FRAME_BYTES = 16 * 1024
+
+
+async def get_entity_context(
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user),
+) -> EntityContext:
+    """Request-scoped entity context, seeded with the authenticated user."""
+    context = EntityContext(db)
+    context.add(current_user)
+    return context
+
+
+async def _read_audio_upload(audio: UploadFile) -> bytes:
+    """Read uploaded audio, rejecting oversized uploads before reading them.
+    
+    The multipart parser has already spooled the upload to a temporary
+    file, so its size is checked there and the audio is read into memory
+    once, as the single buffer storage and STT share.
+    """
+    size = audio.size
+    if size is None:
+        # Size not reported by the parser: measure the spooled file
+        size = audio.file.seek(0, os.SEEK_END)
+        audio.file.seek(0)
+
+    if size > MAX_AUDIO_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Audio too large. Maximum: {MAX_AUDIO_BYTES} bytes",
+        )
+    if size < MIN_AUDIO_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Audio too short.",
+        )
+    return await audio.read()
+
 
 @router.post("/session", response_model=SessionResponse)
 async def create_session(
     request: SessionCreateRequest,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
 ):
     """Create a new voice session.
     
     Validates: Requirements 11.1
     """
-    service = VoiceSessionService(db)
+    service = VoiceSessionService(db, context)
     
     # Use demo user if not authenticated
     user_id = current_user.id if current_user else "00000000-0000-0000-0000-000000000001"
@@ -58,6 +117,7 @@ async def upload_and_transcribe(
     audio: Annotated[UploadFile, File(description="Audio file (WAV, MP3)")],
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
 ):
     """Upload audio and get transcription.
     
@@ -71,19 +131,12 @@ async def upload_and_transcribe(
             detail=f"Invalid audio format. Allowed: {allowed_types}",
         )
 
-    # Read audio content
-    audio_content = await audio.read()
-    
-    if len(audio_content) < 500:  # Reduced minimum
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Audio too short.",
-        )
+    audio_content = await _read_audio_upload(audio)
 
     # Use demo user if not authenticated
     user_id = current_user.id if current_user else "00000000-0000-0000-0000-000000000001"
 
-    service = VoiceSessionService(db)
+    service = VoiceSessionService(db, context)
     
     try:
         result = await service.process_audio(
@@ -102,6 +155,7 @@ async def upload_and_transcribe(
         normalized_transcript=result.normalized_transcript,
         confidence=result.confidence,
         stt_latency_ms=result.stt_latency_ms,
+        stage_timings_ms=result.stage_timings_ms,
     )
 
 
@@ -116,7 +170,11 @@ async def transcribe(
     
     Validates: Requirements 11.3
     """
-    return await upload_and_transcribe(session_id, audio, current_user, db)
+    context = EntityContext(db)
+    context.add(current_user)
+    return await upload_and_transcribe(
+        session_id, audio, db=db, current_user=current_user, context=context
+    )
 
 
 @router.post("/confirm/{session_id}", response_model=ConfirmResponse)
@@ -125,12 +183,13 @@ async def confirm_transcript(
     request: ConfirmRequest,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
 ):
     """Confirm or correct transcript.
     
     Validates: Requirements 11.5
     """
-    service = VoiceSessionService(db)
+    service = VoiceSessionService(db, context)
     
     try:
         await service.confirm_transcript(
@@ -151,18 +210,24 @@ async def generate_response(
     request: RespondRequest,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
+    accept: Annotated[Optional[str], Header()] = None,
 ):
     """Generate TTS response.
     
+    The audio format (Opus/OGG or MP3) is negotiated from the Accept
+    header, falling back to the session's device_info.
+    
     Validates: Requirements 11.4
     """
-    service = VoiceSessionService(db)
+    service = VoiceSessionService(db, context)
     
     try:
         result = await service.generate_response(
             session_id=session_id,
             turn_id=request.turn_id,
             assistant_text=request.assistant_text,
+            accept=accept,
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -174,14 +239,49 @@ async def generate_response(
     )
 
 
+@router.post("/respond/{session_id}/stream")
+async def generate_response_stream(
+    session_id: uuid.UUID,
+    request: RespondRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
+):
+    """Generate TTS response as streamed MP3.
+
+    Same as /respond, but audio chunks are forwarded as the TTS provider
+    produces them. The full audio is stored on the turn once the stream
+    ends.
+    """
+    service = VoiceSessionService(db, context)
+
+    try:
+        audio_stream = await service.stream_response(
+            session_id=str(session_id),
+            turn_id=str(request.turn_id),
+            assistant_text=request.assistant_text,
+        )
+        # Final audio is stored from another session after the stream
+        await db.commit()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return StreamingResponse(
+        audio_stream,
+        media_type="audio/mpeg",
+        headers={"X-Turn-Id": str(request.turn_id)},
+    )
+
+
 @router.post("/end/{session_id}")
 async def end_session(
     session_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
 ):
     """End voice session."""
-    service = VoiceSessionService(db)
+    service = VoiceSessionService(db, context)
     await service.end_session(session_id)
     return {"success": True}
 
@@ -192,6 +292,8 @@ async def process_text_pipeline(
     request: TextProcessRequest,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
+    accept: Annotated[Optional[str], Header()] = None,
 ):
     """Text pipeline: LLM -> TTS (using browser STT).
     
@@ -216,7 +318,7 @@ async def process_text_pipeline(
     # Use demo user if not authenticated
     user_id = current_user.id if current_user else "00000000-0000-0000-0000-000000000001"
     
-    service = VoiceSessionService(db)
+    service = VoiceSessionService(db, context)
     llm_service = get_llm_service()
     
     try:
@@ -241,6 +343,7 @@ async def process_text_pipeline(
             session_id=str(session_id),
             turn_id=turn_id,
             assistant_text=assistant_text,
+            accept=accept,
         )
         logger.info(f"TTS done, audio_url: {tts_result.audio_url}")
         
@@ -260,12 +363,79 @@ async def process_text_pipeline(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.post("/process-text/{session_id}/stream")
+async def process_text_pipeline_stream(
+    session_id: uuid.UUID,
+    request: TextProcessRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
+):
+    """Text pipeline with streamed audio: LLM -> sentence-chunked TTS.
+    
+    Same as /process-text, but the response body is the MP3 audio itself,
+    sent with chunked transfer encoding sentence by sentence. The turn ID
+    and URL-encoded assistant text are returned in the X-Turn-Id and
+    X-Assistant-Text headers.
+    """
+    logger = logging.getLogger(__name__)
+
+    user_text = request.text.strip()
+    if not user_text:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Text cannot be empty",
+        )
+
+    # Use demo user if not authenticated
+    user_id = current_user.id if current_user else "00000000-0000-0000-0000-000000000001"
+
+    service = VoiceSessionService(db, context)
+    llm_service = get_llm_service()
+
+    try:
+        turn_id = await service.create_turn_from_text(
+            session_id=str(session_id),
+            user_id=user_id,
+            text=user_text,
+        )
+        assistant_text = await llm_service.generate_response(
+            user_message=user_text,
+            language=request.language,
+        )
+        audio_stream = await service.stream_response(
+            session_id=str(session_id),
+            turn_id=turn_id,
+            assistant_text=assistant_text,
+        )
+        # Turn must be visible to the session that stores the final audio
+        await db.commit()
+
+    except ValueError as e:
+        logger.error(f"ValueError: {e}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error(f"Pipeline error: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    return StreamingResponse(
+        audio_stream,
+        media_type="audio/mpeg",
+        headers={
+            "X-Turn-Id": turn_id,
+            "X-Assistant-Text": quote(assistant_text),
+        },
+    )
+
+
 @router.post("/process/{session_id}", response_model=FullPipelineResponse)
 async def process_full_pipeline(
     session_id: uuid.UUID,
     audio: Annotated[UploadFile, File(description="Audio file (WAV, MP3)")],
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
+    context: EntityContext = Depends(get_entity_context),
+    accept: Annotated[Optional[str], Header()] = None,
 ):
     """Full voice pipeline: STT -> LLM -> TTS.
     
@@ -287,20 +457,13 @@ async def process_full_pipeline(
             detail=f"Invalid audio format. Allowed: {allowed_types}",
         )
 
-    # Read audio content
-    audio_content = await audio.read()
+    audio_content = await _read_audio_upload(audio)
     logger.info(f"Received audio: {len(audio_content)} bytes")
-    
-    if len(audio_content) < 500:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Audio too short.",
-        )
 
     # Use demo user if not authenticated
     user_id = current_user.id if current_user else "00000000-0000-0000-0000-000000000001"
 
-    service = VoiceSessionService(db)
+    service = VoiceSessionService(db, context)
     llm_service = get_llm_service()
     
     try:
@@ -312,6 +475,7 @@ async def process_full_pipeline(
             user_id=user_id,
         )
         logger.info(f"STT result: {stt_result.normalized_transcript}")
+        logger.info(f"STT stage timings: {stt_result.stage_timings_ms}")
         
         # Get user language for LLM
         user = await service.get_user(user_id)
@@ -331,6 +495,7 @@ async def process_full_pipeline(
             session_id=str(session_id),
             turn_id=stt_result.turn_id,
             assistant_text=assistant_text,
+            accept=accept,
         )
         logger.info(f"TTS done, audio_url: {tts_result.audio_url}")
         
@@ -343,6 +508,7 @@ async def process_full_pipeline(
             assistant_text=tts_result.assistant_text,
             audio_url=tts_result.audio_url,
             tts_latency_ms=tts_result.tts_latency_ms,
+            stage_timings_ms=stt_result.stage_timings_ms,
         )
         
     except ValueError as e:
@@ -351,3 +517,261 @@ async def process_full_pipeline(
     except Exception as e:
         logger.error(f"Pipeline error: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.post("/process/{session_id}/events")
+async def process_full_pipeline_events(
+    session_id: uuid.UUID,
+    audio: Annotated[UploadFile, File(description="Audio file (WAV, MP3)")],
+    current_user: Optional[User] = Depends(get_optional_user),
+):
+    """Full voice pipeline with progress as Server-Sent Events.
+    
+    Same as /process, but sends each result as soon as its stage is done:
+    - event "transcript": STT result with per-stage timings
+    - event "assistant_delta": LLM response text as the model produces it
+    - event "assistant_text": full LLM response with llm_ms
+    - event "audio_url": stored TTS audio with tts_ms and total_ms
+    - event "error": pipeline failed, stream ends
+    """
+    allowed_types = ["audio/wav", "audio/mpeg", "audio/mp3", "audio/webm", "audio/ogg"]
+    if audio.content_type and audio.content_type not in allowed_types:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid audio format. Allowed: {allowed_types}",
+        )
+
+    audio_content = await _read_audio_upload(audio)
+
+    # Use demo user if not authenticated
+    user_id = current_user.id if current_user else "00000000-0000-0000-0000-000000000001"
+
+    return StreamingResponse(
+        _pipeline_events(str(session_id), user_id, audio_content),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _pipeline_events(session_id: str, user_id: str, audio_content: bytes):
+    """Run one utterance through the pipeline, yielding SSE events as stages finish."""
+    logger = logging.getLogger(__name__)
+    llm_service = get_llm_service()
+    started = time.perf_counter()
+
+    # The request session is gone once streaming starts, so use our own
+    async with async_session_maker() as db:
+        service = VoiceSessionService(db)
+        try:
+            stt_result = await service.process_audio(
+                session_id=session_id,
+                audio=audio_content,
+                user_id=user_id,
+            )
+            yield _sse_event("transcript", {
+                "turn_id": stt_result.turn_id,
+                "raw_transcript": stt_result.raw_transcript,
+                "normalized_transcript": stt_result.normalized_transcript,
+                "confidence": stt_result.confidence,
+                "stt_latency_ms": stt_result.stt_latency_ms,
+                "stage_timings_ms": stt_result.stage_timings_ms,
+            })
+
+            user = await service.get_user(user_id)
+            language = user.language if user else "ru"
+
+            llm_started = time.perf_counter()
+            deltas: list[str] = []
+            async for delta in llm_service.generate_response_stream(
+                user_message=stt_result.normalized_transcript,
+                language=language,
+            ):
+                deltas.append(delta)
+                yield _sse_event("assistant_delta", {
+                    "turn_id": stt_result.turn_id,
+                    "text": delta,
+                })
+            assistant_text = "".join(deltas)
+            yield _sse_event("assistant_text", {
+                "turn_id": stt_result.turn_id,
+                "text": assistant_text,
+                "stage_timings_ms": {"llm": int((time.perf_counter() - llm_started) * 1000)},
+            })
+
+            tts_started = time.perf_counter()
+            tts_result = await service.generate_response(
+                session_id=session_id,
+                turn_id=stt_result.turn_id,
+                assistant_text=assistant_text,
+            )
+            await db.commit()
+            yield _sse_event("audio_url", {
+                "turn_id": stt_result.turn_id,
+                "audio_url": tts_result.audio_url,
+                "format": tts_result.audio_format,
+                "tts_latency_ms": tts_result.tts_latency_ms,
+                "stage_timings_ms": {
+                    "tts": int((time.perf_counter() - tts_started) * 1000),
+                    "total": int((time.perf_counter() - started) * 1000),
+                },
+            })
+
+        except Exception as e:
+            logger.error(f"Pipeline events error: {e}")
+            await db.rollback()
+            yield _sse_event("error", {"detail": str(e)})
+
+
+@router.websocket("/stream/{session_id}")
+async def stream_pipeline(
+    websocket: WebSocket,
+    session_id: uuid.UUID,
+    token: Optional[str] = None,
+):
+    """Streaming voice pipeline over WebSocket: STT -> LLM -> TTS.
+    
+    Protocol:
+    - Client sends binary frames with audio chunks while the user is speaking
+    - Client sends {"type": "end"} to finish the utterance and start processing
+    - An utterance over MAX_AUDIO_BYTES gets one {"type": "error"}; the rest
+      of its frames are dropped up to its "end" and it is not processed
+    - Server replies with {"type": "transcript"}, then {"type": "assistant_text"},
+      then binary MP3 frames sent sentence by sentence as TTS produces them,
+      followed by {"type": "audio_end"}
+    - Client sends {"type": "close"} (or disconnects) to end the stream
+    
+    Each utterance is stored as a regular Turn, same as /process.
+    """
+    logger = logging.getLogger(__name__)
+
+    # Browsers cannot set Authorization headers on WebSocket, so the JWT
+    # comes as a query parameter. Use demo user if not authenticated.
+    user_id = "00000000-0000-0000-0000-000000000001"
+    if token:
+        try:
+            user_id = decode_token(token).user_id
+        except HTTPException:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+    await websocket.accept()
+    buffer = bytearray()
+    overflowed = False  # current utterance exceeded the limit; drop it
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            chunk = message.get("bytes")
+            if chunk is not None:
+                if overflowed:
+                    continue
+                if len(buffer) + len(chunk) > MAX_AUDIO_BYTES:
+                    buffer.clear()
+                    overflowed = True
+                    await websocket.send_json({"type": "error", "detail": "Audio too long."})
+                    continue
+                buffer.extend(chunk)
+                continue
+
+            try:
+                event = json.loads(message.get("text") or "{}")
+            except json.JSONDecodeError:
+                await websocket.send_json({"type": "error", "detail": "Invalid message."})
+                continue
+
+            if event.get("type") == "end":
+                audio_content = bytes(buffer)
+                buffer.clear()
+                if overflowed:
+                    overflowed = False  # next utterance starts clean
+                    continue
+                if len(audio_content) < MIN_AUDIO_BYTES:
+                    await websocket.send_json({"type": "error", "detail": "Audio too short."})
+                    continue
+                await _stream_turn(websocket, str(session_id), user_id, audio_content)
+            elif event.get("type") == "close":
+                await websocket.close()
+                break
+
+    except WebSocketDisconnect:
+        logger.info(f"Stream {session_id} disconnected")
+
+
+async def _stream_turn(
+    websocket: WebSocket,
+    session_id: str,
+    user_id: str,
+    audio_content: bytes,
+) -> None:
+    """Run one utterance through the pipeline, pushing events as stages finish."""
+    logger = logging.getLogger(__name__)
+    llm_service = get_llm_service()
+
+    # One DB session per turn so each turn is committed as soon as it is done
+    async with async_session_maker() as db:
+        service = VoiceSessionService(db)
+        try:
+            stt_result = await service.process_audio(
+                session_id=session_id,
+                audio=audio_content,
+                user_id=user_id,
+            )
+            await websocket.send_json({
+                "type": "transcript",
+                "turn_id": stt_result.turn_id,
+                "raw_transcript": stt_result.raw_transcript,
+                "normalized_transcript": stt_result.normalized_transcript,
+                "confidence": stt_result.confidence,
+                "stt_latency_ms": stt_result.stt_latency_ms,
+                "stage_timings_ms": stt_result.stage_timings_ms,
+            })
+
+            user = await service.get_user(user_id)
+            language = user.language if user else "ru"
+
+            assistant_text = await llm_service.generate_response(
+                user_message=stt_result.normalized_transcript,
+                language=language,
+            )
+            await websocket.send_json({"type": "assistant_text", "text": assistant_text})
+
+            audio_stream = await service.stream_response(
+                session_id=session_id,
+                turn_id=stt_result.turn_id,
+                assistant_text=assistant_text,
+            )
+            # Final audio is stored from another session after the stream
+            await db.commit()
+
+            # Audio goes out as each sentence is synthesized
+            async for audio in audio_stream:
+                for offset in range(0, len(audio), STREAM_AUDIO_FRAME_BYTES):
+                    await websocket.send_bytes(audio[offset:offset + STREAM_AUDIO_FRAME_BYTES])
+
+            turn = await db.get(Turn, stt_result.turn_id, populate_existing=True)
+            await websocket.send_json({
+                "type": "audio_end",
+                "turn_id": stt_result.turn_id,
+                "format": "mp3",
+                "audio_url": service.storage.generate_signed_url(turn.audio_output_url),
+                "tts_latency_ms": turn.tts_latency_ms,
+            })
+
+        except WebSocketDisconnect:
+            await db.rollback()
+            raise
+        except ValueError as e:
+            await db.rollback()
+            await websocket.send_json({"type": "error", "detail": str(e)})
+        except Exception as e:
+            logger.error(f"Stream pipeline error: {e}")
+            await db.rollback()
+            await websocket.send_json({"type": "error", "detail": str(e)})
@@ -75,6 +75,7 @@ class TranscribeResponse(BaseModel):
     normalized_transcript: str
     confidence: float
     stt_latency_ms: int
+    stage_timings_ms: dict[str, int] = Field(default_factory=dict)
 
 
 class ConfirmRequest(BaseModel):
@@ -112,6 +113,7 @@ class FullPipelineResponse(BaseModel):
     assistant_text: str
     audio_url: str
     tts_latency_ms: int
+    stage_timings_ms: dict[str, int] = Field(default_factory=dict)
 
 
 class TextProcessRequest(BaseModel):
@@ -167,11 +169,13 @@ class TurnResponse(BaseModel):
     normalized_transcript: Optional[str]
     transcript_confidence: Optional[float]
     stt_latency_ms: Optional[int]
+    stt_provider_used: Optional[str] = None
     user_confirmed: Optional[bool]
     user_correction: Optional[str]
     assistant_text: Optional[str]
     audio_output_url: Optional[str]
     tts_latency_ms: Optional[int]
+    tts_provider_used: Optional[str] = None
     low_confidence: bool
 
     class Config:
@@ -223,6 +227,24 @@ class UnknownTermApprove(BaseModel):
     correct_form: str = Field(..., min_length=1, max_length=255)
 
 
+# Provider replay schemas
+class ProviderReplayRequest(BaseModel):
+    """Start provider replay run request."""
+    run_id: Optional[str] = Field(None, max_length=64)
+    concurrency: int = Field(8, ge=1, le=64)
+    limit: Optional[int] = Field(None, ge=1)
+
+
+class ProviderReplayStatus(BaseModel):
+    """Provider replay run status."""
+    run_id: str
+    running: bool
+    compared_turns: int
+    failed: int = 0
+    missing_audio: int = 0
+    error: Optional[str] = None
+
+
 # Error schemas
 class ErrorResponse(BaseModel):
     """API error response."""
@@ -0,0 +1,150 @@
+"""Audio container formats shared by adapters and services.
+
+Format detection from magic bytes, MIME types, PCM WAV decoding and
+encoding, and the compressed formats through ``soundfile`` (its bundled
+libsndfile reads OGG, MP3 and FLAC and writes Opus; it cannot read WebM).
+"""
+
+import io
+import wave
+from typing import Optional
+
+import numpy as np
+import soundfile
+
+# Sample rates the Opus encoder accepts
+OPUS_SAMPLE_RATES = (48000, 24000, 16000, 12000, 8000)
+
+# libsndfile maps compression level 0..1 linearly to 256..6 kbps
+_OPUS_MAX_BITRATE = 256_000
+_OPUS_MIN_BITRATE = 6_000
+
+FORMATS = {
+    "wav": "audio/wav",
+    "ogg": "audio/ogg",
+    "webm": "audio/webm",
+    "mp3": "audio/mpeg",
+    "mp4": "audio/mp4",
+    "flac": "audio/flac",
+}
+
+
+def detect_audio_format(audio: bytes) -> str:
+    """Detect container format from magic bytes ("wav", "ogg", ...), "wav" if unknown."""
+    if audio[:4] == b"RIFF" and audio[8:12] == b"WAVE":
+        return "wav"
+    if audio[:4] == b"OggS":
+        return "ogg"
+    if audio[:4] == b"\x1aE\xdf\xa3":
+        return "webm"
+    if audio[:4] == b"fLaC":
+        return "flac"
+    if audio[4:8] == b"ftyp":
+        return "mp4"
+    if audio[:3] == b"ID3" or (len(audio) > 1 and audio[0] == 0xFF and audio[1] & 0xE0 == 0xE0):
+        return "mp3"
+    return "wav"
+
+
+# Containers libsndfile can decode
+DECODABLE_FORMATS = ("ogg", "mp3", "flac")
+
+
+def opus_available() -> bool:
+    """Whether the libsndfile in use was built with the Opus encoder."""
+    return "OPUS" in soundfile.available_subtypes("OGG")
+
+
+def decode_compressed(audio: bytes) -> Optional[tuple[np.ndarray, int]]:
+    """Decode OGG (Opus/Vorbis), MP3 or FLAC into float32 samples in [-1, 1].
+
+    Returns:
+        (samples of shape (frames, channels), sample_rate), or None for
+        other formats (WebM) and undecodable input
+    """
+    if detect_audio_format(audio) not in DECODABLE_FORMATS:
+        return None
+    try:
+        samples, sample_rate = soundfile.read(io.BytesIO(audio), dtype="float32", always_2d=True)
+    except (RuntimeError, ValueError, TypeError):
+        return None
+    return samples, sample_rate
+
+
+def encode_opus(samples: np.ndarray, sample_rate: int, bitrate: int) -> Optional[bytes]:
+    """Encode samples to mono Opus/OGG, or None if they cannot be encoded.
+
+    Args:
+        samples: Float samples, shape (n,) or (n, channels)
+        sample_rate: Sample rate of samples; resampled down to an Opus rate
+        bitrate: Target bitrate in bits per second
+    """
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+    if len(samples) == 0:
+        return None
+
+    opus_rate = next((rate for rate in OPUS_SAMPLE_RATES if rate <= sample_rate), None)
+    if opus_rate is None:
+        return None
+    if opus_rate != sample_rate:
+        n_out = int(len(samples) * opus_rate / sample_rate)
+        positions = np.arange(n_out) * (sample_rate / opus_rate)
+        samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+    bitrate = min(max(bitrate, _OPUS_MIN_BITRATE), _OPUS_MAX_BITRATE)
+    compression_level = 1 - (bitrate - _OPUS_MIN_BITRATE) / (_OPUS_MAX_BITRATE - _OPUS_MIN_BITRATE)
+    buffer = io.BytesIO()
+    try:
+        soundfile.write(
+            buffer,
+            samples,
+            opus_rate,
+            format="OGG",
+            subtype="OPUS",
+            compression_level=compression_level,
+        )
+    except (RuntimeError, ValueError, TypeError):
+        return None  # libsndfile built without Opus
+    return buffer.getvalue()
+
+
+def decode_wav(audio: bytes) -> Optional[tuple[np.ndarray, int]]:
+    """Decode PCM WAV into float32 samples in [-1, 1], shape (frames, channels)."""
+    try:
+        with wave.open(io.BytesIO(audio), "rb") as wav:
+            channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            sample_rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    if sample_width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 2**15
+    elif sample_width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        ints = np.where(ints >= 2**23, ints - 2**24, ints)
+        samples = ints.astype(np.float32) / 2**23
+    elif sample_width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2**31
+    else:
+        return None
+
+    n_frames = len(samples) // channels
+    return samples[: n_frames * channels].reshape(n_frames, channels), sample_rate
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """Encode mono float samples as 16-bit PCM WAV."""
+    pcm = (np.clip(samples, -1.0, 1.0) * (2**15 - 1)).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
@@ -0,0 +1,165 @@
+"""Two-tier result caches: in-process LRU with optional Redis behind it.
+
+Values are bytes; callers serialize. The memory tier is bounded by total
+value size and evicts least recently used entries. The Redis tier (on
+``redis_url``) is shared between workers and survives restarts; Redis
+errors are logged and treated as misses so a cache outage never fails a
+request.
+
+Every cache registers itself by name, and ``get_cache_stats()`` reports
+hit/miss counters of all of them.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """In-process LRU cache bounded by the total size of its values."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: OrderedDict[str, tuple[bytes, Optional[float]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get value and mark it recently used, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """Store value, evicting least recently used entries to stay in budget."""
+        if len(value) > self.max_bytes:
+            return
+        self.delete(key)
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (value, expires_at)
+        self.size_bytes += len(value)
+        while self.size_bytes > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted)
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= len(entry[0])
+
+
+class TieredCache:
+    """Memory LRU in front of an optional Redis tier, with hit/miss counters."""
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        default_ttl_seconds: Optional[int] = None,
+        redis_url: Optional[str] = None,
+    ):
+        """Initialize cache and register it under name.
+
+        Args:
+            name: Cache name, also used as Redis key prefix
+            max_bytes: Memory tier budget
+            default_ttl_seconds: TTL when set() gets none (None = no expiry)
+            redis_url: Enables the Redis tier when given
+        """
+        self.name = name
+        self.default_ttl_seconds = default_ttl_seconds
+        self.memory = LRUCache(max_bytes)
+        self.redis = None
+        if redis_url:
+            try:
+                import redis.asyncio as redis
+                self.redis = redis.from_url(redis_url)
+            except ImportError:
+                logger.warning(f"Cache {name}: redis package missing, memory tier only")
+
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+        _caches[name] = self
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get value from memory, then Redis (promoting it to memory)."""
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+
+        if self.redis is not None:
+            try:
+                redis_key = self._redis_key(key)
+                value = await self.redis.get(redis_key)
+                if value is not None:
+                    ttl = await self.redis.ttl(redis_key)
+                    self.memory.set(key, value, ttl if ttl > 0 else None)
+                    self.redis_hits += 1
+                    return value
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Cache {self.name}: Redis get failed: {e}")
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        """Store value in both tiers."""
+        ttl_seconds = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
+        self.memory.set(key, value, ttl_seconds)
+        if self.redis is not None:
+            try:
+                await self.redis.set(self._redis_key(key), value, ex=ttl_seconds or None)
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Cache {self.name}: Redis set failed: {e}")
+
+    def stats(self) -> dict:
+        """Hit/miss counters and memory usage."""
+        lookups = self.memory_hits + self.redis_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.redis_hits) / lookups if lookups else 0.0,
+            "redis_errors": self.redis_errors,
+            "entries": len(self.memory),
+            "size_bytes": self.memory.size_bytes,
+        }
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        if self.redis is not None:
+            await self.redis.aclose()
+
+
+_caches: dict[str, TieredCache] = {}
+
+
+def get_cache_stats() -> dict[str, dict]:
+    """Counters of all caches created in this process, by name."""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+async def close_caches() -> None:
+    """Close Redis connections of all caches (application shutdown)."""
+    for cache in _caches.values():
+        await cache.aclose()
@@ -29,8 +29,9 @@ class Settings(BaseSettings):
     s3_bucket_name: str = "voice-assistant"
     s3_url_expiration_seconds: int = 3600
 
-    # OpenAI
+    # OpenAI (empty base URL = SDK default; set to point at the provider emulator)
     openai_api_key: str = ""
+    openai_base_url: str = ""
 
     # Google Cloud
     google_application_credentials: str = ""
@@ -48,6 +49,94 @@ class Settings(BaseSettings):
 
     # Groq (fastest LLM inference - free tier)
     groq_api_key: str = ""
+    groq_base_url: str = "https://api.groq.com/openai/v1"
+
+    # Provider HTTP connection pools (shared, keep-alive)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = True
+
+    # Deferred bookkeeping writes (in-process work queue)
+    work_queue_max_size: int = 1000
+    work_queue_batch_size: int = 50
+
+    # Audio preprocessing before STT (WAV only: downmix, resample, VAD trim)
+    audio_preprocessing_enabled: bool = True
+    audio_target_sample_rate: int = 16000
+    audio_vad_threshold_db: float = -45.0
+    audio_vad_padding_ms: int = 200
+
+    # Hedged STT (secondary provider raced after the primary's p95 latency);
+    # when enabled it replaces health routing for STT
+    stt_hedging_enabled: bool = False
+    stt_hedge_max_rate: float = 0.1
+    stt_hedge_default_delay_ms: int = 3000
+    stt_hedge_min_delay_ms: int = 300
+
+    # STT result cache (audio hash + provider/language/hints); Redis tier uses redis_url
+    stt_cache_enabled: bool = True
+    stt_cache_max_bytes: int = 16 * 1024 * 1024
+    stt_cache_ttl_seconds: int = 24 * 3600
+    stt_cache_redis_enabled: bool = False
+
+    # LLM response cache (normalized utterance + language + prompt); TTL by intent
+    llm_cache_enabled: bool = True
+    llm_cache_max_bytes: int = 4 * 1024 * 1024
+    llm_cache_redis_enabled: bool = False
+    llm_cache_ttl_seconds: dict[str, int] = {
+        "greeting": 24 * 3600,
+        "thanks": 24 * 3600,
+        "smalltalk": 24 * 3600,
+        "weather": 1800,
+        "other": 3600,
+    }
+    llm_cache_never_cache: list[str] = ["time", "medication", "emergency"]
+
+    # Upload encoding for STT (WAV -> Opus/OGG at this bitrate, 0 = upload as is)
+    stt_upload_opus_bitrate: int = 24000
+
+    # Chunked STT for long recordings (WAV split at silences, segments in parallel)
+    stt_chunking_enabled: bool = True
+    stt_chunk_max_seconds: float = 30.0
+    stt_chunk_overlap_seconds: float = 1.0
+    stt_chunk_concurrency: int = 4
+
+    # Provider routing (rolling health windows + circuit breakers)
+    provider_routing_enabled: bool = True
+    provider_health_window: int = 50
+    provider_health_min_calls: int = 10
+    provider_error_rate_threshold: float = 0.5
+    provider_latency_threshold_ms: int = 10000
+    provider_circuit_cooldown_seconds: float = 30.0
+
+    # Pre-synthesized TTS phrases (canned replies warmed at startup, frequent answers learned)
+    tts_phrase_cache_enabled: bool = True
+    tts_phrase_cache_max_entries: int = 500
+    tts_phrase_cache_learn_threshold: int = 3
+    tts_phrase_cache_warm_providers: list[str] = ["openai", "google"]
+
+    # Chunked TTS for long texts (split at sentences, pieces in parallel, MP3 joined by frames)
+    tts_chunking_enabled: bool = True
+    tts_chunk_max_chars: int = 500
+    tts_chunk_concurrency: int = 4
+
+    # TTS delivery format (Opus/OGG at this bitrate for clients accepting it, 0 = MP3 only)
+    tts_delivery_opus_bitrate: int = 24000
+
+    # Single-flight TTS (identical concurrent requests share one provider call)
+    tts_coalescing_enabled: bool = True
+
+    # Provider call scheduler (token bucket per upstream, interactive before batch).
+    # Requests per second by upstream ("openai", "openrouter", "groq", "edge"),
+    # e.g. {"openai": 5.0, "groq": 0.5}; upstreams not listed or set to 0 are
+    # not throttled, so the default {} only retries 429s and transient errors
+    provider_rate_limits: dict[str, float] = {}
+    provider_rate_burst: int = 10
+    provider_batch_reserve: float = 0.3
+    provider_rate_limit_retries: int = 2
+    provider_max_retry_after_seconds: float = 10.0
+    provider_transient_retries: int = 2
 
     # JWT Auth
     jwt_secret_key: str = "your-secret-key-change-in-production"
@@ -61,6 +150,9 @@ class Settings(BaseSettings):
     # Retention
     audio_retention_days: int = 90
 
+    # Streaming TTS (max concurrent sentence synthesis calls per response)
+    tts_stream_concurrency: int = 4
+
 
 @lru_cache
 def get_settings() -> Settings:
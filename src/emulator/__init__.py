@@ -0,0 +1,8 @@
+# Provider emulator for offline load testing
+from src.emulator.app import EmulatorConfig, EndpointProfile, create_emulator_app
+
+__all__ = [
+    "EmulatorConfig",
+    "EndpointProfile",
+    "create_emulator_app",
+]
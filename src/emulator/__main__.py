@@ -0,0 +1,54 @@
+"""Run the provider emulator.
+
+Example:
+    python -m src.emulator --port 8100 --stt-latency 400,1500 --error-rate 0.02
+
+Then point the app at it:
+    OPENAI_BASE_URL=http://localhost:8100/v1
+    OPENROUTER_BASE_URL=http://localhost:8100/v1
+    GROQ_BASE_URL=http://localhost:8100/v1
+(API keys must be non-empty; any value works.)
+"""
+
+import argparse
+
+import uvicorn
+
+from src.emulator.app import EmulatorConfig, EndpointProfile, create_emulator_app
+
+
+def _profile(latency: str, error_rate: float) -> EndpointProfile:
+    p50, p95 = (float(value) for value in latency.split(","))
+    return EndpointProfile(latency_p50_ms=p50, latency_p95_ms=p95, error_rate=error_rate)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Emulate STT/TTS/LLM provider endpoints")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--stt-latency", default="300,1000", help="p50,p95 in ms")
+    parser.add_argument("--tts-latency", default="300,1000", help="p50,p95 in ms")
+    parser.add_argument("--llm-latency", default="300,1000", help="p50,p95 in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 500 responses")
+    parser.add_argument("--rate-limit-rps", type=float, default=None, help="Per endpoint")
+    parser.add_argument("--rate-limit-burst", type=int, default=10)
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After on 429, seconds")
+    parser.add_argument("--speech-ms-per-char", type=float, default=60.0, help="TTS payload size")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = EmulatorConfig(
+        transcription=_profile(args.stt_latency, args.error_rate),
+        speech=_profile(args.tts_latency, args.error_rate),
+        chat=_profile(args.llm_latency, args.error_rate),
+        rate_limit_rps=args.rate_limit_rps,
+        rate_limit_burst=args.rate_limit_burst,
+        retry_after_seconds=args.retry_after,
+        speech_ms_per_char=args.speech_ms_per_char,
+        seed=args.seed,
+    )
+    uvicorn.run(create_emulator_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
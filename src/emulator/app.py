@@ -0,0 +1,204 @@
+"""Provider emulator ASGI app.
+
+Implements the OpenAI-compatible endpoints our adapters and LLMService
+call (OpenAI, OpenRouter and Groq all speak this API):
+- POST .../audio/transcriptions (multipart, json/verbose_json)
+- POST .../audio/speech (returns silent MP3 frames)
+- POST .../chat/completions (JSON or SSE with stream=true)
+
+Any path prefix is accepted, so base URLs such as
+http://localhost:8100/v1 or http://localhost:8100/openai/v1 both work.
+Latency (log-normal from p50/p95), error rate, rate limits and payload
+sizes are configurable per endpoint via EmulatorConfig.
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+# Silent MPEG-1 Layer III frame: 128 kbps, 44.1 kHz, mono, 26.122 ms
+MP3_FRAME_HEADER = b"\xff\xfb\x90\xc4"
+MP3_FRAME_BYTES = 417
+MP3_FRAME_MS = 1152 / 44.1
+
+
+@dataclass
+class EndpointProfile:
+    """Latency and failure behaviour of one endpoint."""
+
+    latency_p50_ms: float = 300.0
+    latency_p95_ms: float = 1000.0
+    error_rate: float = 0.0
+
+    def sample_latency_ms(self, rng: random.Random) -> float:
+        """Draw a latency from a log-normal with the configured p50/p95."""
+        if self.latency_p50_ms <= 0:
+            return 0.0
+        p95 = max(self.latency_p95_ms, self.latency_p50_ms)
+        sigma = math.log(p95 / self.latency_p50_ms) / 1.645
+        return rng.lognormvariate(math.log(self.latency_p50_ms), sigma)
+
+
+@dataclass
+class EmulatorConfig:
+    """Emulator behaviour."""
+
+    transcription: EndpointProfile = field(default_factory=EndpointProfile)
+    speech: EndpointProfile = field(default_factory=EndpointProfile)
+    chat: EndpointProfile = field(default_factory=EndpointProfile)
+    rate_limit_rps: Optional[float] = None  # per endpoint, None = unlimited
+    rate_limit_burst: int = 10
+    retry_after_seconds: int = 1
+    transcript_text: str = "Привет, как дела?"
+    speech_ms_per_char: float = 60.0
+    chat_response_text: str = "Здравствуйте! Чем могу помочь?"
+    seed: Optional[int] = None
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+def silent_mp3(duration_ms: float) -> bytes:
+    """Build a silent MP3 of roughly duration_ms from valid frames."""
+    frame = MP3_FRAME_HEADER + bytes(MP3_FRAME_BYTES - len(MP3_FRAME_HEADER))
+    return frame * max(1, round(duration_ms / MP3_FRAME_MS))
+
+
+def create_emulator_app(config: Optional[EmulatorConfig] = None) -> FastAPI:
+    """Create emulator app."""
+    config = config or EmulatorConfig()
+    rng = random.Random(config.seed)
+    buckets: dict[str, _TokenBucket] = {}
+    stats = {
+        name: {"requests": 0, "errors": 0, "rate_limited": 0}
+        for name in ("transcription", "speech", "chat")
+    }
+
+    app = FastAPI(title="Provider Emulator", docs_url=None, redoc_url=None)
+
+    async def admit(endpoint: str, profile: EndpointProfile) -> Optional[Response]:
+        """Apply rate limit, latency and errors. Returns an error response or None."""
+        stats[endpoint]["requests"] += 1
+
+        if config.rate_limit_rps:
+            bucket = buckets.setdefault(
+                endpoint, _TokenBucket(config.rate_limit_rps, config.rate_limit_burst)
+            )
+            if not bucket.take():
+                stats[endpoint]["rate_limited"] += 1
+                return JSONResponse(
+                    status_code=429,
+                    content={"error": {"message": "Rate limit reached", "type": "rate_limit"}},
+                    headers={"Retry-After": str(config.retry_after_seconds)},
+                )
+
+        await asyncio.sleep(profile.sample_latency_ms(rng) / 1000)
+
+        if rng.random() < profile.error_rate:
+            stats[endpoint]["errors"] += 1
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "Emulated provider error", "type": "server_error"}},
+            )
+        return None
+
+    @app.post("/{prefix:path}/audio/transcriptions")
+    async def transcriptions(prefix: str, request: Request):
+        form = await request.form()
+        error = await admit("transcription", config.transcription)
+        if error:
+            return error
+
+        text = config.transcript_text
+        words = text.split()
+        if form.get("response_format") != "verbose_json":
+            return {"text": text}
+        return {
+            "task": "transcribe",
+            "language": form.get("language") or "ru",
+            "duration": len(words) * 0.4,
+            "text": text,
+            "words": [
+                {"word": word, "start": i * 0.4, "end": (i + 1) * 0.4}
+                for i, word in enumerate(words)
+            ],
+            "segments": [],
+        }
+
+    @app.post("/{prefix:path}/audio/speech")
+    async def speech(prefix: str, request: Request):
+        body = await request.json()
+        error = await admit("speech", config.speech)
+        if error:
+            return error
+
+        duration_ms = len(body.get("input", "")) * config.speech_ms_per_char
+        return Response(content=silent_mp3(duration_ms), media_type="audio/mpeg")
+
+    @app.post("/{prefix:path}/chat/completions")
+    async def chat_completions(prefix: str, request: Request):
+        body = await request.json()
+        error = await admit("chat", config.chat)
+        if error:
+            return error
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        model = body.get("model", "emulator")
+        text = config.chat_response_text
+
+        if body.get("stream"):
+            async def events():
+                for word in text.split(" "):
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": word + " "}}],
+                    }
+                    yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 0, "completion_tokens": len(text.split()), "total_tokens": 0},
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    return app
@@ -69,6 +69,7 @@ async def init_db():
                 stt_provider_used VARCHAR(20) NOT NULL,
                 tts_provider_used VARCHAR(20) NOT NULL,
                 device_info TEXT,
+                turn_count INTEGER NOT NULL DEFAULT 0,
                 FOREIGN KEY (user_id) REFERENCES users(id)
             )
         """))
@@ -87,6 +88,7 @@ async def init_db():
                 transcript_confidence REAL,
                 stt_latency_ms INTEGER,
                 stt_words TEXT,
+                stt_provider_used VARCHAR(20),
                 user_confirmed BOOLEAN,
                 user_correction TEXT,
                 llm_prompt_summary TEXT,
@@ -95,9 +97,11 @@ async def init_db():
                 audio_output_url VARCHAR(500),
                 audio_output_duration_ms INTEGER,
                 tts_latency_ms INTEGER,
+                tts_provider_used VARCHAR(20),
                 needs_review BOOLEAN DEFAULT FALSE,
                 low_confidence BOOLEAN DEFAULT FALSE,
-                FOREIGN KEY (conversation_id) REFERENCES conversations(id)
+                FOREIGN KEY (conversation_id) REFERENCES conversations(id),
+                CONSTRAINT uq_turn_number UNIQUE (conversation_id, turn_number)
             )
         """))
         
@@ -64,6 +64,8 @@ class Conversation(Base):
     stt_provider_used: Mapped[str] = mapped_column(String(20), nullable=False)
     tts_provider_used: Mapped[str] = mapped_column(String(20), nullable=False)
     device_info: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Number of turns allocated so far; incremented atomically per new turn
+    turn_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     user: Mapped["User"] = relationship(back_populates="conversations")
@@ -76,6 +78,9 @@ class Turn(Base):
     """Turn model - each step in a conversation."""
 
     __tablename__ = "turns"
+    __table_args__ = (
+        UniqueConstraint("conversation_id", "turn_number", name="uq_turn_number"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     conversation_id: Mapped[str] = mapped_column(String(36), ForeignKey("conversations.id"), nullable=False)
@@ -92,6 +97,7 @@ class Turn(Base):
     transcript_confidence: Mapped[Optional[float]] = mapped_column(Numeric(5, 4), nullable=True)
     stt_latency_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     stt_words: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    stt_provider_used: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # User Confirmation
     user_confirmed: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
@@ -106,6 +112,7 @@ class Turn(Base):
     audio_output_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     audio_output_duration_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     tts_latency_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    tts_provider_used: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # Flags
     needs_review: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -1,4 +1,4 @@
-"""Additional SQLAlchemy ORM models - UnknownTerm, STTEvaluation, AuditLog."""
+"""Additional SQLAlchemy ORM models - UnknownTerm, STTEvaluation, AuditLog, ProviderComparison."""
 
 import uuid
 from datetime import datetime
@@ -12,6 +12,7 @@ from sqlalchemy import (
     String,
     Text,
     JSON,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -64,3 +65,25 @@ class AuditLog(Base):
     details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class ProviderComparison(Base):
+    """Per-turn STT provider comparison from an offline replay run."""
+
+    __tablename__ = "provider_comparisons"
+    __table_args__ = (UniqueConstraint("run_id", "turn_id", name="uq_comparison_run_turn"),)
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    run_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    turn_id: Mapped[str] = mapped_column(String(36), ForeignKey("turns.id"), nullable=False)
+    language: Mapped[str] = mapped_column(String(5), nullable=False)
+    openai_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    openai_confidence: Mapped[Optional[float]] = mapped_column(Numeric(5, 4), nullable=True)
+    openai_latency_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    openai_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    google_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    google_confidence: Mapped[Optional[float]] = mapped_column(Numeric(5, 4), nullable=True)
+    google_latency_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    google_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    provider_wer: Mapped[Optional[float]] = mapped_column(Numeric(5, 4), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -3,6 +3,7 @@
 Validates: Requirements 9.1, 9.2, 9.3, 9.4, 9.5
 """
 
+import asyncio
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -11,6 +12,7 @@ from typing import Literal, Optional
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.scheduler import Priority, call_priority
 from src.models.entities import User, Conversation, Turn
 from src.models.entities_ext import UnknownTerm, STTEvaluation
 
@@ -275,6 +277,8 @@ class DualProviderService:
     ) -> dict:
         """Process audio through both providers for comparison.
         
+        Both providers are called concurrently.
+        
         Args:
             audio: Audio data
             user_id: User ID
@@ -285,32 +289,39 @@ class DualProviderService:
             
         Validates: Requirements 9.4
         """
-        from src.services.voice_session import AdapterFactory
-        
-        results = {}
-        
-        # Process with OpenAI
-        openai_adapter = AdapterFactory.get_stt_adapter("openai")
-        try:
-            openai_result = await openai_adapter.transcribe(audio, language)
-            results["openai"] = {
-                "text": openai_result.text,
-                "confidence": openai_result.confidence,
-                "latency_ms": openai_result.latency_ms,
-            }
-        except Exception as e:
-            results["openai"] = {"error": str(e)}
-        
-        # Process with Google
-        google_adapter = AdapterFactory.get_stt_adapter("google")
-        try:
-            google_result = await google_adapter.transcribe(audio, language)
-            results["google"] = {
-                "text": google_result.text,
-                "confidence": google_result.confidence,
-                "latency_ms": google_result.latency_ms,
-            }
-        except Exception as e:
-            results["google"] = {"error": str(e)}
+        return await transcribe_with_both_providers(audio, language)
+
+
+async def transcribe_with_both_providers(audio: bytes, language: str) -> dict:
+    """Transcribe audio with OpenAI and Google concurrently.
+    
+    Runs at batch priority, behind live turns in the provider scheduler.
+    
+    Args:
+        audio: Audio data
+        language: Language code
         
-        return results
+    Returns:
+        Per-provider dict with text/confidence/latency_ms, or error
+    """
+    providers = ["openai", "google"]
+    with call_priority(Priority.BATCH):
+        results = await asyncio.gather(
+            *(_transcribe_with_provider(provider, audio, language) for provider in providers)
+        )
+    return dict(zip(providers, results))
+
+
+async def _transcribe_with_provider(provider: str, audio: bytes, language: str) -> dict:
+    from src.services.voice_session import AdapterFactory
+
+    try:
+        adapter = AdapterFactory.get_stt_adapter(provider)
+        result = await adapter.transcribe(audio, language)
+        return {
+            "text": result.text,
+            "confidence": result.confidence,
+            "latency_ms": result.latency_ms,
+        }
+    except Exception as e:
+        return {"error": str(e)}
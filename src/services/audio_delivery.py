@@ -0,0 +1,180 @@
+"""Output audio format negotiation for TTS delivery.
+
+TTS is synthesized as MP3 (providers, frame joining and the phrase cache
+all work on MP3). Clients that can play Opus get it in an OGG container
+at a speech bitrate instead - about a fifth of the MP3 size at 24 kbps,
+which matters on slow mobile links. The format is chosen from the
+request's Accept header, else from ``device_info["audio_formats"]`` sent
+when the session was created, else MP3.
+
+A transcoded variant is stored next to the original under the same key
+with its own extension, so each file is transcoded at most once.
+Variants are only produced while generating a response; retention
+deletes a turn's variants together with its audio (``variant_keys``).
+Opus is encoded with ``soundfile``; if its libsndfile lacks Opus (or
+with ``tts_delivery_opus_bitrate = 0``) MP3 is always delivered.
+"""
+
+import asyncio
+import io
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import Optional
+
+from src.audio_formats import FORMATS, detect_audio_format, encode_opus, opus_available
+from src.config import get_settings
+from src.services.storage import StorageService
+
+logger = logging.getLogger(__name__)
+
+# Formats offered, most compact first
+OUTPUT_FORMATS = ("ogg", "mp3")
+
+_MEDIA_TYPES = {
+    "audio/ogg": "ogg",
+    "audio/opus": "ogg",
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+}
+
+
+@dataclass
+class DeliveredAudio:
+    """Audio in the negotiated format and where it is stored."""
+
+    audio_key: str
+    audio: bytes
+    format: str
+
+    @property
+    def content_type(self) -> str:
+        return FORMATS.get(self.format, "application/octet-stream")
+
+
+def available_formats() -> list[str]:
+    """Output formats this process can deliver."""
+    if get_settings().tts_delivery_opus_bitrate and opus_available():
+        return list(OUTPUT_FORMATS)
+    return [f for f in OUTPUT_FORMATS if f != "ogg"]
+
+
+def negotiate_output_format(
+    accept: Optional[str] = None,
+    device_info: Optional[dict] = None,
+    available: Optional[Iterable[str]] = None,
+) -> str:
+    """Pick the output format for a client.
+
+    Args:
+        accept: Accept header; audio types with the highest q-value win,
+            ties go to the more compact format
+        device_info: Session device info; its "audio_formats" list
+            (e.g. ["ogg", "mp3"] or MIME types) is used when Accept names
+            no audio type
+        available: Formats that can be produced (default: available_formats())
+
+    Returns:
+        "ogg" or "mp3"; "mp3" when nothing matches
+    """
+    available = list(available or available_formats())
+
+    accepted: dict[str, float] = {}
+    for part in (accept or "").split(","):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        audio_format = _MEDIA_TYPES.get(media_type.lower())
+        if audio_format is None:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[audio_format] = max(q, accepted.get(audio_format, 0.0))
+
+    candidates = [f for f in available if accepted.get(f, 0.0) > 0]
+    if candidates:
+        return max(candidates, key=lambda f: (accepted[f], -available.index(f)))
+
+    device_formats = {
+        _MEDIA_TYPES.get(str(f).lower(), str(f).lower())
+        for f in (device_info or {}).get("audio_formats") or []
+    }
+    return next((f for f in available if f in device_formats), "mp3")
+
+
+def variant_key(audio_key: str, audio_format: str) -> str:
+    """Storage key of audio_key transcoded to audio_format."""
+    return str(PurePosixPath(audio_key).with_suffix(f".{audio_format}"))
+
+
+def variant_keys(audio_key: str) -> list[str]:
+    """audio_key and the keys of all its possible format variants."""
+    keys = [audio_key]
+    keys += [k for k in (variant_key(audio_key, f) for f in OUTPUT_FORMATS) if k not in keys]
+    return keys
+
+
+def transcode(audio: bytes, audio_format: str, bitrate: int = 24000) -> Optional[bytes]:
+    """Transcode MP3 or WAV audio to Opus/OGG (the only target format).
+
+    CPU-bound; call via asyncio.to_thread from async code.
+
+    Returns:
+        Transcoded audio, or None if it cannot be produced
+    """
+    if audio_format != "ogg" or not opus_available():
+        return None
+    import soundfile
+
+    try:
+        samples, sample_rate = soundfile.read(io.BytesIO(audio), dtype="float32")
+    except (RuntimeError, ValueError, TypeError):
+        return None  # undecodable input
+    return encode_opus(samples, sample_rate, bitrate)
+
+
+async def convert_audio(audio: bytes, audio_format: str) -> tuple[bytes, str]:
+    """Convert audio to audio_format off the event loop.
+
+    Returns:
+        (audio, format): converted, or the input with its detected format
+        when it is already in audio_format or cannot be converted
+    """
+    source_format = detect_audio_format(audio)
+    if audio_format != source_format:
+        bitrate = get_settings().tts_delivery_opus_bitrate
+        converted = await asyncio.to_thread(transcode, audio, audio_format, bitrate)
+        if converted is not None:
+            return converted, audio_format
+        logger.warning(f"Could not transcode {source_format} audio to {audio_format}")
+    return audio, source_format
+
+
+async def deliver_audio(
+    storage: StorageService,
+    audio_key: str,
+    audio: bytes,
+    audio_format: str,
+) -> DeliveredAudio:
+    """Return stored audio in audio_format, transcoding and storing the variant once.
+
+    Falls back to the original audio when it cannot be transcoded.
+    """
+    if detect_audio_format(audio) == audio_format:
+        return DeliveredAudio(audio_key=audio_key, audio=audio, format=audio_format)
+
+    key = variant_key(audio_key, audio_format)
+    variant = await storage.download_audio(key)
+    if variant is not None:
+        return DeliveredAudio(audio_key=key, audio=variant, format=audio_format)
+
+    converted, converted_format = await convert_audio(audio, audio_format)
+    if converted_format != audio_format:
+        return DeliveredAudio(audio_key=audio_key, audio=audio, format=converted_format)
+    await storage.put_audio(key, converted, content_type=FORMATS[audio_format])
+    return DeliveredAudio(audio_key=key, audio=converted, format=audio_format)
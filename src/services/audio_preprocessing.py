@@ -0,0 +1,168 @@
+"""Audio preprocessing in front of STT.
+
+Decodes PCM WAV, OGG (Opus/Vorbis), MP3 and FLAC input, downmixes to
+mono, downsamples to 16 kHz and trims leading/trailing silence with an
+energy-based VAD. Smaller payloads mean shorter provider uploads and
+fewer billed STT seconds; the result is WAV, which the STT adapters
+encode to Opus for upload.
+
+WebM is the only upload format still passed through unchanged:
+libsndfile, which decodes the compressed formats, cannot read it.
+
+Benchmark on stored recordings:
+    python -m src.services.audio_preprocessing audio_storage/
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.audio_formats import decode_compressed, decode_wav, encode_wav
+
+TARGET_SAMPLE_RATE = 16000
+VAD_FRAME_MS = 20
+VAD_THRESHOLD_DB = -45.0
+VAD_DYNAMIC_RANGE_DB = 40.0
+VAD_PADDING_MS = 200
+
+
+@dataclass
+class PreprocessedAudio:
+    """Result of audio preprocessing."""
+
+    audio: bytes
+    duration_ms: Optional[int] = None
+    original_duration_ms: Optional[int] = None
+    sample_rate: Optional[int] = None
+    processed: bool = False
+
+
+def preprocess_audio(
+    audio: bytes,
+    target_sample_rate: int = TARGET_SAMPLE_RATE,
+    threshold_db: float = VAD_THRESHOLD_DB,
+    padding_ms: int = VAD_PADDING_MS,
+) -> PreprocessedAudio:
+    """Normalize audio for STT.
+
+    CPU-bound; call via asyncio.to_thread from async code.
+
+    Args:
+        audio: Raw uploaded audio
+        target_sample_rate: Output sample rate (only downsampled, never up)
+        threshold_db: Absolute VAD threshold in dBFS
+        padding_ms: Silence kept before the first and after the last voiced frame
+
+    Returns:
+        PreprocessedAudio with 16-bit mono WAV, or the input unchanged
+        if it cannot be decoded (WebM)
+    """
+    decoded = decode_wav(audio)
+    if decoded is None:
+        decoded = decode_compressed(audio)
+    if decoded is None:
+        return PreprocessedAudio(audio=audio)
+
+    samples, sample_rate = decoded
+    original_duration_ms = _duration_ms(len(samples), sample_rate)
+
+    samples = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+    if sample_rate > target_sample_rate:
+        samples = _resample(samples, sample_rate, target_sample_rate)
+        sample_rate = target_sample_rate
+    samples = _trim_silence(samples, sample_rate, threshold_db, padding_ms)
+
+    return PreprocessedAudio(
+        audio=encode_wav(samples, sample_rate),
+        duration_ms=_duration_ms(len(samples), sample_rate),
+        original_duration_ms=original_duration_ms,
+        sample_rate=sample_rate,
+        processed=True,
+    )
+
+
+def _duration_ms(n_samples: int, sample_rate: int) -> int:
+    return int(n_samples * 1000 / sample_rate)
+
+
+def _resample(samples: np.ndarray, sample_rate: int, target_sample_rate: int) -> np.ndarray:
+    """Downsample mono samples."""
+    if sample_rate % target_sample_rate == 0:
+        # Integer ratio: average each block (boxcar low-pass + decimate)
+        factor = sample_rate // target_sample_rate
+        n = len(samples) // factor * factor
+        return samples[:n].reshape(-1, factor).mean(axis=1)
+
+    n_out = int(len(samples) * target_sample_rate / sample_rate)
+    positions = np.arange(n_out) * (sample_rate / target_sample_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def _trim_silence(
+    samples: np.ndarray,
+    sample_rate: int,
+    threshold_db: float,
+    padding_ms: int,
+) -> np.ndarray:
+    """Trim leading and trailing frames below the energy threshold.
+
+    A frame is voiced when its RMS level is above threshold_db and within
+    VAD_DYNAMIC_RANGE_DB of the loudest frame. Audio without voiced frames
+    is returned unchanged and left for STT to judge.
+    """
+    frame_size = sample_rate * VAD_FRAME_MS // 1000
+    n_frames = len(samples) // frame_size
+    if n_frames == 0:
+        return samples
+
+    frames = samples[: n_frames * frame_size].reshape(n_frames, frame_size)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    level_db = 20 * np.log10(np.maximum(rms, 1e-10))
+    threshold = max(threshold_db, level_db.max() - VAD_DYNAMIC_RANGE_DB)
+
+    voiced = np.flatnonzero(level_db > threshold)
+    if len(voiced) == 0:
+        return samples
+
+    padding = sample_rate * padding_ms // 1000
+    start = max(0, voiced[0] * frame_size - padding)
+    end = min(len(samples), (voiced[-1] + 1) * frame_size + padding)
+    return samples[start:end]
+
+
+def _benchmark(root: Path) -> None:
+    files = sorted(p for p in root.rglob("input.*") if p.is_file())
+    total_in = total_out = 0
+    total_ms = 0.0
+
+    print(f"{'file':<60} {'in KB':>8} {'out KB':>8} {'in ms':>8} {'out ms':>8} {'time ms':>8}")
+    for path in files:
+        audio = path.read_bytes()
+        started = time.perf_counter()
+        result = preprocess_audio(audio)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        total_in += len(audio)
+        total_out += len(result.audio)
+        total_ms += elapsed_ms
+        name = str(path.relative_to(root))[-60:]
+        print(
+            f"{name:<60} {len(audio) / 1024:>8.1f} {len(result.audio) / 1024:>8.1f} "
+            f"{result.original_duration_ms or '-':>8} {result.duration_ms or '-':>8} "
+            f"{elapsed_ms:>8.2f}"
+        )
+
+    if files:
+        print(
+            f"{len(files)} files: {total_in / 1024:.1f} KB -> {total_out / 1024:.1f} KB "
+            f"({100 * total_out / max(total_in, 1):.0f}%), "
+            f"{total_ms / len(files):.2f} ms/file"
+        )
+
+
+if __name__ == "__main__":
+    _benchmark(Path(sys.argv[1] if len(sys.argv) > 1 else "audio_storage"))
@@ -0,0 +1,56 @@
+"""Request-scoped entity context (identity map) for the voice pipeline.
+
+Loads each User, Conversation and Turn at most once per request and hands
+the same instance to every service that asks for it.
+"""
+
+from typing import Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.database import Base
+from src.models.entities import User, Conversation, Turn
+
+EntityT = TypeVar("EntityT", bound=Base)
+
+
+class EntityContext:
+    """Identity map of pipeline entities for a single request."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize entity context.
+
+        Args:
+            db: Database session of the request
+        """
+        self.db = db
+        self._entities: dict[tuple[type, str], Base] = {}
+
+    def add(self, entity: Optional[Base]) -> None:
+        """Register an already loaded or newly created entity."""
+        if entity is not None:
+            self._entities[(type(entity), str(entity.id))] = entity
+
+    async def _get(self, model: type[EntityT], entity_id) -> Optional[EntityT]:
+        key = (model, str(entity_id))
+        if key in self._entities:
+            return self._entities[key]  # type: ignore[return-value]
+
+        entity = await self.db.get(model, str(entity_id))
+        self.add(entity)
+        return entity
+
+    async def get_user(self, user_id) -> Optional[User]:
+        """Get user by ID."""
+        return await self._get(User, user_id)
+
+    async def get_conversation(self, conversation_id) -> Optional[Conversation]:
+        """Get conversation by ID."""
+        return await self._get(Conversation, conversation_id)
+
+    async def get_turn(self, turn_id, conversation_id=None) -> Optional[Turn]:
+        """Get turn by ID, optionally checking it belongs to a conversation."""
+        turn = await self._get(Turn, turn_id)
+        if turn and conversation_id is not None and turn.conversation_id != str(conversation_id):
+            return None
+        return turn
@@ -3,64 +3,209 @@
 Uses Groq for ultra-fast inference, or simple responses if no API key.
 """
 
-import httpx
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Optional
 
+import httpx
+
+from src.adapters.http import create_http_client
+from src.adapters.scheduler import get_provider_scheduler
 from src.config import get_settings
+from src.services.llm_cache import LLMResponseCache, get_llm_response_cache
+
+GROQ_MODEL = "llama-3.1-8b-instant"
+
+# Simple mode replies: first entry with a keyword in the message wins
+SIMPLE_RESPONSES = {
+    "kk": [
+        (["сәлем", "салем", "қалай", "калай"], "Сәлем! Мен жақсымын, рахмет. Сізге қалай көмектесе аламын?"),
+        (["ауа", "райы", "weather"], "Бүгін ауа райы жақсы болады."),
+        (["уақыт", "сағат", "time"], "Қазір түс уақыты."),
+        (["рахмет", "сау бол"], "Өзіңізге де рахмет! Сау болыңыз!"),
+    ],
+    "ru": [
+        (["привет", "здравствуй", "добрый"], "Здравствуйте! Чем могу помочь?"),
+        (["погода", "weather"], "Сегодня хорошая погода, можно погулять."),
+        (["время", "час", "time"], "Сейчас дневное время."),
+        (["спасибо", "благодар"], "Пожалуйста! Рада помочь!"),
+        (["как дела", "как ты"], "У меня всё хорошо, спасибо! А у вас?"),
+    ],
+}
+DEFAULT_RESPONSES = {
+    "kk": "Мен сізге көмектесуге дайынмын. Сұрағыңызды қойыңыз.",
+    "ru": "Я вас слушаю. Чем могу помочь?",
+}
+FALLBACK_RESPONSES = {
+    "kk": "Кешіріңіз, түсінбедім.",
+    "ru": "Извините, не понял.",
+}
+
+
+def canned_responses(language: str) -> list[str]:
+    """All fixed replies of simple mode and fallback for a language."""
+    return [response for _, response in SIMPLE_RESPONSES[language]] + [
+        DEFAULT_RESPONSES[language],
+        FALLBACK_RESPONSES[language],
+    ]
 
 
 class LLMService:
-    """Service for LLM responses - uses Groq (fastest) or simple mode."""
+    """Service for LLM responses - uses Groq (fastest) or simple mode.
 
-    def __init__(self):
+    Inside the running app the service owns one pooled keep-alive HTTP
+    client (HTTP/2 when available), opened by start() and closed by
+    aclose() in the lifespan. Outside of it (scripts, tests) a client is
+    created per call.
+    """
+
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+    ):
         self.settings = get_settings()
         self.groq_api_key = getattr(self.settings, 'groq_api_key', '') or ''
+        self.groq_base_url = self.settings.groq_base_url
         self.openrouter_api_key = self.settings.openrouter_api_key or ''
-        
+        self.openrouter_base_url = self.settings.openrouter_base_url
+        self.http_client = http_client
+        self.response_cache = response_cache
+        if response_cache is None and self.settings.llm_cache_enabled:
+            self.response_cache = get_llm_response_cache()
+
+    def start(self) -> None:
+        """Open the pooled HTTP client shared by all LLM calls."""
+        if self.http_client is None:
+            self.http_client = create_http_client(timeout=15.0)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self.http_client is not None:
+            yield self.http_client
+        else:
+            async with create_http_client(timeout=15.0) as client:
+                yield client
+
     async def generate_response(
         self,
         user_message: str,
         system_prompt: Optional[str] = None,
         language: str = "ru"
     ) -> str:
-        """Generate a response - fast mode."""
+        """Generate a response - fast mode.
+
+        Repeated questions are answered from the response cache without
+        calling the LLM.
+        """
         if not user_message.strip():
             return self._get_fallback_response(user_message, language)
 
         # Try Groq first (fastest - < 1 second)
         if self.groq_api_key:
+            cached = await self._get_cached(user_message, language)
+            if cached:
+                return cached
             result = await self._call_groq(user_message, language)
             if result:
+                await self._set_cached(user_message, language, result)
                 return result
         
         # Skip slow OpenRouter - use simple responses instead (instant)
         return self._get_simple_response(user_message, language)
 
+    async def generate_response_stream(
+        self,
+        user_message: str,
+        system_prompt: Optional[str] = None,
+        language: str = "ru"
+    ) -> AsyncIterator[str]:
+        """Generate a response, yielding text deltas as the model produces them.
+
+        Uses Groq's streaming (SSE) mode. Cached, simple and fallback
+        replies are yielded whole. If Groq fails before the first token the simple
+        reply is used; a failure after that ends the stream early.
+        """
+        if not user_message.strip():
+            yield self._get_fallback_response(user_message, language)
+            return
+
+        if self.groq_api_key:
+            cached = await self._get_cached(user_message, language)
+            if cached:
+                yield cached
+                return
+
+            deltas: list[str] = []
+            try:
+                async for delta in self._stream_chat(
+                    "groq",
+                    f"{self.groq_base_url}/chat/completions",
+                    self.groq_api_key,
+                    self._groq_payload(user_message, language),
+                    timeout=10.0,
+                ):
+                    deltas.append(delta)
+                    yield delta
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"Groq stream failed: {e}")
+                if deltas:
+                    return  # partial answer is not cached
+            if deltas:
+                await self._set_cached(user_message, language, "".join(deltas))
+                return
+
+        yield self._get_simple_response(user_message, language)
+
+    async def _get_cached(self, user_message: str, language: str) -> Optional[str]:
+        if self.response_cache is None:
+            return None
+        return await self.response_cache.get(
+            user_message, language, self._get_default_system_prompt(language), GROQ_MODEL
+        )
+
+    async def _set_cached(self, user_message: str, language: str, response: str) -> None:
+        if self.response_cache is not None:
+            await self.response_cache.set(
+                user_message,
+                language,
+                self._get_default_system_prompt(language),
+                GROQ_MODEL,
+                response,
+            )
+
+    def _messages(self, user_message: str, language: str) -> list[dict]:
+        return [
+            {"role": "system", "content": self._get_default_system_prompt(language)},
+            {"role": "user", "content": user_message}
+        ]
+
+    def _groq_payload(self, user_message: str, language: str) -> dict:
+        return {
+            "model": GROQ_MODEL,
+            "messages": self._messages(user_message, language),
+            "temperature": 0.5,
+            "max_tokens": 80,
+        }
+
     async def _call_groq(self, user_message: str, language: str) -> Optional[str]:
         """Call Groq API (ultra-fast < 1 second)."""
         try:
-            messages = [
-                {"role": "system", "content": self._get_default_system_prompt(language)},
-                {"role": "user", "content": user_message}
-            ]
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.groq_api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": "llama-3.1-8b-instant",
-                        "messages": messages,
-                        "temperature": 0.5,
-                        "max_tokens": 80,
-                    }
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    return data["choices"][0]["message"]["content"]
-                print(f"Groq error: {response.status_code}")
+            return await self._chat(
+                "groq",
+                f"{self.groq_base_url}/chat/completions",
+                self.groq_api_key,
+                self._groq_payload(user_message, language),
+                timeout=10.0,
+            )
         except Exception as e:
             print(f"Groq failed: {e}")
         return None
@@ -68,58 +213,102 @@ class LLMService:
     async def _call_openrouter_fast(self, user_message: str, language: str) -> Optional[str]:
         """Call OpenRouter with fastest free model."""
         try:
-            messages = [
-                {"role": "system", "content": self._get_default_system_prompt(language)},
-                {"role": "user", "content": user_message}
-            ]
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.openrouter_api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": "meta-llama/llama-3.2-1b-instruct:free",  # Smallest, fastest
-                        "messages": messages,
-                        "temperature": 0.5,
-                        "max_tokens": 60,
-                    }
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    return data["choices"][0]["message"]["content"]
-                print(f"OpenRouter error: {response.status_code}")
+            return await self._chat(
+                "openrouter",
+                f"{self.openrouter_base_url}/chat/completions",
+                self.openrouter_api_key,
+                {
+                    "model": "meta-llama/llama-3.2-1b-instruct:free",  # Smallest, fastest
+                    "messages": self._messages(user_message, language),
+                    "temperature": 0.5,
+                    "max_tokens": 60,
+                },
+                timeout=15.0,
+            )
         except Exception as e:
             print(f"OpenRouter failed: {e}")
         return None
 
+    async def _chat(
+        self,
+        provider: str,
+        url: str,
+        api_key: str,
+        payload: dict,
+        timeout: float,
+    ) -> Optional[str]:
+        """Run a chat completion through the provider scheduler."""
+        async with self._client() as client:
+            async def request() -> httpx.Response:
+                response = await client.post(
+                    url,
+                    headers=_auth_headers(api_key),
+                    json=payload,
+                    timeout=timeout,
+                )
+                if response.status_code == 429 or response.status_code >= 500:
+                    response.raise_for_status()  # scheduler waits out Retry-After, retries 5xx
+                return response
+
+            response = await get_provider_scheduler().run(provider, request)
+            if response.status_code == 200:
+                data = response.json()
+                return data["choices"][0]["message"]["content"]
+            print(f"{provider} error: {response.status_code}")
+        return None
+
+    async def _stream_chat(
+        self,
+        provider: str,
+        url: str,
+        api_key: str,
+        payload: dict,
+        timeout: float,
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion (stream=True), yielding content deltas.
+
+        Only opening the stream goes through the provider scheduler.
+        """
+        async with self._client() as client:
+            async def request() -> httpx.Response:
+                response = await client.send(
+                    client.build_request(
+                        "POST",
+                        url,
+                        headers=_auth_headers(api_key),
+                        json={**payload, "stream": True},
+                        timeout=timeout,
+                    ),
+                    stream=True,
+                )
+                if response.status_code != 200:
+                    await response.aclose()
+                    response.raise_for_status()  # scheduler waits out a 429's Retry-After
+                return response
+
+            response = await get_provider_scheduler().run(provider, request)
+            try:
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = json.loads(data).get("choices") or [{}]
+                    delta = (choices[0].get("delta") or {}).get("content")
+                    if delta:
+                        yield delta
+            finally:
+                await response.aclose()
+
     def _get_simple_response(self, user_message: str, language: str) -> str:
         """Generate simple response without LLM (instant)."""
         msg = user_message.lower()
-        
-        if language == "kk":
-            if any(w in msg for w in ["сәлем", "салем", "қалай", "калай"]):
-                return "Сәлем! Мен жақсымын, рахмет. Сізге қалай көмектесе аламын?"
-            if any(w in msg for w in ["ауа", "райы", "weather"]):
-                return "Бүгін ауа райы жақсы болады."
-            if any(w in msg for w in ["уақыт", "сағат", "time"]):
-                return "Қазір түс уақыты."
-            if any(w in msg for w in ["рахмет", "сау бол"]):
-                return "Өзіңізге де рахмет! Сау болыңыз!"
-            return "Мен сізге көмектесуге дайынмын. Сұрағыңызды қойыңыз."
-        else:
-            if any(w in msg for w in ["привет", "здравствуй", "добрый"]):
-                return "Здравствуйте! Чем могу помочь?"
-            if any(w in msg for w in ["погода", "weather"]):
-                return "Сегодня хорошая погода, можно погулять."
-            if any(w in msg for w in ["время", "час", "time"]):
-                return "Сейчас дневное время."
-            if any(w in msg for w in ["спасибо", "благодар"]):
-                return "Пожалуйста! Рада помочь!"
-            if any(w in msg for w in ["как дела", "как ты"]):
-                return "У меня всё хорошо, спасибо! А у вас?"
-            return "Я вас слушаю. Чем могу помочь?"
+        language = "kk" if language == "kk" else "ru"
+        for keywords, response in SIMPLE_RESPONSES[language]:
+            if any(w in msg for w in keywords):
+                return response
+        return DEFAULT_RESPONSES[language]
 
     def _get_default_system_prompt(self, language: str) -> str:
         """Get default system prompt based on language."""
@@ -129,9 +318,14 @@ class LLMService:
 
     def _get_fallback_response(self, user_message: str, language: str) -> str:
         """Return fallback response."""
-        if language == "kk":
-            return "Кешіріңіз, түсінбедім."
-        return "Извините, не понял."
+        return FALLBACK_RESPONSES["kk" if language == "kk" else "ru"]
+
+
+def _auth_headers(api_key: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
 
 
 _llm_service: Optional[LLMService] = None
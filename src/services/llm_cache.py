@@ -0,0 +1,165 @@
+"""LLM response cache keyed on the normalized utterance.
+
+Seniors ask the same short questions over and over ("какая погода",
+greetings, thanks). Answers from the LLM are cached in a TieredCache
+(in-process LRU, optional Redis) under a BLAKE2b key of the normalized
+utterance, language, system prompt and model, so a repeated question
+skips the LLM call.
+
+Each utterance is put into a coarse intent class by keywords. The class
+picks the TTL (weather goes stale sooner than a greeting) and some
+classes are never cached: the time of day, and anything about health or
+medication, where a stale or generic answer could do harm.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from typing import Optional
+
+from src.cache import TieredCache
+from src.config import get_settings
+
+# Intent keywords (ru and kk); first intent with a matching keyword wins
+INTENT_KEYWORDS = [
+    ("emergency", ["помогит", "скорая", "скорую", "плохо", "упал", "көмектесіңдер", "жедел"]),
+    ("medication", [
+        "лекарств", "таблет", "давлени", "врач", "болит", "боль", "укол", "дозировк",
+        "дәрі", "қысым", "дәрігер", "ауыр",
+    ]),
+    ("weather", ["погод", "дожд", "снег", "температур", "ауа райы", "жаңбыр", "weather"]),
+    ("time", ["время", "час", "числ", "дата", "уақыт", "сағат", "time"]),
+    ("greeting", ["привет", "здравствуй", "добр", "сәлем", "салем", "қайырлы"]),
+    ("thanks", ["спасибо", "благодар", "рахмет", "сау бол"]),
+    ("smalltalk", ["как дела", "как ты", "қалай", "калай"]),
+]
+DEFAULT_INTENT = "other"
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_utterance(text: str) -> str:
+    """Lowercase, drop punctuation, unify ё/е and collapse whitespace."""
+    text = _NON_WORD.sub(" ", text.lower().replace("ё", "е"))
+    return _SPACES.sub(" ", text).strip()
+
+
+def classify_intent(normalized: str) -> str:
+    """Coarse intent of a normalized utterance."""
+    for intent, keywords in INTENT_KEYWORDS:
+        if any(keyword in normalized for keyword in keywords):
+            return intent
+    return DEFAULT_INTENT
+
+
+class LLMResponseCache:
+    """Caches LLM answers with per-intent TTLs and per-intent counters."""
+
+    def __init__(
+        self,
+        cache: TieredCache,
+        ttl_seconds: dict[str, int],
+        never_cache: list[str],
+    ):
+        """Initialize response cache.
+
+        Args:
+            cache: Cache holding UTF-8 encoded answers
+            ttl_seconds: TTL by intent; "other" is used for intents not listed
+            never_cache: Intents whose answers are never cached
+        """
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.never_cache = set(never_cache)
+        self._counters: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "bypassed": 0}
+        )
+
+    @staticmethod
+    def key(normalized: str, language: str, system_prompt: str, model: str) -> str:
+        """Cache key of a question."""
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (normalized, language, system_prompt, model):
+            digest.update(part.encode() + b"\x00")
+        return digest.hexdigest()
+
+    def cacheable(self, intent: str) -> bool:
+        return intent not in self.never_cache
+
+    async def get(
+        self,
+        user_message: str,
+        language: str,
+        system_prompt: str,
+        model: str,
+    ) -> Optional[str]:
+        """Cached answer to the question, or None."""
+        normalized = normalize_utterance(user_message)
+        intent = classify_intent(normalized)
+        if not self.cacheable(intent):
+            self._counters[intent]["bypassed"] += 1
+            return None
+
+        value = await self.cache.get(self.key(normalized, language, system_prompt, model))
+        self._counters[intent]["hits" if value is not None else "misses"] += 1
+        return value.decode() if value is not None else None
+
+    async def set(
+        self,
+        user_message: str,
+        language: str,
+        system_prompt: str,
+        model: str,
+        response: str,
+    ) -> None:
+        """Cache an LLM answer unless its intent is never cached."""
+        normalized = normalize_utterance(user_message)
+        intent = classify_intent(normalized)
+        if not normalized or not self.cacheable(intent):
+            return
+        ttl = self.ttl_seconds.get(intent, self.ttl_seconds.get(DEFAULT_INTENT))
+        await self.cache.set(
+            self.key(normalized, language, system_prompt, model),
+            response.encode(),
+            ttl_seconds=ttl,
+        )
+
+    def stats(self) -> dict:
+        """Hit rates overall and by intent (tier counters are under the "llm" cache)."""
+        by_intent = {}
+        for intent, counters in sorted(self._counters.items()):
+            lookups = counters["hits"] + counters["misses"]
+            by_intent[intent] = {
+                **counters,
+                "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            }
+        hits = sum(c["hits"] for c in self._counters.values())
+        lookups = hits + sum(c["misses"] for c in self._counters.values())
+        return {
+            "hits": hits,
+            "lookups": lookups,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "bypassed": sum(c["bypassed"] for c in self._counters.values()),
+            "by_intent": by_intent,
+        }
+
+
+_llm_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Process-wide LLM response cache."""
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        settings = get_settings()
+        _llm_response_cache = LLMResponseCache(
+            cache=TieredCache(
+                name="llm",
+                max_bytes=settings.llm_cache_max_bytes,
+                redis_url=settings.redis_url if settings.llm_cache_redis_enabled else None,
+            ),
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            never_cache=settings.llm_cache_never_cache,
+        )
+    return _llm_response_cache
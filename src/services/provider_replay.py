@@ -0,0 +1,291 @@
+"""Offline replay of stored turn audio through both STT providers.
+
+Walks turns with stored input audio in turn ID order, transcribes each
+clip with OpenAI and Google concurrently (bounded by a semaphore across
+clips) and writes one ProviderComparison row per turn.
+
+Comparison rows are committed in turn ID order every page, so the
+checkpoint of a run is simply its highest compared turn ID: running the
+same run_id again resumes after the last committed row.
+
+CLI:
+    python -m src.services.provider_replay --run-id nightly --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models.database import async_session_maker
+from src.models.entities import Conversation, Turn, User
+from src.models.entities_ext import ProviderComparison
+from src.services.analytics import calculate_wer, transcribe_with_both_providers
+from src.services.storage import StorageService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplaySummary:
+    """Progress of a replay run in this process."""
+
+    run_id: str
+    processed: int = 0
+    failed: int = 0  # at least one provider returned an error
+    missing_audio: int = 0
+    done: bool = False
+
+
+@dataclass
+class _ReplayTurn:
+    turn_id: str
+    audio_key: str
+    language: str
+
+
+class ProviderReplayRunner:
+    """Replays stored turn audio through both STT providers."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker = async_session_maker,
+        storage: Optional[StorageService] = None,
+        concurrency: int = 8,
+        page_size: int = 100,
+    ):
+        """Initialize runner.
+        
+        Args:
+            session_maker: Session factory, one session per page
+            storage: Storage to read turn audio from
+            concurrency: Maximum clips transcribed at the same time
+            page_size: Turns per page (and per commit)
+        """
+        self.session_maker = session_maker
+        self.storage = storage or StorageService()
+        self.concurrency = concurrency
+        self.page_size = page_size
+
+    async def run(
+        self,
+        run_id: str,
+        limit: Optional[int] = None,
+        summary: Optional[ReplaySummary] = None,
+    ) -> ReplaySummary:
+        """Compare providers on stored turns, resuming from the run's checkpoint.
+        
+        Args:
+            run_id: Run identifier; rows and checkpoint are scoped to it
+            limit: Maximum turns to process in this call
+            summary: Summary to update live (for background runs)
+            
+        Returns:
+            ReplaySummary of this call
+        """
+        summary = summary or ReplaySummary(run_id=run_id)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self.session_maker() as db:
+            cursor = await self._get_checkpoint(db, run_id)
+
+        # Clips in flight span up to two pages, so a slow clip does not stall
+        # the others; rows are committed in turn order, so the checkpoint
+        # never passes a clip that is still being transcribed.
+        window: deque[asyncio.Task] = deque()
+        rows: list[ProviderComparison] = []
+        fetched = 0
+        exhausted = False
+        try:
+            while True:
+                if not exhausted and len(window) < 2 * self.page_size:
+                    page_size = self.page_size
+                    if limit is not None:
+                        page_size = min(page_size, limit - fetched)
+                    turns = []
+                    if page_size > 0:
+                        async with self.session_maker() as db:
+                            turns = await self._get_page(db, cursor, page_size)
+                    if turns:
+                        cursor = turns[-1].turn_id
+                        fetched += len(turns)
+                        window.extend(
+                            asyncio.create_task(
+                                self._compare_turn(run_id, turn, semaphore, summary)
+                            )
+                            for turn in turns
+                        )
+                    else:
+                        exhausted = True
+                if not window:
+                    break
+
+                if not window[0].done():
+                    if exhausted or len(window) >= 2 * self.page_size:
+                        await asyncio.wait([window[0]])
+                    else:
+                        pending = [task for task in window if not task.done()]
+                        await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                while window and window[0].done():
+                    row = window.popleft().result()
+                    if row is not None:
+                        rows.append(row)
+                    summary.processed += 1
+                    if summary.processed % self.page_size == 0:
+                        await self._commit_rows(run_id, rows, summary)
+                        rows = []
+            await self._commit_rows(run_id, rows, summary)
+        finally:
+            for task in window:
+                task.cancel()
+
+        summary.done = True
+        return summary
+
+    async def _commit_rows(
+        self,
+        run_id: str,
+        rows: list[ProviderComparison],
+        summary: ReplaySummary,
+    ) -> None:
+        async with self.session_maker() as db:
+            db.add_all(rows)
+            await db.commit()
+        logger.info(f"Replay {run_id}: {summary.processed} turns compared")
+
+    async def _get_checkpoint(self, db: AsyncSession, run_id: str) -> Optional[str]:
+        # ORDER BY instead of max(): PostgreSQL has no max() for UUID columns
+        result = await db.execute(
+            select(ProviderComparison.turn_id)
+            .where(ProviderComparison.run_id == run_id)
+            .order_by(ProviderComparison.turn_id.desc())
+            .limit(1)
+        )
+        return result.scalar()
+
+    async def _get_page(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str],
+        page_size: int,
+    ) -> list[_ReplayTurn]:
+        query = (
+            select(Turn.id, Turn.audio_input_url, User.language)
+            .join(Conversation, Turn.conversation_id == Conversation.id)
+            .join(User, Conversation.user_id == User.id)
+            .where(Turn.audio_input_url.isnot(None))
+            .order_by(Turn.id)
+            .limit(page_size)
+        )
+        if cursor is not None:
+            query = query.where(Turn.id > cursor)
+
+        result = await db.execute(query)
+        return [_ReplayTurn(turn_id, key, language) for turn_id, key, language in result]
+
+    async def _compare_turn(
+        self,
+        run_id: str,
+        turn: _ReplayTurn,
+        semaphore: asyncio.Semaphore,
+        summary: ReplaySummary,
+    ) -> Optional[ProviderComparison]:
+        async with semaphore:
+            audio = await self.storage.download_audio(turn.audio_key)
+            if audio is None:
+                summary.missing_audio += 1
+                return None
+            results = await transcribe_with_both_providers(audio, turn.language)
+
+        openai_result = results["openai"]
+        google_result = results["google"]
+        if "error" in openai_result or "error" in google_result:
+            summary.failed += 1
+
+        provider_wer = None
+        if "text" in openai_result and "text" in google_result:
+            # Capped to fit Numeric(5, 4)
+            provider_wer = min(calculate_wer(google_result["text"], openai_result["text"]), 9.9999)
+
+        return ProviderComparison(
+            run_id=run_id,
+            turn_id=turn.turn_id,
+            language=turn.language,
+            openai_text=openai_result.get("text"),
+            openai_confidence=openai_result.get("confidence"),
+            openai_latency_ms=openai_result.get("latency_ms"),
+            openai_error=openai_result.get("error"),
+            google_text=google_result.get("text"),
+            google_confidence=google_result.get("confidence"),
+            google_latency_ms=google_result.get("latency_ms"),
+            google_error=google_result.get("error"),
+            provider_wer=provider_wer,
+        )
+
+
+# Background runs started from the admin API, by run_id
+_background_runs: dict[str, tuple[asyncio.Task, ReplaySummary]] = {}
+
+
+def start_background_replay(
+    run_id: str,
+    concurrency: int = 8,
+    limit: Optional[int] = None,
+) -> ReplaySummary:
+    """Start a replay run as a background task (no-op if already running)."""
+    running = get_background_replay(run_id)
+    if running and not running[0].done():
+        return running[1]
+
+    summary = ReplaySummary(run_id=run_id)
+    runner = ProviderReplayRunner(concurrency=concurrency)
+    task = asyncio.create_task(runner.run(run_id, limit=limit, summary=summary))
+    _background_runs[run_id] = (task, summary)
+    return summary
+
+
+async def stop_background_replays() -> None:
+    """Cancel background runs on shutdown; their run_id resumes them later."""
+    tasks = [task for task, _ in _background_runs.values() if not task.done()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    _background_runs.clear()
+
+
+def get_background_replay(run_id: str) -> Optional[tuple[asyncio.Task, ReplaySummary]]:
+    """Get task and live summary of a background run started in this process."""
+    return _background_runs.get(run_id)
+
+
+async def _main() -> None:
+    from src.adapters.registry import get_adapter_registry
+    from src.services.work_queue import get_work_queue
+
+    parser = argparse.ArgumentParser(description="Replay stored audio through both STT providers")
+    parser.add_argument("--run-id", required=True, help="Run ID (same ID resumes the run)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    registry = get_adapter_registry()
+    registry.start()
+    try:
+        runner = ProviderReplayRunner(concurrency=args.concurrency, page_size=args.page_size)
+        summary = await runner.run(args.run_id, limit=args.limit)
+        print(summary)
+    finally:
+        await get_work_queue().stop()
+        await registry.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
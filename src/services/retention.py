@@ -11,7 +11,9 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.entities import Turn
+from src.services.audio_delivery import variant_keys
 from src.services.storage import StorageService
+from src.services.tts_cache import is_shared_audio_key
 from src.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -58,9 +60,12 @@ class RetentionPolicyService:
                     await self.storage.delete_audio(turn.audio_input_url)
                     turn.audio_input_url = None
                 
-                # Delete output audio
+                # Delete output audio and its format variants; shared
+                # phrase audio stays for other turns
                 if turn.audio_output_url:
-                    await self.storage.delete_audio(turn.audio_output_url)
+                    if not is_shared_audio_key(turn.audio_output_url):
+                        for key in variant_keys(turn.audio_output_url):
+                            await self.storage.delete_audio(key)
                     turn.audio_output_url = None
                 
                 deleted_count += 1
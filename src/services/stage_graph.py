@@ -0,0 +1,123 @@
+"""Stage graph executor for pipeline orchestration.
+
+Runs async pipeline stages as soon as their dependencies are done, so that
+independent work (e.g. audio upload and STT) overlaps instead of adding up.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+StageFunc = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class Stage:
+    """A single pipeline stage."""
+
+    name: str
+    func: StageFunc
+    depends_on: tuple[str, ...] = ()
+    uses_db: bool = False
+
+
+@dataclass
+class StageGraph:
+    """Dependency graph of async stages executed concurrently with asyncio.
+
+    Each stage function receives the results of all finished stages keyed by
+    stage name. Stages flagged with ``uses_db`` are serialized through a shared
+    lock because a single AsyncSession must not be used concurrently.
+    """
+
+    stages: dict[str, Stage] = field(default_factory=dict)
+    timings_ms: dict[str, int] = field(default_factory=dict)
+
+    def add(
+        self,
+        name: str,
+        func: StageFunc,
+        depends_on: tuple[str, ...] = (),
+        uses_db: bool = False,
+    ) -> None:
+        """Register a stage.
+
+        Args:
+            name: Unique stage name (also the key of its result)
+            func: Async function taking the results dict
+            depends_on: Names of stages that must finish first
+            uses_db: Whether the stage touches the database session
+        """
+        if name in self.stages:
+            raise ValueError(f"Stage {name} already registered")
+        self.stages[name] = Stage(name=name, func=func, depends_on=depends_on, uses_db=uses_db)
+
+    def _execution_order(self) -> list[str]:
+        """Return stage names in dependency order, validating the graph."""
+        order: list[str] = []
+        state: dict[str, str] = {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Dependency cycle at stage {name}")
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage: {name}")
+            state[name] = "visiting"
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    async def run(self) -> dict[str, Any]:
+        """Run all stages, starting each one once its dependencies finish.
+
+        Returns:
+            Results of all stages keyed by stage name
+
+        Raises:
+            The first exception raised by any stage; remaining stages are cancelled.
+        """
+        results: dict[str, Any] = {}
+        tasks: dict[str, asyncio.Task] = {}
+        db_lock = asyncio.Lock()
+
+        async def run_stage(stage: Stage) -> None:
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[dep] for dep in stage.depends_on))
+            if stage.uses_db:
+                async with db_lock:
+                    await timed(stage)
+            else:
+                await timed(stage)
+
+        async def timed(stage: Stage) -> None:
+            start_time = time.perf_counter()
+            results[stage.name] = await stage.func(results)
+            self.timings_ms[stage.name] = int((time.perf_counter() - start_time) * 1000)
+
+        for name in self._execution_order():
+            tasks[name] = asyncio.create_task(run_stage(self.stages[name]), name=name)
+
+        start_time = time.perf_counter()
+        try:
+            done, pending = await asyncio.wait(
+                tasks.values(), return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        self.timings_ms["total"] = int((time.perf_counter() - start_time) * 1000)
+        return results
@@ -3,6 +3,7 @@
 Validates: Requirements 5.1, 10.2
 """
 
+import asyncio
 import os
 import uuid
 from datetime import datetime, timedelta
@@ -70,7 +71,23 @@ class StorageService:
     ) -> str:
         """Upload audio file to storage."""
         key = self._generate_path(user_id, conversation_id, turn_id, file_type)
+        return await self.put_audio(key, audio, content_type)
+
+    async def put_audio(
+        self,
+        key: str,
+        audio: bytes,
+        content_type: str = "audio/wav",
+    ) -> str:
+        """Upload audio file under an explicit key (shared, not per turn)."""
+        # Blocking file/S3 I/O runs in a thread so concurrent pipeline stages
+        # (e.g. STT) are not stalled by the upload
+        await asyncio.to_thread(self._write_audio, key, audio, content_type)
         
+        return key
+
+    def _write_audio(self, key: str, audio: bytes, content_type: str) -> None:
+        """Write audio to S3 or local storage (blocking)."""
         if self.use_local:
             # Save to local storage
             local_path = LOCAL_STORAGE_DIR / key
@@ -90,8 +107,6 @@ class StorageService:
                 local_path = LOCAL_STORAGE_DIR / key
                 local_path.parent.mkdir(parents=True, exist_ok=True)
                 local_path.write_bytes(audio)
-        
-        return key
 
     def generate_signed_url(
         self,
@@ -119,6 +134,20 @@ class StorageService:
         except Exception:
             return f"/api/audio/{key}"
     
+    async def download_audio(self, key: str) -> Optional[bytes]:
+        """Read audio file from storage, or None if it does not exist."""
+        return await asyncio.to_thread(self._read_audio, key)
+
+    def _read_audio(self, key: str) -> Optional[bytes]:
+        """Read audio from S3 or local storage (blocking)."""
+        if not self.use_local and self.client:
+            try:
+                response = self.client.get_object(Bucket=self.bucket, Key=key)
+                return response["Body"].read()
+            except Exception:
+                pass  # May have been stored locally as upload fallback
+        return self.get_local_file(key)
+
     def get_local_file(self, key: str) -> Optional[bytes]:
         """Get file from local storage."""
         local_path = LOCAL_STORAGE_DIR / key
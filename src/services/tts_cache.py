@@ -0,0 +1,284 @@
+"""Pre-synthesized TTS phrase cache.
+
+Canned replies (simple mode and fallback phrases of LLMService) and the
+most frequent LLM answers are synthesized once and stored once in
+StorageService under a content-addressed key (text, language, voice,
+speed, provider). Turns answered with such a phrase point their
+audio_output_url at the shared file and skip both TTS and upload;
+retention never deletes these files (see ``is_shared_audio_key``).
+
+- Warm-up: ``warm()`` runs in the background at startup for all canned
+  phrases, at batch priority; phrases already in storage are only read.
+- Learning: every other text is counted, and from ``learn_threshold``
+  occurrences on it is cached after its next synthesis.
+- Eviction: the in-memory index keeps ``max_entries`` phrases and drops
+  the least recently used one; canned phrases are never evicted. Stored
+  files are left in place and found again if the phrase comes back.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Optional
+
+from src.adapters.scheduler import Priority, call_priority
+from src.adapters.tts.base import TTSAdapter, TTSResult, estimate_duration_ms
+from src.adapters.tts.mp3 import mp3_duration_ms
+from src.config import get_settings
+from src.services.storage import StorageService
+
+logger = logging.getLogger(__name__)
+
+STORAGE_PREFIX = "tts-cache"
+
+
+def is_shared_audio_key(audio_key: str) -> bool:
+    """Whether audio_key is a shared phrase file rather than one turn's audio."""
+    return audio_key.startswith(f"{STORAGE_PREFIX}/")
+
+
+@dataclass
+class CachedPhrase:
+    """Synthesized phrase and where it is stored."""
+
+    audio_key: str
+    audio: bytes
+    format: str
+    duration_ms: int
+    provider: str
+
+
+class TTSPhraseCache:
+    """Content-addressed cache of synthesized phrases."""
+
+    def __init__(
+        self,
+        storage: Optional[StorageService] = None,
+        max_entries: int = 500,
+        learn_threshold: int = 3,
+    ):
+        """Initialize cache.
+
+        Args:
+            storage: Storage holding the phrase audio
+            max_entries: Phrases kept in memory, canned ones included
+            learn_threshold: Occurrences after which a text is cached
+        """
+        self.storage = storage or StorageService()
+        self.max_entries = max_entries
+        self.learn_threshold = learn_threshold
+        self._entries: OrderedDict[str, CachedPhrase] = OrderedDict()
+        self._pinned: set[str] = set()
+        self._counts: OrderedDict[str, int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        text: str,
+        language: str,
+        provider: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> str:
+        """Content address of a phrase."""
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (text.strip(), language, provider, voice or "", f"{speed:.2f}"):
+            digest.update(part.encode() + b"\x00")
+        return digest.hexdigest()
+
+    def _count(self, key: str) -> int:
+        """Count one occurrence of key; the counter table is bounded too."""
+        count = self._counts.pop(key, 0) + 1
+        self._counts[key] = count
+        while len(self._counts) > self.max_entries * 10:
+            self._counts.popitem(last=False)
+        return count
+
+    async def get(
+        self,
+        text: str,
+        language: str,
+        provider: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> Optional[CachedPhrase]:
+        """Look up a phrase and count it towards learning."""
+        key = self.key(text, language, provider, voice, speed)
+        phrase = self._entries.get(key)
+        if phrase is None and self._count(key) >= self.learn_threshold:
+            # Frequent text, maybe stored by an earlier process
+            phrase = await self._load(key, provider, estimate_duration_ms(text, speed))
+        if phrase is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return phrase
+
+    def should_store(
+        self,
+        text: str,
+        language: str,
+        provider: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> bool:
+        """Whether a freshly synthesized text has been seen often enough to cache."""
+        key = self.key(text, language, provider, voice, speed)
+        return self._counts.get(key, 0) >= self.learn_threshold
+
+    async def put(
+        self,
+        text: str,
+        language: str,
+        provider: str,
+        result: TTSResult,
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+        pinned: bool = False,
+    ) -> CachedPhrase:
+        """Store synthesized audio once and index it."""
+        key = self.key(text, language, provider, voice, speed)
+        audio_key = f"{STORAGE_PREFIX}/{provider}/{key}.{result.format}"
+        await self.storage.put_audio(
+            audio_key,
+            result.audio,
+            content_type="audio/wav" if result.format == "wav" else "audio/mpeg",
+        )
+        phrase = CachedPhrase(
+            audio_key=audio_key,
+            audio=result.audio,
+            format=result.format,
+            duration_ms=result.duration_ms,
+            provider=provider,
+        )
+        self._index(key, phrase, pinned)
+        return phrase
+
+    async def warm(
+        self,
+        phrases: dict[str, list[str]],
+        providers: list[str],
+        get_adapter: Callable[[str], TTSAdapter],
+    ) -> int:
+        """Synthesize (or load) canned phrases and pin them.
+
+        Args:
+            phrases: Texts by language
+            providers: TTS providers to warm
+            get_adapter: Returns the TTSAdapter of a provider
+
+        Returns:
+            Number of phrases synthesized (not found in storage)
+        """
+        synthesized = 0
+        with call_priority(Priority.BATCH):
+            for provider in providers:
+                try:
+                    synthesized += await self._warm_provider(get_adapter(provider), provider, phrases)
+                except Exception as e:
+                    logger.warning(f"TTS cache warm-up failed for {provider}: {e}")
+        return synthesized
+
+    async def _warm_provider(
+        self,
+        adapter: TTSAdapter,
+        provider: str,
+        phrases: dict[str, list[str]],
+    ) -> int:
+        synthesized = 0
+        for language, texts in phrases.items():
+            for text in texts:
+                key = self.key(text, language, provider)
+                phrase = self._entries.get(key) or await self._load(
+                    key, provider, estimate_duration_ms(text)
+                )
+                if phrase is None:
+                    result = await adapter.synthesize(text=text, language=language)
+                    await self.put(text, language, provider, result, pinned=True)
+                    synthesized += 1
+                else:
+                    self._index(key, phrase, pinned=True)
+        return synthesized
+
+    async def _load(self, key: str, provider: str, duration_ms: int) -> Optional[CachedPhrase]:
+        """Load a phrase stored earlier (MP3 or WAV) into the index.
+
+        MP3 duration is read from frame headers; duration_ms is the fallback.
+        """
+        for audio_format in ("mp3", "wav"):
+            audio_key = f"{STORAGE_PREFIX}/{provider}/{key}.{audio_format}"
+            audio = await self.storage.download_audio(audio_key)
+            if audio is not None:
+                phrase = CachedPhrase(
+                    audio_key=audio_key,
+                    audio=audio,
+                    format=audio_format,
+                    duration_ms=(audio_format == "mp3" and mp3_duration_ms(audio)) or duration_ms,
+                    provider=provider,
+                )
+                self._index(key, phrase, pinned=False)
+                return phrase
+        return None
+
+    def _index(self, key: str, phrase: CachedPhrase, pinned: bool) -> None:
+        self._entries[key] = phrase
+        self._entries.move_to_end(key)
+        if pinned:
+            self._pinned.add(key)
+        while len(self._entries) > self.max_entries:
+            evictable = next((k for k in self._entries if k not in self._pinned), None)
+            if evictable is None:
+                break
+            del self._entries[evictable]
+
+    def stats(self) -> dict:
+        """Hit/miss counters and index size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "pinned": len(self._pinned),
+        }
+
+
+_tts_phrase_cache: Optional[TTSPhraseCache] = None
+
+
+def get_tts_phrase_cache() -> TTSPhraseCache:
+    global _tts_phrase_cache
+    if _tts_phrase_cache is None:
+        settings = get_settings()
+        _tts_phrase_cache = TTSPhraseCache(
+            max_entries=settings.tts_phrase_cache_max_entries,
+            learn_threshold=settings.tts_phrase_cache_learn_threshold,
+        )
+    return _tts_phrase_cache
+
+
+async def warm_tts_phrase_cache() -> None:
+    """Warm the phrase cache with all canned LLMService replies (startup)."""
+    from src.services.llm import canned_responses
+    from src.services.voice_session import AdapterFactory
+
+    settings = get_settings()
+    started = time.perf_counter()
+    try:
+        synthesized = await get_tts_phrase_cache().warm(
+            phrases={language: canned_responses(language) for language in ("ru", "kk")},
+            providers=settings.tts_phrase_cache_warm_providers,
+            get_adapter=AdapterFactory.get_tts_adapter,
+        )
+    except Exception as e:
+        logger.warning(f"TTS cache warm-up failed: {e}")
+        return
+    logger.info(
+        f"TTS phrase cache warmed in {time.perf_counter() - started:.1f}s "
+        f"({synthesized} phrases synthesized)"
+    )
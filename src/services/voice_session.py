@@ -3,20 +3,43 @@
 Validates: Requirements 3.4, 3.5, 5.1, 5.2, 5.3, 5.4, 11.1
 """
 
+import asyncio
 import uuid
 import time
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Literal, Optional
 
-from sqlalchemy import select
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.stt.base import STTAdapter, STTResult
-from src.adapters.tts.base import TTSAdapter, TTSResult
+from src.adapters.registry import get_adapter_registry
+from src.adapters.routing import RoutedSTTAdapter, RoutedTTSAdapter, get_provider_router
+from src.adapters.stt.base import STTAdapter, STTResult, STTWord
+from src.adapters.stt.cached import CachedSTTAdapter, get_stt_cache
+from src.adapters.stt.chunked import ChunkedSTTAdapter
+from src.adapters.tts.base import TTSAdapter, TTSResult, estimate_duration_ms
+from src.adapters.tts.chunked import ChunkedTTSAdapter
+from src.adapters.tts.coalescing import CoalescingTTSAdapter, get_tts_single_flight
+from src.adapters.tts.mp3 import concat_mp3, mp3_duration_ms, mp3_frames
+from src.adapters.tts.sentences import split_sentences
+from src.audio_formats import FORMATS
+from src.models.database import async_session_maker
 from src.models.entities import User, Conversation, Turn
+from src.services.entity_context import EntityContext
+from src.services.audio_delivery import (
+    DeliveredAudio,
+    convert_audio,
+    deliver_audio,
+    negotiate_output_format,
+)
+from src.services.audio_preprocessing import PreprocessedAudio, preprocess_audio
 from src.services.normalization import NormalizationService, NormalizationResult
+from src.services.stage_graph import StageGraph
+from src.services.work_queue import Job, defer
 from src.services.storage import StorageService
+from src.services.tts_cache import get_tts_phrase_cache
 from src.config import get_settings
 
 
@@ -29,6 +52,7 @@ class ProcessAudioResult:
     normalized_transcript: str
     confidence: float
     stt_latency_ms: int
+    stage_timings_ms: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -38,24 +62,68 @@ class GenerateResponseResult:
     assistant_text: str
     audio_url: str
     tts_latency_ms: int
+    audio: bytes = field(default=b"", repr=False)
+    audio_format: str = "mp3"
+
+
+def _store_stt_words_job(turn_id: str, words: list[STTWord]) -> Job:
+    """Deferred job that stores word-level STT details on a turn."""
+
+    async def job(db: AsyncSession) -> None:
+        stt_words = [
+            {"word": w.word, "start": w.start, "end": w.end, "confidence": w.confidence}
+            for w in words
+        ]
+        await db.execute(update(Turn).where(Turn.id == turn_id).values(stt_words=stt_words))
+
+    return job
+
+
+def _create_pending_terms_job(
+    terms: list[str],
+    language: str,
+    context: Optional[str],
+    provider: Optional[str],
+) -> Job:
+    """Deferred job that records unknown terms for admin review."""
+
+    async def job(db: AsyncSession) -> None:
+        normalization = NormalizationService(db)
+        for term in terms:
+            await normalization.create_pending_term(
+                heard_variant=term,
+                language=language,
+                context=context,
+                provider=provider,
+            )
+
+    return job
 
 
 class AdapterFactory:
     """Factory for creating STT/TTS adapters based on provider name.
     
+    Inside the running app, adapters come from the process-wide
+    AdapterRegistry (shared connection pools). Outside of it (scripts,
+    tests) a new adapter is created per call.
+    
     Validates: Requirements 3.4, 3.5, 3.6
     """
 
     @staticmethod
     def get_stt_adapter(provider: Literal["openai", "google"]) -> STTAdapter:
         """Get STT adapter for provider.
-        
+
         Args:
             provider: Provider name
             
         Returns:
             STT adapter instance
         """
+        registry = get_adapter_registry()
+        if registry.started:
+            return registry.get_stt_adapter(provider)
+
         if provider == "openai":
             from src.adapters.stt.openai_adapter import OpenAISTTAdapter
             return OpenAISTTAdapter()
@@ -65,16 +133,34 @@ class AdapterFactory:
         else:
             raise ValueError(f"Unknown STT provider: {provider}")
 
+    @staticmethod
+    def get_hedged_stt_adapter(provider: Literal["openai", "google"]) -> STTAdapter:
+        """Get STT adapter for provider, hedged with the other provider.
+
+        Args:
+            provider: Primary provider name
+            
+        Returns:
+            HedgedSTTAdapter racing the other provider when the primary is slow
+        """
+        secondary = "google" if provider == "openai" else "openai"
+        # Always from the registry: the hedge delay learns from past requests
+        return get_adapter_registry().get_hedged_stt_adapter(provider, secondary)
+
     @staticmethod
     def get_tts_adapter(provider: Literal["openai", "google"]) -> TTSAdapter:
         """Get TTS adapter for provider.
-        
+
         Args:
             provider: Provider name
             
         Returns:
             TTS adapter instance
         """
+        registry = get_adapter_registry()
+        if registry.started:
+            return registry.get_tts_adapter(provider)
+
         if provider == "openai":
             from src.adapters.tts.openai_adapter import OpenAITTSAdapter
             return OpenAITTSAdapter()
@@ -84,6 +170,23 @@ class AdapterFactory:
         else:
             raise ValueError(f"Unknown TTS provider: {provider}")
 
+    @staticmethod
+    def get_chunked_tts_adapter(provider: Literal["openai", "google"]) -> TTSAdapter:
+        """Get TTS adapter for provider that synthesizes long text in pieces.
+
+        Args:
+            provider: Provider name
+            
+        Returns:
+            ChunkedTTSAdapter around the provider's adapter
+        """
+        settings = get_settings()
+        return ChunkedTTSAdapter(
+            AdapterFactory.get_tts_adapter(provider),
+            max_chars=settings.tts_chunk_max_chars,
+            concurrency=settings.tts_chunk_concurrency,
+        )
+
 
 class VoiceSessionService:
     """Service for managing voice sessions and processing pipeline.
@@ -91,13 +194,15 @@ class VoiceSessionService:
     Validates: Requirements 3.4, 3.5, 5.1, 5.2, 5.3, 5.4, 11.1
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, context: Optional[EntityContext] = None):
         """Initialize voice session service.
-        
+
         Args:
             db: Database session
+            context: Request-scoped entity context; a fresh one is created if omitted
         """
         self.db = db
+        self.context = context or EntityContext(db)
         self.settings = get_settings()
         self.storage = StorageService()
         self._normalization_service: Optional[NormalizationService] = None
@@ -111,9 +216,64 @@ class VoiceSessionService:
 
     async def get_user(self, user_id: str) -> Optional[User]:
         """Get user by ID."""
-        query = select(User).where(User.id == str(user_id))
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return await self.context.get_user(user_id)
+
+    def _get_stt_adapter(self, provider: str) -> STTAdapter:
+        """STT adapter for the pipeline: hedged or routed, chunked, cached.
+
+        Hedging and health routing both fail over to the other provider,
+        so only one of them is applied; stacked, one failure would be
+        retried by both and double the provider calls.
+        """
+        if self.settings.stt_hedging_enabled:
+            stt_adapter = AdapterFactory.get_hedged_stt_adapter(provider)
+        elif self.settings.provider_routing_enabled:
+            stt_adapter = RoutedSTTAdapter(
+                get_provider_router(), provider, AdapterFactory.get_stt_adapter
+            )
+        else:
+            stt_adapter = AdapterFactory.get_stt_adapter(provider)
+
+        if self.settings.stt_chunking_enabled:
+            stt_adapter = ChunkedSTTAdapter(
+                stt_adapter,
+                max_segment_seconds=self.settings.stt_chunk_max_seconds,
+                overlap_seconds=self.settings.stt_chunk_overlap_seconds,
+                concurrency=self.settings.stt_chunk_concurrency,
+            )
+        if self.settings.stt_cache_enabled:
+            stt_adapter = CachedSTTAdapter(stt_adapter, get_stt_cache())
+        return stt_adapter
+
+    def _get_tts_adapter(self, provider: str) -> TTSAdapter:
+        """TTS adapter for the pipeline: chunked, routed, identical concurrent calls coalesced."""
+        if self.settings.tts_chunking_enabled:
+            get_adapter = AdapterFactory.get_chunked_tts_adapter
+        else:
+            get_adapter = AdapterFactory.get_tts_adapter
+
+        if self.settings.provider_routing_enabled:
+            tts_adapter = RoutedTTSAdapter(get_provider_router(), provider, get_adapter)
+        else:
+            tts_adapter = get_adapter(provider)
+
+        if self.settings.tts_coalescing_enabled:
+            tts_adapter = CoalescingTTSAdapter(tts_adapter, get_tts_single_flight())
+        return tts_adapter
+
+    async def _get_turn_context(
+        self,
+        session_id: str,
+        turn_id: str,
+    ) -> tuple[Turn, Conversation, User]:
+        """Get turn with its conversation and user."""
+        turn = await self.context.get_turn(turn_id, conversation_id=session_id)
+        if not turn:
+            raise ValueError(f"Turn {turn_id} not found")
+
+        conversation = await self.context.get_conversation(session_id)
+        user = await self.context.get_user(conversation.user_id)
+        return turn, conversation, user
 
     async def create_session(
         self,
@@ -121,7 +281,7 @@ class VoiceSessionService:
         device_info: Optional[dict] = None,
     ) -> Conversation:
         """Create a new voice session.
-        
+
         Args:
             user_id: User ID
             device_info: Optional device information
@@ -144,6 +304,7 @@ class VoiceSessionService:
         )
         self.db.add(conversation)
         await self.db.flush()
+        self.context.add(conversation)
 
         # Update user last active
         user.last_active_at = datetime.utcnow()
@@ -158,7 +319,11 @@ class VoiceSessionService:
         user_id: str,
     ) -> ProcessAudioResult:
         """Process audio input through STT and normalization.
-        
+
+        Stages run through a StageGraph, so the storage upload and turn
+        creation overlap with the STT call. Per-stage timings are returned
+        in ProcessAudioResult.stage_timings_ms.
+
         Args:
             session_id: Conversation/session ID
             audio: Audio data as bytes
@@ -169,82 +334,120 @@ class VoiceSessionService:
             
         Validates: Requirements 3.4, 5.1, 5.2
         """
-        # Get user settings
-        user = await self.get_user(str(user_id))
-        if not user:
-            raise ValueError(f"User {user_id} not found")
-
-        # Get conversation
-        query = select(Conversation).where(Conversation.id == str(session_id))
-        result = await self.db.execute(query)
-        conversation = result.scalar_one_or_none()
-        if not conversation:
-            raise ValueError(f"Session {session_id} not found")
-
-        # Create turn
-        turn_number = await self._get_next_turn_number(str(session_id))
-        turn = Turn(
-            id=str(uuid.uuid4()),
-            conversation_id=str(session_id),
-            turn_number=turn_number,
-        )
-        self.db.add(turn)
-        await self.db.flush()
+        # Turn ID is allocated up front so the upload does not wait for the DB
+        turn_id = str(uuid.uuid4())
+
+        async def load_user(results: dict) -> User:
+            user = await self.get_user(str(user_id))
+            if not user:
+                raise ValueError(f"User {user_id} not found")
+            return user
+
+        async def load_conversation(results: dict) -> Conversation:
+            conversation = await self.context.get_conversation(session_id)
+            if not conversation:
+                raise ValueError(f"Session {session_id} not found")
+            return conversation
+
+        async def create_turn(results: dict) -> Turn:
+            turn_number = await self._get_next_turn_number(str(session_id))
+            turn = Turn(
+                id=turn_id,
+                conversation_id=str(session_id),
+                turn_number=turn_number,
+            )
+            self.db.add(turn)
+            await self.db.flush()
+            self.context.add(turn)
+            return turn
+
+        async def upload_input(results: dict) -> str:
+            return await self.storage.upload_audio(
+                audio=audio,
+                user_id=user_id,
+                conversation_id=session_id,
+                turn_id=turn_id,
+                file_type="input.wav",
+            )
 
-        # Upload audio to storage
-        audio_key = await self.storage.upload_audio(
-            audio=audio,
-            user_id=user_id,
-            conversation_id=session_id,
-            turn_id=turn.id,
-            file_type="input.wav",
-        )
-        turn.audio_input_url = audio_key
+        async def preprocess(results: dict) -> PreprocessedAudio:
+            if not self.settings.audio_preprocessing_enabled:
+                return PreprocessedAudio(audio=audio)
+            return await asyncio.to_thread(
+                preprocess_audio,
+                audio,
+                target_sample_rate=self.settings.audio_target_sample_rate,
+                threshold_db=self.settings.audio_vad_threshold_db,
+                padding_ms=self.settings.audio_vad_padding_ms,
+            )
 
-        # Get STT adapter based on user settings
-        stt_adapter = AdapterFactory.get_stt_adapter(user.stt_provider)
+        async def transcribe(results: dict) -> STTResult:
+            user = results["user"]
+            stt_adapter = self._get_stt_adapter(user.stt_provider)
+            return await stt_adapter.transcribe(
+                audio=results["preprocess"].audio,
+                language=user.language,
+            )
 
-        # Transcribe audio
-        stt_result = await stt_adapter.transcribe(
-            audio=audio,
-            language=user.language,
-        )
+        async def normalize(results: dict) -> NormalizationResult:
+            stt_result = results["stt"]
+            return await self.normalization.normalize(
+                text=stt_result.text,
+                language=results["user"].language,
+                stt_confidence=stt_result.confidence,
+            )
 
-        # Normalize transcript
-        norm_result = await self.normalization.normalize(
-            text=stt_result.text,
-            language=user.language,
-            stt_confidence=stt_result.confidence,
-        )
+        # STT needs the user's provider settings and the preprocessed audio,
+        # and waits for the conversation so an invalid session never costs a
+        # provider call; the upload (original audio) only needs a valid
+        # session. DB stages are serialized on the shared session.
+        graph = StageGraph()
+        graph.add("user", load_user, uses_db=True)
+        graph.add("conversation", load_conversation, uses_db=True)
+        graph.add("turn", create_turn, depends_on=("conversation",), uses_db=True)
+        graph.add("upload", upload_input, depends_on=("conversation",))
+        graph.add("preprocess", preprocess)
+        graph.add("stt", transcribe, depends_on=("user", "conversation", "preprocess"))
+        graph.add("normalize", normalize, depends_on=("user", "stt"), uses_db=True)
+        results = await graph.run()
+
+        user: User = results["user"]
+        turn: Turn = results["turn"]
+        stt_result: STTResult = results["stt"]
+        norm_result: NormalizationResult = results["normalize"]
 
         # Update turn with results
+        turn.audio_input_url = results["upload"]
+        turn.audio_input_duration_ms = results["preprocess"].original_duration_ms
         turn.raw_transcript = norm_result.raw_transcript
         turn.normalized_transcript = norm_result.normalized_transcript
         turn.transcript_confidence = stt_result.confidence
         turn.stt_latency_ms = stt_result.latency_ms
-        turn.stt_words = [
-            {"word": w.word, "start": w.start, "end": w.end, "confidence": w.confidence}
-            for w in stt_result.words
-        ]
+        turn.stt_provider_used = stt_result.provider or user.stt_provider
         turn.low_confidence = stt_result.confidence < self.settings.normalization_confidence_threshold
 
-        # Create pending unknown terms
-        for term in norm_result.unknown_terms_created:
-            await self.normalization.create_pending_term(
-                heard_variant=term,
-                language=user.language,
-                context=norm_result.raw_transcript,
-                provider=user.stt_provider,
-            )
-
         await self.db.flush()
 
+        # Bookkeeping runs after the response is sent (see work_queue)
+        await defer(self.db, _store_stt_words_job(turn_id, stt_result.words))
+        if norm_result.unknown_terms_created:
+            await defer(
+                self.db,
+                _create_pending_terms_job(
+                    terms=list(norm_result.unknown_terms_created),
+                    language=user.language,
+                    context=norm_result.raw_transcript,
+                    provider=user.stt_provider,
+                ),
+            )
+
         return ProcessAudioResult(
             turn_id=turn.id,
             raw_transcript=norm_result.raw_transcript,
             normalized_transcript=norm_result.normalized_transcript,
             confidence=stt_result.confidence,
             stt_latency_ms=stt_result.latency_ms,
+            stage_timings_ms=dict(graph.timings_ms),
         )
 
     async def confirm_transcript(
@@ -255,7 +458,7 @@ class VoiceSessionService:
         correction: Optional[str] = None,
     ) -> None:
         """Confirm or correct transcript.
-        
+
         Args:
             session_id: Conversation ID
             turn_id: Turn ID
@@ -264,32 +467,28 @@ class VoiceSessionService:
             
         Validates: Requirements 2.3, 2.4, 2.6, 5.5
         """
-        query = select(Turn).where(Turn.id == str(turn_id), Turn.conversation_id == str(session_id))
-        result = await self.db.execute(query)
-        turn = result.scalar_one_or_none()
+        turn = await self.context.get_turn(turn_id, conversation_id=session_id)
         if not turn:
             raise ValueError(f"Turn {turn_id} not found")
 
         turn.user_confirmed = confirmed
-        
+
         if correction:
             turn.user_correction = correction
             # Save correction to dictionary
-            conv_query = select(Conversation).where(Conversation.id == str(session_id))
-            conv_result = await self.db.execute(conv_query)
-            conversation = conv_result.scalar_one()
-            
-            user_query = select(User).where(User.id == str(conversation.user_id))
-            user_result = await self.db.execute(user_query)
-            user = user_result.scalar_one()
+            conversation = await self.context.get_conversation(session_id)
+            user = await self.context.get_user(conversation.user_id)
 
             # Create term from correction
             if turn.raw_transcript and correction != turn.raw_transcript:
-                await self.normalization.create_pending_term(
-                    heard_variant=turn.raw_transcript,
-                    language=user.language,
-                    context=correction,
-                    provider=conversation.stt_provider_used,
+                await defer(
+                    self.db,
+                    _create_pending_terms_job(
+                        terms=[turn.raw_transcript],
+                        language=user.language,
+                        context=correction,
+                        provider=conversation.stt_provider_used,
+                    ),
                 )
 
         await self.db.flush()
@@ -299,92 +498,279 @@ class VoiceSessionService:
         session_id: str,
         turn_id: str,
         assistant_text: str,
+        accept: Optional[str] = None,
     ) -> GenerateResponseResult:
         """Generate TTS response for assistant text.
-        
+
+        The audio is delivered as Opus/OGG or MP3, negotiated from the
+        Accept header or the session's device_info; the negotiated variant
+        is what gets stored on the turn.
+
         Args:
             session_id: Conversation ID
             turn_id: Turn ID
             assistant_text: Text to synthesize
+            accept: Client Accept header, if any
             
         Returns:
             GenerateResponseResult with audio URL
             
         Validates: Requirements 3.5, 5.3
         """
-        # Get turn
-        query = select(Turn).where(Turn.id == str(turn_id), Turn.conversation_id == str(session_id))
-        result = await self.db.execute(query)
-        turn = result.scalar_one_or_none()
-        if not turn:
-            raise ValueError(f"Turn {turn_id} not found")
-
-        # Get conversation and user
-        conv_query = select(Conversation).where(Conversation.id == str(session_id))
-        conv_result = await self.db.execute(conv_query)
-        conversation = conv_result.scalar_one()
-
-        user_query = select(User).where(User.id == str(conversation.user_id))
-        user_result = await self.db.execute(user_query)
-        user = user_result.scalar_one()
+        # Get turn, conversation and user
+        turn, conversation, user = await self._get_turn_context(session_id, turn_id)
 
         # Get TTS adapter
-        tts_adapter = AdapterFactory.get_tts_adapter(user.tts_provider)
+        tts_adapter = self._get_tts_adapter(user.tts_provider)
 
-        # Synthesize speech
-        tts_result = await tts_adapter.synthesize(
+        # Synthesize speech (cached phrases come with their shared audio key)
+        tts_result, audio_key = await self._synthesize_phrase(
+            tts_adapter,
             text=assistant_text,
             language=user.language,
+            provider=user.tts_provider,
         )
 
-        # Upload audio - use format from TTS result
-        file_ext = "wav" if tts_result.format == "wav" else "mp3"
-        content_type = "audio/wav" if tts_result.format == "wav" else "audio/mpeg"
-        audio_key = await self.storage.upload_audio(
-            audio=tts_result.audio,
-            user_id=user.id,
-            conversation_id=session_id,
-            turn_id=turn_id,
-            file_type=f"output.{file_ext}",
-            content_type=content_type,
-        )
+        output_format = negotiate_output_format(accept, conversation.device_info)
+        if audio_key is None:
+            # Only the negotiated variant of a turn's own audio is stored
+            audio, audio_format = await convert_audio(tts_result.audio, output_format)
+            delivered = DeliveredAudio(
+                audio_key=await self.storage.upload_audio(
+                    audio=audio,
+                    user_id=user.id,
+                    conversation_id=session_id,
+                    turn_id=turn_id,
+                    file_type=f"output.{audio_format}",
+                    content_type=FORMATS[audio_format],
+                ),
+                audio=audio,
+                format=audio_format,
+            )
+        else:
+            # Shared phrase: other formats are cached next to it
+            delivered = await deliver_audio(
+                self.storage, audio_key, tts_result.audio, output_format
+            )
 
         # Update turn
         turn.assistant_text = assistant_text
-        turn.audio_output_url = audio_key
+        turn.audio_output_url = delivered.audio_key
         turn.audio_output_duration_ms = tts_result.duration_ms
         turn.tts_latency_ms = tts_result.latency_ms
+        turn.tts_provider_used = tts_result.provider or user.tts_provider
 
         await self.db.flush()
 
         # Generate signed URL
-        audio_url = self.storage.generate_signed_url(audio_key)
+        audio_url = self.storage.generate_signed_url(delivered.audio_key)
 
         return GenerateResponseResult(
             assistant_text=assistant_text,
             audio_url=audio_url,
             tts_latency_ms=tts_result.latency_ms,
+            audio=delivered.audio,
+            audio_format=delivered.format,
+        )
+
+    async def _synthesize_phrase(
+        self,
+        tts_adapter: TTSAdapter,
+        text: str,
+        language: str,
+        provider: str,
+    ) -> tuple[TTSResult, Optional[str]]:
+        """Synthesize text, answering canned and frequent phrases from the phrase cache.
+
+        Returns:
+            TTS result and, for cached phrases, the storage key of the
+            shared audio (None when the caller must upload it)
+        """
+        if not self.settings.tts_phrase_cache_enabled:
+            return await tts_adapter.synthesize(text=text, language=language), None
+
+        start_time = time.perf_counter()
+        phrase_cache = get_tts_phrase_cache()
+        phrase = await phrase_cache.get(text, language, provider)
+        if phrase is not None:
+            return TTSResult(
+                audio=phrase.audio,
+                format=phrase.format,
+                duration_ms=phrase.duration_ms,
+                latency_ms=int((time.perf_counter() - start_time) * 1000),
+                provider=phrase.provider,
+            ), phrase.audio_key
+
+        tts_result = await tts_adapter.synthesize(text=text, language=language)
+        # Failed-over audio has another voice; only cache the requested provider
+        if tts_result.provider in (None, provider) and phrase_cache.should_store(
+            text, language, provider
+        ):
+            phrase = await phrase_cache.put(text, language, provider, tts_result)
+            return tts_result, phrase.audio_key
+        return tts_result, None
+
+    async def _stream_phrase(
+        self,
+        tts_adapter: TTSAdapter,
+        text: str,
+        language: str,
+        provider: str,
+    ) -> AsyncIterator[bytes]:
+        """Stream synthesized text as it arrives; cached phrases are sent whole."""
+        if self.settings.tts_phrase_cache_enabled:
+            phrase = await get_tts_phrase_cache().get(text, language, provider)
+            if phrase is not None:
+                yield phrase.audio
+                return
+        async for chunk in tts_adapter.synthesize_stream(text=text, language=language):
+            yield chunk
+
+    async def stream_response(
+        self,
+        session_id: str,
+        turn_id: str,
+        assistant_text: str,
+    ) -> AsyncIterator[bytes]:
+        """Synthesize assistant text sentence by sentence and stream the audio.
+
+        The first sentence is forwarded chunk by chunk as the provider
+        streams it; the others are synthesized concurrently meanwhile
+        (bounded by tts_stream_concurrency) and yielded in order as MP3
+        segments, so playback starts with the first chunk of speech.
+        The assistant text is saved on the turn right away; once the stream
+        finishes, the combined file is uploaded and stored as
+        Turn.audio_output_url. The caller must commit the current session
+        before iterating, because the final update uses its own session.
+
+        Args:
+            session_id: Conversation ID
+            turn_id: Turn ID
+            assistant_text: Text to synthesize
+            
+        Returns:
+            Async iterator of MP3 audio segments
+        """
+        turn, conversation, user = await self._get_turn_context(session_id, turn_id)
+
+        turn.assistant_text = assistant_text
+        await self.db.flush()
+
+        tts_adapter = self._get_tts_adapter(user.tts_provider)
+        sentences = split_sentences(assistant_text) or [assistant_text]
+
+        return self._stream_sentences(
+            tts_adapter=tts_adapter,
+            sentences=sentences,
+            language=user.language,
+            provider=user.tts_provider,
+            user_id=user.id,
+            session_id=str(session_id),
+            turn_id=str(turn_id),
+        )
+
+    async def _stream_sentences(
+        self,
+        tts_adapter: TTSAdapter,
+        sentences: list[str],
+        language: str,
+        provider: str,
+        user_id: str,
+        session_id: str,
+        turn_id: str,
+    ) -> AsyncIterator[bytes]:
+        """Synthesize sentences concurrently, yield in order, then persist."""
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.settings.tts_stream_concurrency)
+
+        async def synthesize(sentence: str) -> TTSResult:
+            async with semaphore:
+                tts_result, _ = await self._synthesize_phrase(
+                    tts_adapter, text=sentence, language=language, provider=provider
+                )
+                return tts_result
+
+        tasks = [asyncio.create_task(synthesize(sentence)) for sentence in sentences[1:]]
+        results: list[TTSResult] = []
+        first_audio_ms = 0
+        try:
+            # First sentence is forwarded chunk by chunk as the provider sends it
+            chunks: list[bytes] = []
+            async for chunk in self._stream_phrase(tts_adapter, sentences[0], language, provider):
+                if not chunks:
+                    first_audio_ms = int((time.perf_counter() - start_time) * 1000)
+                chunks.append(chunk)
+                yield chunk
+            first_audio = b"".join(chunks)
+            results.append(TTSResult(
+                audio=first_audio,
+                format="mp3",
+                duration_ms=mp3_duration_ms(first_audio) or estimate_duration_ms(sentences[0]),
+                latency_ms=first_audio_ms,
+            ))
+
+            for task in tasks:
+                tts_result = await task
+                results.append(tts_result)
+                # Frames only, so the stream stays one MP3 without tags midway
+                yield mp3_frames(tts_result.audio)
+        finally:
+            # Client went away or a sentence failed - stop remaining synthesis
+            for task in tasks:
+                task.cancel()
+
+        audio = concat_mp3(r.audio for r in results)
+        audio_key = await self.storage.upload_audio(
+            audio=audio,
+            user_id=user_id,
+            conversation_id=session_id,
+            turn_id=turn_id,
+            file_type="output.mp3",
+            content_type="audio/mpeg",
         )
 
+        # tts_latency_ms is time to first audio - what the user actually waits
+        async with async_session_maker() as db:
+            await db.execute(
+                update(Turn)
+                .where(Turn.id == turn_id)
+                .values(
+                    audio_output_url=audio_key,
+                    audio_output_duration_ms=(
+                        mp3_duration_ms(audio) or sum(r.duration_ms for r in results)
+                    ),
+                    tts_latency_ms=first_audio_ms,
+                    tts_provider_used=next((r.provider for r in results if r.provider), provider),
+                )
+            )
+            await db.commit()
+
     async def end_session(self, session_id: str) -> None:
         """End a voice session.
-        
+
         Args:
             session_id: Conversation ID
         """
-        query = select(Conversation).where(Conversation.id == str(session_id))
-        result = await self.db.execute(query)
-        conversation = result.scalar_one_or_none()
+        conversation = await self.context.get_conversation(session_id)
         if conversation:
             conversation.ended_at = datetime.utcnow()
             await self.db.flush()
 
     async def _get_next_turn_number(self, session_id: str) -> int:
-        """Get next turn number for session."""
-        query = select(Turn).where(Turn.conversation_id == str(session_id))
+        """Allocate next turn number for session.
+
+        Increments Conversation.turn_count in a single UPDATE ... RETURNING,
+        which takes a row lock, so concurrent uploads never get the same
+        number and the cost does not grow with conversation length.
+        """
+        query = (
+            update(Conversation)
+            .where(Conversation.id == str(session_id))
+            .values(turn_count=Conversation.turn_count + 1)
+            .returning(Conversation.turn_count)
+        )
         result = await self.db.execute(query)
-        turns = result.scalars().all()
-        return len(turns) + 1
+        return result.scalar_one()
 
     async def create_turn_from_text(
         self,
@@ -393,7 +779,7 @@ class VoiceSessionService:
         text: str,
     ) -> str:
         """Create a turn from browser-transcribed text.
-        
+
         Args:
             session_id: Conversation/session ID
             user_id: User ID
@@ -403,9 +789,7 @@ class VoiceSessionService:
             Turn ID
         """
         # Get conversation
-        query = select(Conversation).where(Conversation.id == str(session_id))
-        result = await self.db.execute(query)
-        conversation = result.scalar_one_or_none()
+        conversation = await self.context.get_conversation(session_id)
         if not conversation:
             raise ValueError(f"Session {session_id} not found")
 
@@ -422,5 +806,6 @@ class VoiceSessionService:
         )
         self.db.add(turn)
         await self.db.flush()
+        self.context.add(turn)
 
         return turn.id
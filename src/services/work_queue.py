@@ -0,0 +1,184 @@
+"""Deferred work queue for non-critical pipeline writes.
+
+Bookkeeping writes (pending unknown terms, Turn.stt_words) are registered with ``defer()`` during a request and handed to an
+in-process background worker only after the request's transaction commits.
+The worker runs them in batches, one DB session and one commit per batch,
+so the user-facing response never waits on them.
+
+Back-pressure: the queue is bounded. ``defer()`` reserves a slot before
+registering a job and waits when all slots are taken, so a slow database
+slows producers down instead of growing memory without limit.
+
+The worker starts on first use, so the queue also works in scripts and
+apps built without the lifespan; those should ``await stop()`` before
+exiting so queued jobs still run.
+
+Crash safety: jobs live only in process memory.
+- Jobs of a request whose transaction rolls back are dropped with it.
+- On graceful shutdown the lifespan calls ``stop()``, which drains the queue.
+- On a hard crash (SIGKILL, OOM) queued jobs are lost. Only put writes here
+  whose loss is acceptable; turns and audit log rows are never written
+  through this queue.
+- Each job runs in its own savepoint, so one failing job does not roll back
+  the rest of its batch.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import get_settings
+from src.models.database import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[AsyncSession], Awaitable[None]]
+
+
+class WorkQueue:
+    """Bounded in-process queue with a batching background worker."""
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        batch_size: int = 50,
+        session_maker: async_sessionmaker = async_session_maker,
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.session_maker = session_maker
+        self._queue: asyncio.Queue[Job] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max_size)
+        self._worker: Optional[asyncio.Task] = None
+        self.processed_count = 0
+        self.failed_count = 0
+
+    @property
+    def size(self) -> int:
+        """Number of jobs waiting to run."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the background worker."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="work-queue")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Drain queued jobs (up to timeout) and stop the worker."""
+        if self._worker is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Work queue stopped with {self.size} jobs not run")
+        self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
+        self._worker = None
+
+    async def reserve(self) -> None:
+        """Reserve a queue slot, waiting while the queue is full.
+
+        Starts the worker if it is not running, so a full queue always drains.
+        """
+        self.start()
+        await self._slots.acquire()
+
+    def release(self, count: int = 1) -> None:
+        """Give back reserved slots of jobs that will not run."""
+        for _ in range(count):
+            self._slots.release()
+
+    def put_reserved(self, job: Job) -> None:
+        """Enqueue a job whose slot was already reserved."""
+        self._queue.put_nowait(job)
+
+    async def submit(self, job: Job) -> None:
+        """Enqueue a job that does not depend on an open transaction."""
+        await self.reserve()
+        self.put_reserved(job)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._run_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                self.release(len(batch))
+
+    async def _run_batch(self, batch: list[Job]) -> None:
+        try:
+            async with self.session_maker() as db:
+                for job in batch:
+                    try:
+                        async with db.begin_nested():
+                            await job(db)
+                        self.processed_count += 1
+                    except Exception as e:
+                        self.failed_count += 1
+                        logger.error(f"Deferred job failed: {e}")
+                await db.commit()
+        except Exception as e:
+            self.failed_count += len(batch)
+            logger.error(f"Deferred batch of {len(batch)} jobs lost: {e}")
+
+
+async def defer(db: AsyncSession, job: Job) -> None:
+    """Run job in the background after db's current transaction commits.
+
+    Waits for a free queue slot first (back-pressure). If the transaction
+    rolls back, the job is dropped.
+
+    Args:
+        db: Request database session
+        job: Async function taking its own AsyncSession
+    """
+    queue = get_work_queue()
+    await queue.reserve()
+    if not db.in_transaction():
+        # Tie the job to a transaction so rollback and close release its slot
+        await db.begin()
+
+    pending: Optional[list[Job]] = db.info.get("deferred_jobs")
+    if pending is None:
+        pending = db.info["deferred_jobs"] = []
+
+        def on_commit(session) -> None:
+            if session.get_nested_transaction() is not None:
+                return  # savepoint released, outer transaction still open
+            jobs = list(pending)
+            pending.clear()
+            for deferred_job in jobs:
+                queue.put_reserved(deferred_job)
+
+        def on_transaction_end(session, transaction) -> None:
+            if transaction.parent is None and pending:
+                # Outer transaction ended without commit
+                queue.release(len(pending))
+                pending.clear()
+
+        event.listen(db.sync_session, "after_commit", on_commit)
+        event.listen(db.sync_session, "after_transaction_end", on_transaction_end)
+
+    pending.append(job)
+
+
+_work_queue: Optional[WorkQueue] = None
+
+
+def get_work_queue() -> WorkQueue:
+    global _work_queue
+    if _work_queue is None:
+        settings = get_settings()
+        _work_queue = WorkQueue(
+            max_size=settings.work_queue_max_size,
+            batch_size=settings.work_queue_batch_size,
+        )
+    return _work_queue
@@ -0,0 +1,192 @@
+"""Tests for health-aware provider routing and circuit breakers.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 12.1, 12.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+
+import pytest
+
+from src.adapters.routing import ProviderHealth, ProviderRouter, RoutedSTTAdapter
+from src.adapters.stt.base import STTAdapter, STTError, STTInvalidAudioError, STTResult
+
+
+class FakeSTTAdapter(STTAdapter):
+    def __init__(self, name: str, fail: bool = False, error: type[STTError] = STTError):
+        self.name = name
+        self.fail = fail
+        self.error = error
+        self.calls = 0
+        self.block: asyncio.Event | None = None
+
+    async def transcribe(self, audio, language="ru", hints=None):
+        self.calls += 1
+        if self.block is not None:
+            await self.block.wait()
+        if self.fail:
+            raise self.error("down", self.name)
+        return STTResult(text=self.name, confidence=0.9)
+
+    def get_provider_name(self):
+        return self.name
+
+
+def _router(**options) -> ProviderRouter:
+    options.setdefault("min_calls", 4)
+    options.setdefault("cooldown_seconds", 60)
+    return ProviderRouter(**options)
+
+
+class TestProviderHealth:
+    """Circuit opens on errors or slow p95 and recovers via half-open probe."""
+
+    def test_opens_on_error_rate(self):
+        health = ProviderHealth(min_calls=4, error_rate_threshold=0.5)
+        for success in (True, False, True, False):
+            health.record(success, 100)
+
+        assert health.state == "open"
+        assert not health.is_available()
+
+    def test_opens_on_slow_p95(self):
+        health = ProviderHealth(min_calls=4, latency_threshold_ms=1000)
+        for latency_ms in (100, 200, 5000, 6000):
+            health.record(True, latency_ms)
+
+        assert health.state == "open"
+
+    def test_half_open_probe_closes_circuit(self):
+        health = ProviderHealth(min_calls=2, cooldown_seconds=0)
+        health.record(False, 100)
+        health.record(False, 100)
+        assert health.state == "open"
+
+        assert health.is_available()
+        assert health.state == "open"  # checking does not claim the probe
+        assert health.acquire()
+        assert health.state == "half_open"
+        assert not health.is_available()
+        assert not health.acquire()  # only one probe at a time
+
+        health.record(True, 100)
+        assert health.state == "closed"
+        assert health.error_rate == 0.0
+
+
+class TestProviderRouter:
+    """Ordering never claims the probe; the call that uses it does."""
+
+    async def test_open_circuit_recovers_after_order(self):
+        adapters = {
+            "openai": FakeSTTAdapter("openai", fail=True),
+            "google": FakeSTTAdapter("google"),
+        }
+        router = _router(cooldown_seconds=0)
+        routed = RoutedSTTAdapter(router, "openai", adapters.__getitem__)
+        for _ in range(4):
+            await routed.transcribe(b"audio")
+        assert router.health("stt", "openai").state == "open"
+
+        for _ in range(3):
+            assert router.order("stt", "openai") == ["openai", "google"]
+        assert router.health("stt", "openai").state == "open"
+
+        adapters["openai"].fail = False
+        result = await routed.transcribe(b"audio")
+
+        assert result.provider == "openai"
+        assert router.health("stt", "openai").state == "closed"
+
+    async def test_cancelled_probe_is_released(self):
+        adapters = {"openai": FakeSTTAdapter("openai"), "google": FakeSTTAdapter("google")}
+        router = _router(min_calls=1, cooldown_seconds=0)
+        router.record("stt", "openai", False, 100)
+        adapters["openai"].block = asyncio.Event()
+        routed = RoutedSTTAdapter(router, "openai", adapters.__getitem__)
+
+        task = asyncio.create_task(routed.transcribe(b"audio"))
+        await asyncio.sleep(0)
+        assert router.health("stt", "openai").state == "half_open"
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert router.health("stt", "openai").state == "open"
+        assert router.health("stt", "openai").is_available()
+
+    async def test_concurrent_calls_skip_provider_during_probe(self):
+        adapters = {"openai": FakeSTTAdapter("openai"), "google": FakeSTTAdapter("google")}
+        router = _router(min_calls=1, cooldown_seconds=0)
+        router.record("stt", "openai", False, 100)
+        adapters["openai"].block = asyncio.Event()
+        routed = RoutedSTTAdapter(router, "openai", adapters.__getitem__)
+
+        probe = asyncio.create_task(routed.transcribe(b"audio"))
+        await asyncio.sleep(0)
+        concurrent = await routed.transcribe(b"audio")
+
+        assert concurrent.provider == "google"
+        assert adapters["openai"].calls == 1
+        assert router.health("stt", "openai").state == "half_open"
+
+        adapters["openai"].block.set()
+        assert (await probe).provider == "openai"
+        assert router.health("stt", "openai").state == "closed"
+
+    async def test_client_errors_do_not_open_circuit(self):
+        adapters = {
+            "openai": FakeSTTAdapter("openai", fail=True, error=STTInvalidAudioError),
+            "google": FakeSTTAdapter("google"),
+        }
+        router = _router()
+        routed = RoutedSTTAdapter(router, "openai", adapters.__getitem__)
+
+        for _ in range(6):
+            await routed.transcribe(b"audio")
+
+        assert router.health("stt", "openai").state == "closed"
+        assert adapters["openai"].calls == 6
+
+
+class TestRoutedSTTAdapter:
+    """Calls go to a healthy provider and record which one answered."""
+
+    async def test_preferred_provider_is_used(self):
+        adapters = {"openai": FakeSTTAdapter("openai"), "google": FakeSTTAdapter("google")}
+        routed = RoutedSTTAdapter(_router(), "google", adapters.__getitem__)
+
+        result = await routed.transcribe(b"audio")
+
+        assert result.provider == "google"
+        assert adapters["openai"].calls == 0
+
+    async def test_failing_provider_fails_over_then_is_skipped(self):
+        adapters = {
+            "openai": FakeSTTAdapter("openai"),
+            "google": FakeSTTAdapter("google", fail=True),
+        }
+        router = _router()
+        routed = RoutedSTTAdapter(router, "google", adapters.__getitem__)
+
+        for _ in range(6):
+            result = await routed.transcribe(b"audio")
+            assert result.provider == "openai"
+
+        assert router.health("stt", "google").state == "open"
+        assert adapters["google"].calls == 4
+
+    async def test_all_failing_raises(self):
+        adapters = {
+            "openai": FakeSTTAdapter("openai", fail=True),
+            "google": FakeSTTAdapter("google", fail=True),
+        }
+        routed = RoutedSTTAdapter(_router(), "openai", adapters.__getitem__)
+
+        with pytest.raises(STTError):
+            await routed.transcribe(b"audio")
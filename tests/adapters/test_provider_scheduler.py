@@ -0,0 +1,210 @@
+"""Tests for the provider call scheduler.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 12.1, 12.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.adapters.scheduler import (
+    Priority,
+    ProviderLimiter,
+    ProviderScheduler,
+    call_priority,
+    retry_after_seconds,
+)
+from src.adapters.stt.base import STTError, STTRateLimitError
+from src.adapters.stt.google_adapter import GoogleSTTAdapter
+from src.emulator import EmulatorConfig, EndpointProfile, create_emulator_app
+
+
+class TestProviderLimiter:
+    """Token bucket serves interactive calls first."""
+
+    async def test_interactive_waiters_are_served_before_batch(self):
+        limiter = ProviderLimiter(rate=50, burst=1, batch_reserve=0)
+        await limiter.acquire()  # drain the bucket
+        order = []
+
+        async def call(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        tasks = [asyncio.create_task(call(f"batch{i}", Priority.BATCH)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("live", Priority.INTERACTIVE)))
+        await asyncio.gather(*tasks)
+
+        assert order[0] == "live"
+        assert order[1:] == ["batch0", "batch1", "batch2"]
+
+    async def test_batch_calls_leave_reserve_for_interactive(self):
+        limiter = ProviderLimiter(rate=0.01, burst=10, batch_reserve=0.3)
+
+        for _ in range(7):
+            await asyncio.wait_for(limiter.acquire(Priority.BATCH), 0.1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(Priority.BATCH), 0.05)
+
+        for _ in range(3):
+            await asyncio.wait_for(limiter.acquire(Priority.INTERACTIVE), 0.1)
+
+    async def test_pause_blocks_tokens(self):
+        limiter = ProviderLimiter(rate=1000, burst=5)
+        limiter.pause(0.1)
+
+        started = asyncio.get_running_loop().time()
+        await limiter.acquire()
+
+        assert asyncio.get_running_loop().time() - started >= 0.09
+
+
+class TestProviderScheduler:
+    """Calls are queued per provider and 429s are waited out."""
+
+    async def test_rate_limited_call_is_retried_after_retry_after(self):
+        scheduler = ProviderScheduler({"openai": 1000}, max_retries=2)
+        attempts = []
+
+        async def call():
+            attempts.append(asyncio.get_running_loop().time())
+            if len(attempts) == 1:
+                raise STTRateLimitError("slow down", "openai", {"retry_after": 0.1})
+            return "ok"
+
+        assert await scheduler.run("openai", call) == "ok"
+        assert attempts[1] - attempts[0] >= 0.09
+        assert scheduler.stats()["openai"]["rate_limited"] == 1
+
+    async def test_long_retry_after_is_raised(self):
+        scheduler = ProviderScheduler({"groq": 1000}, max_retry_after_seconds=1)
+        request = httpx.Request("POST", "http://groq/chat/completions")
+        response = httpx.Response(429, headers={"Retry-After": "30"}, request=request)
+
+        async def call():
+            response.raise_for_status()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await scheduler.run("groq", call)
+        assert scheduler.limiter("groq").stats()["paused_for_s"] > 29
+
+    async def test_priority_follows_context_into_tasks(self):
+        scheduler = ProviderScheduler({"openai": 1000})
+
+        async def call():
+            return "ok"
+
+        with call_priority(Priority.BATCH):
+            await asyncio.gather(*(scheduler.run("openai", call) for _ in range(2)))
+        await scheduler.run("openai", call)
+
+        stats = scheduler.stats()["openai"]
+        assert stats["calls"] == 3
+        assert "queue_ms_batch" in stats
+        assert "queue_ms_interactive" in stats
+
+    async def test_transient_errors_are_retried_with_backoff(self):
+        scheduler = ProviderScheduler({}, transient_retries=2, backoff_seconds=0.05)
+        request = httpx.Request("POST", "http://openai/v1/audio/speech")
+        attempts = []
+
+        async def call():
+            attempts.append(asyncio.get_running_loop().time())
+            if len(attempts) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            if len(attempts) == 2:
+                httpx.Response(503, request=request).raise_for_status()
+            return "ok"
+
+        assert await scheduler.run("openai", call) == "ok"
+        assert len(attempts) == 3
+        assert attempts[2] - attempts[1] > attempts[1] - attempts[0]
+        assert scheduler.stats()["openai"]["retried"] == 2
+
+    async def test_client_errors_and_exhausted_retries_are_raised(self):
+        scheduler = ProviderScheduler({}, transient_retries=1, backoff_seconds=0.01)
+        request = httpx.Request("POST", "http://openai/v1/audio/speech")
+        calls = {"400": 0, "500": 0}
+
+        async def call(status_code: int):
+            calls[str(status_code)] += 1
+            httpx.Response(status_code, request=request).raise_for_status()
+
+        for status_code in (400, 500):
+            with pytest.raises(httpx.HTTPStatusError):
+                await scheduler.run("openai", lambda: call(status_code))
+
+        assert calls == {"400": 1, "500": 2}
+
+    async def test_timeouts_are_not_retried(self):
+        scheduler = ProviderScheduler({}, transient_retries=2, backoff_seconds=0.01)
+        request = httpx.Request("POST", "http://openrouter/api/v1/audio/transcriptions")
+        calls = []
+
+        async def call():
+            calls.append(1)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        with pytest.raises(httpx.ReadTimeout):
+            await scheduler.run("openrouter", call)
+
+        assert len(calls) == 1
+
+    def test_zero_rate_and_default_settings_disable_throttling(self):
+        from src.config import Settings
+
+        scheduler = ProviderScheduler({"openai": 0})
+
+        assert scheduler.limiter("openai") is None
+        assert Settings.model_fields["provider_rate_limits"].default == {}
+
+    async def test_unlimited_provider_runs_directly(self):
+        scheduler = ProviderScheduler({})
+
+        async def call():
+            return 42
+
+        assert await scheduler.run("edge", call) == 42
+        assert scheduler.limiter("edge") is None
+
+
+class TestAdapterServerErrors:
+    """httpx-based adapters raise 5xx so the scheduler retries them."""
+
+    async def test_google_stt_retries_5xx_then_reports_status(self, monkeypatch):
+        from src.adapters.stt import google_adapter
+
+        scheduler = ProviderScheduler({}, transient_retries=2, backoff_seconds=0.01)
+        monkeypatch.setattr(google_adapter, "get_provider_scheduler", lambda: scheduler)
+        config = EmulatorConfig(transcription=EndpointProfile(latency_p50_ms=0, error_rate=1.0))
+        transport = httpx.ASGITransport(app=create_emulator_app(config))
+        adapter = GoogleSTTAdapter(http_client=httpx.AsyncClient(transport=transport))
+        adapter.api_key = "test"
+        adapter.base_url = "http://emulator/v1"
+
+        with pytest.raises(STTError) as error:
+            await adapter.transcribe(b"ID3" + b"\x00" * 64)
+
+        assert error.value.details["status_code"] == 500
+        assert scheduler.stats()["openrouter"]["retried"] == 2
+
+
+class TestRetryAfter:
+    """Retry-After header parsing."""
+
+    def test_seconds_and_milliseconds(self):
+        assert retry_after_seconds(httpx.Headers({"Retry-After": "3"})) == 3.0
+        assert retry_after_seconds(httpx.Headers({"retry-after-ms": "250"})) == 0.25
+        assert retry_after_seconds(httpx.Headers({})) is None
+
+    def test_http_date_in_the_past_is_zero(self):
+        headers = httpx.Headers({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert retry_after_seconds(headers) == 0.0
@@ -0,0 +1,88 @@
+"""Tests for the content-addressed STT result cache.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 12.1**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.adapters.stt.base import STTAdapter, STTResult, STTWord
+from src.adapters.stt.cached import CachedSTTAdapter
+from src.cache import LRUCache, TieredCache
+
+
+class CountingSTTAdapter(STTAdapter):
+    def __init__(self):
+        self.calls = 0
+
+    async def transcribe(self, audio, language="ru", hints=None):
+        self.calls += 1
+        return STTResult(
+            text="привет",
+            confidence=0.9,
+            words=[STTWord(word="привет", start=0.0, end=0.4, confidence=0.9)],
+            language=language,
+            latency_ms=800,
+        )
+
+    def get_provider_name(self):
+        return "openai"
+
+
+class TestLRUCache:
+    """Memory tier is bounded by value size."""
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_bytes=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.get("a")
+        cache.set("c", b"1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.size_bytes == 8
+
+    def test_oversized_value_is_not_stored(self):
+        cache = LRUCache(max_bytes=4)
+        cache.set("a", b"12345")
+
+        assert len(cache) == 0
+
+
+class TestCachedSTTAdapter:
+    """Duplicate uploads are answered without a provider call."""
+
+    async def test_duplicate_audio_hits_cache(self):
+        adapter = CountingSTTAdapter()
+        cache = TieredCache("stt-test", max_bytes=1024 * 1024)
+        cached = CachedSTTAdapter(adapter, cache)
+
+        first = await cached.transcribe(b"audio", language="ru")
+        second = await cached.transcribe(b"audio", language="ru")
+
+        assert adapter.calls == 1
+        assert second.text == first.text
+        assert second.words == first.words
+        assert second.latency_ms < first.latency_ms
+        assert cache.stats()["memory_hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_key_covers_language_and_hints(self):
+        adapter = CountingSTTAdapter()
+        cached = CachedSTTAdapter(adapter, TieredCache("stt-test", max_bytes=1024 * 1024))
+
+        await cached.transcribe(b"audio", language="ru")
+        await cached.transcribe(b"audio", language="kk")
+        await cached.transcribe(b"audio", language="ru", hints=["Алматы"])
+        await cached.transcribe(b"other", language="ru")
+
+        assert adapter.calls == 4
+
+    def test_key_depends_on_provider(self):
+        assert CachedSTTAdapter.cache_key(b"a", "openai", "ru") != CachedSTTAdapter.cache_key(
+            b"a", "google", "ru"
+        )
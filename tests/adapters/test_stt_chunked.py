@@ -0,0 +1,196 @@
+"""Tests for chunked STT of long recordings.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 12.1**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+
+import numpy as np
+
+from src.adapters.stt.base import STTAdapter, STTResult, STTWord
+from src.adapters.stt.chunked import (
+    AudioSegment,
+    ChunkedSTTAdapter,
+    merge_segment_results,
+    split_audio,
+)
+from src.audio_formats import decode_wav, encode_wav
+
+SAMPLE_RATE = 16000
+WORD_SECONDS = 0.3
+
+
+def _speech(seconds: float, word_every: float = 2.5) -> tuple[bytes, list[tuple[str, float]]]:
+    """Tone bursts standing in for words; each burst's amplitude names it."""
+    samples = np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+    t = np.arange(int(WORD_SECONDS * SAMPLE_RATE)) / SAMPLE_RATE
+    words = []
+    start = 1.0
+    while start + WORD_SECONDS < seconds:
+        amplitude = 0.1 + 0.01 * len(words)
+        begin = int(start * SAMPLE_RATE)
+        samples[begin : begin + len(t)] = amplitude * np.sin(2 * np.pi * 440 * t)
+        words.append((f"w{round(amplitude * 100)}", start))
+        start += word_every
+    return encode_wav(samples, SAMPLE_RATE), words
+
+
+class BurstSTTAdapter(STTAdapter):
+    """Fake provider 'recognizing' tone bursts as words."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: list[bytes] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def transcribe(self, audio, language="ru", hints=None):
+        self.calls.append(audio)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+        samples, sample_rate = decode_wav(audio)
+        frame = sample_rate // 100
+        frames = samples[: len(samples) // frame * frame, 0].reshape(-1, frame)
+        peaks = np.abs(frames).max(axis=1)
+        words = []
+        for i, peak in enumerate(peaks):
+            voiced = peak > 0.05
+            if voiced and (i == 0 or peaks[i - 1] <= 0.05):
+                words.append(STTWord(word="", start=i / 100, end=i / 100, confidence=0.9))
+            if voiced:
+                level = max(peak, float(words[-1].word[1:] or 0) / 100)
+                words[-1].word = f"w{round(level * 100)}"
+                words[-1].end = (i + 1) / 100
+        return STTResult(
+            text=" ".join(w.word for w in words),
+            confidence=0.9,
+            words=words,
+            provider="openai",
+        )
+
+    def get_provider_name(self):
+        return "openai"
+
+
+class TestSplitAudio:
+    """Long WAV is cut at silences into overlapping segments."""
+
+    def test_short_and_non_wav_audio_is_not_split(self):
+        audio, _ = _speech(20)
+        assert split_audio(audio, max_segment_seconds=30) == []
+        assert split_audio(b"\x1aE\xdf\xa3webm" * 1000, max_segment_seconds=30) == []
+
+    def test_segments_cover_audio_and_cut_in_silence(self):
+        audio, words = _speech(95)
+        segments = split_audio(audio, max_segment_seconds=30, overlap_seconds=1.0)
+
+        assert len(segments) == 4
+        assert segments[0].start == 0
+        assert segments[-1].end == 95
+        for left, right in zip(segments, segments[1:]):
+            assert left.end == right.start
+            assert right.offset == right.start - 1.0
+            assert left.end - left.start <= 30
+            for _, word_start in words:
+                assert not word_start <= left.end <= word_start + WORD_SECONDS
+
+
+class TestChunkedSTT:
+    """Segments are transcribed concurrently and stitched."""
+
+    async def test_short_audio_is_transcribed_whole(self):
+        audio, _ = _speech(10)
+        provider = BurstSTTAdapter()
+
+        result = await ChunkedSTTAdapter(provider, max_segment_seconds=30).transcribe(audio)
+
+        assert provider.calls == [audio]
+        assert len(result.words) == 4
+
+    async def test_long_audio_words_are_stitched_without_duplicates(self):
+        audio, expected = _speech(125)
+        provider = BurstSTTAdapter(delay=0.05)
+        adapter = ChunkedSTTAdapter(provider, max_segment_seconds=30, overlap_seconds=1.5)
+
+        result = await adapter.transcribe(audio)
+
+        assert len(provider.calls) == 5
+        assert provider.max_active > 1
+        assert [w.word for w in result.words] == [name for name, _ in expected]
+        for word, (_, start) in zip(result.words, expected):
+            assert abs(word.start - start) < 0.02
+            assert abs(word.end - (start + WORD_SECONDS)) < 0.02
+        assert result.text == " ".join(name for name, _ in expected)
+        assert result.provider == "openai"
+
+    async def test_segments_run_concurrently(self):
+        audio, _ = _speech(125)
+        provider = BurstSTTAdapter(delay=0.3)
+        adapter = ChunkedSTTAdapter(provider, max_segment_seconds=30, concurrency=5)
+
+        started = asyncio.get_running_loop().time()
+        await adapter.transcribe(audio)
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert provider.max_active == 5
+        assert elapsed < 0.3 * 5 / 2
+
+
+class TestMergeSegments:
+    """Text-only results are joined without the overlap repeats."""
+
+    def test_repeated_words_at_seam_are_dropped(self):
+        segments = [
+            AudioSegment(audio=b"", offset=0, start=0, end=30),
+            AudioSegment(audio=b"", offset=29, start=30, end=50),
+        ]
+        results = [
+            STTResult(text="Принимать по одной таблетке", confidence=0.8),
+            STTResult(text="таблетке утром и вечером.", confidence=1.0),
+        ]
+
+        result = merge_segment_results(segments, results)
+
+        assert result.text == "Принимать по одной таблетке утром и вечером."
+        assert abs(result.confidence - (0.8 * 30 + 1.0 * 20) / 50) < 1e-9
+
+    def test_estimated_word_timings_are_joined_by_text(self):
+        segments = [
+            AudioSegment(audio=b"", offset=0, start=0, end=30),
+            AudioSegment(audio=b"", offset=29, start=30, end=50),
+        ]
+
+        def evenly_spaced(text: str) -> STTResult:
+            return STTResult(
+                text=text,
+                confidence=0.9,
+                words=[
+                    STTWord(word=w, start=i * 0.3, end=(i + 1) * 0.3, confidence=0.9)
+                    for i, w in enumerate(text.split())
+                ],
+                word_timings_estimated=True,
+            )
+
+        results = [
+            evenly_spaced("Принимать по одной таблетке"),
+            evenly_spaced("таблетке утром и вечером."),
+        ]
+
+        result = merge_segment_results(segments, results)
+
+        assert [w.word for w in result.words] == [
+            "Принимать", "по", "одной", "таблетке", "утром", "и", "вечером.",
+        ]
+        assert result.words[4].start == 29.3
+        assert result.word_timings_estimated
@@ -0,0 +1,94 @@
+"""Tests for STT upload encoding.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 12.1**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import io
+
+import numpy as np
+import pytest
+
+from src.adapters.stt.encoding import detect_audio_format, opus_available, prepare_upload
+from src.audio_formats import encode_wav
+
+
+def _speech_wav(seconds: float = 5.0, sample_rate: int = 16000) -> bytes:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.02 * rng.standard_normal(len(t))
+    return encode_wav(samples.astype(np.float32), sample_rate)
+
+
+class TestFormatDetection:
+    """Format is taken from content, not assumed to be WAV."""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            (b"RIFF\x00\x00\x00\x00WAVEfmt ", "wav"),
+            (b"OggS\x00\x02", "ogg"),
+            (b"\x1aE\xdf\xa3\x9fB\x86", "webm"),
+            (b"ID3\x04\x00", "mp3"),
+            (b"\xff\xfb\x90\xc4", "mp3"),
+            (b"\x00\x00\x00\x20ftypM4A ", "mp4"),
+            (b"fLaC\x00", "flac"),
+        ],
+    )
+    def test_magic_bytes(self, header, expected):
+        assert detect_audio_format(header + bytes(32)) == expected
+
+    def test_compressed_input_is_uploaded_unchanged(self):
+        webm = b"\x1aE\xdf\xa3" + bytes(1000)
+
+        upload = prepare_upload(webm, ["ogg", "wav", "webm"])
+
+        assert upload.data == webm
+        assert upload.filename == "audio.webm"
+        assert upload.content_type == "audio/webm"
+
+
+@pytest.mark.skipif(not opus_available(), reason="libsndfile without Opus")
+class TestOpusEncoding:
+    """WAV is re-encoded to Opus/OGG for providers accepting it."""
+
+    def test_wav_is_encoded_to_opus_about_tenfold_smaller(self):
+        wav = _speech_wav()
+
+        upload = prepare_upload(wav, ["ogg", "wav"], opus_bitrate=24000)
+
+        assert upload.format == "ogg"
+        assert upload.content_type == "audio/ogg"
+        assert upload.data[:4] == b"OggS"
+        assert len(upload.data) * 8 < len(wav)
+
+        import soundfile
+
+        samples, sample_rate = soundfile.read(io.BytesIO(upload.data))
+        assert sample_rate == 16000
+        assert abs(len(samples) - 5 * 16000) < 16000 * 0.1
+
+    def test_odd_sample_rate_is_resampled(self):
+        upload = prepare_upload(_speech_wav(sample_rate=22050), ["ogg"])
+
+        import soundfile
+
+        assert soundfile.info(io.BytesIO(upload.data)).samplerate == 16000
+
+    def test_provider_without_ogg_gets_wav(self):
+        wav = _speech_wav()
+
+        upload = prepare_upload(wav, ["wav", "mp3"])
+
+        assert upload.data == wav
+        assert upload.content_type == "audio/wav"
+
+    def test_zero_bitrate_disables_encoding(self):
+        wav = _speech_wav()
+
+        assert prepare_upload(wav, ["ogg", "wav"], opus_bitrate=0).data == wav
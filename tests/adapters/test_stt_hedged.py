@@ -0,0 +1,152 @@
+"""Tests for hedged STT across providers.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 12.1**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+
+import pytest
+
+from src.adapters.stt.base import STTAdapter, STTError, STTResult
+from src.adapters.registry import AdapterRegistry
+from src.config import get_settings
+from src.adapters.stt.hedged import HedgedSTTAdapter
+
+
+class SlowSTTAdapter(STTAdapter):
+    """Fake provider answering after a fixed delay."""
+
+    def __init__(self, name: str, delay: float, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def transcribe(self, audio, language="ru", hints=None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise STTError("down", self.name)
+        return STTResult(text=self.name, confidence=0.9)
+
+    def get_provider_name(self):
+        return self.name
+
+
+def _hedged(primary, secondary, **kwargs) -> HedgedSTTAdapter:
+    kwargs.setdefault("max_hedge_rate", 1.0)
+    kwargs.setdefault("default_delay_ms", 50)
+    kwargs.setdefault("min_delay_ms", 10)
+    return HedgedSTTAdapter(primary, secondary, **kwargs)
+
+
+class TestHedgedSTT:
+    """First successful provider wins; the loser is cancelled."""
+
+    async def test_fast_primary_is_not_hedged(self):
+        primary = SlowSTTAdapter("openai", 0.0)
+        secondary = SlowSTTAdapter("google", 0.0)
+        adapter = _hedged(primary, secondary)
+
+        result = await adapter.transcribe(b"audio")
+
+        assert result.text == "openai"
+        assert secondary.calls == 0
+        assert adapter.hedge_count == 0
+
+    async def test_slow_primary_loses_to_secondary(self):
+        primary = SlowSTTAdapter("openai", 5.0)
+        secondary = SlowSTTAdapter("google", 0.0)
+        adapter = _hedged(primary, secondary)
+
+        result = await adapter.transcribe(b"audio")
+        await asyncio.sleep(0)
+
+        assert result.text == "google"
+        assert primary.cancelled == 1
+        assert adapter.secondary_win_count == 1
+
+    async def test_failed_primary_fails_over(self):
+        primary = SlowSTTAdapter("openai", 0.0, fail=True)
+        secondary = SlowSTTAdapter("google", 0.0)
+        adapter = _hedged(primary, secondary, max_hedge_rate=0.0)
+
+        result = await adapter.transcribe(b"audio")
+
+        assert result.text == "google"
+
+    async def test_slow_failing_primary_fails_over_past_hedge_cap(self):
+        primary = SlowSTTAdapter("openai", 0.08, fail=True)
+        secondary = SlowSTTAdapter("google", 0.0)
+        adapter = _hedged(primary, secondary, max_hedge_rate=0.0)
+
+        result = await adapter.transcribe(b"audio")
+
+        assert result.text == "google"
+        assert adapter.hedge_count == 0
+
+    async def test_both_failing_raises_primary_error(self):
+        adapter = _hedged(
+            SlowSTTAdapter("openai", 0.0, fail=True),
+            SlowSTTAdapter("google", 0.0, fail=True),
+        )
+
+        with pytest.raises(STTError, match="openai"):
+            await adapter.transcribe(b"audio")
+
+    async def test_hedge_rate_is_capped(self):
+        primary = SlowSTTAdapter("openai", 0.08)
+        secondary = SlowSTTAdapter("google", 0.0)
+        adapter = _hedged(primary, secondary, max_hedge_rate=0.25)
+
+        for _ in range(8):
+            await adapter.transcribe(b"audio")
+
+        assert adapter.hedge_count == 2
+
+    async def test_delay_follows_primary_p95(self):
+        adapter = _hedged(SlowSTTAdapter("openai", 0.0), SlowSTTAdapter("google", 0.0))
+        for latency_ms in range(1, 101):
+            adapter.latency.record(latency_ms)
+
+        assert adapter.hedge_delay_ms() == 95
+
+
+class TestHedgedAdapterLifetime:
+    """The hedged adapter outlives a request, so its delay keeps learning."""
+
+    def test_registry_keeps_hedged_adapter_before_start(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "openai_api_key", "test")
+        registry = AdapterRegistry()
+
+        first = registry.get_hedged_stt_adapter("openai", "google")
+        first.latency.record(1234)
+
+        assert registry.get_hedged_stt_adapter("openai", "google") is first
+        assert registry.get_hedged_stt_adapter("openai", "google").latency.count == 1
+
+    def test_pipeline_hedges_instead_of_routing(self, monkeypatch):
+        from src.services import voice_session
+
+        settings = voice_session.get_settings()
+        monkeypatch.setattr(settings, "openai_api_key", "test")
+        monkeypatch.setattr(settings, "stt_hedging_enabled", True)
+        monkeypatch.setattr(settings, "provider_routing_enabled", True)
+        monkeypatch.setattr(settings, "stt_chunking_enabled", False)
+        monkeypatch.setattr(settings, "stt_cache_enabled", False)
+        monkeypatch.setattr(voice_session, "get_adapter_registry", AdapterRegistry)
+        service = voice_session.VoiceSessionService.__new__(voice_session.VoiceSessionService)
+        service.settings = settings
+
+        assert isinstance(service._get_stt_adapter("openai"), HedgedSTTAdapter)
@@ -0,0 +1,152 @@
+"""Tests for chunked TTS of long texts and MP3 frame joining.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 5.1, 12.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+
+from src.adapters.tts.base import TTSAdapter, TTSResult
+from src.adapters.tts.chunked import ChunkedTTSAdapter
+from src.adapters.tts.mp3 import concat_mp3, iter_frames, mp3_duration_ms, parse_frame_header
+from src.adapters.tts.sentences import split_text
+
+# MPEG-2 Layer III, 64 kbps, 24 kHz, mono: 192-byte frames of 576 samples (24 ms)
+FRAME_HEADER = b"\xff\xf3\x84\xc4"
+FRAME = FRAME_HEADER + bytes(188)
+ID3_TAG = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + bytes(10)
+XING_FRAME = FRAME_HEADER + bytes(9) + b"Xing" + bytes(175)
+
+
+def _mp3(frames: int) -> bytes:
+    """MP3 file as a TTS provider returns it: ID3 tag, Xing frame, audio frames."""
+    return ID3_TAG + XING_FRAME + FRAME * frames
+
+
+class SlowTTSAdapter(TTSAdapter):
+    """Fake provider returning 24 ms of audio per character."""
+
+    MAX_TEXT_LENGTH = 100
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.texts: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def synthesize(self, text, language="ru", voice=None, speed=1.0):
+        assert len(text) <= self.MAX_TEXT_LENGTH
+        self.texts.append(text)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return TTSResult(
+            audio=_mp3(len(text)), format="mp3", duration_ms=1, latency_ms=1, provider="openai"
+        )
+
+    def get_provider_name(self):
+        return "openai"
+
+
+def _long_text(sentences: int) -> str:
+    return " ".join(f"Предложение номер {i} о приёме лекарств." for i in range(sentences))
+
+
+class TestMP3Frames:
+    """Frames are found from headers; tags and VBR frames are left out."""
+
+    def test_header_parsing(self):
+        assert parse_frame_header(FRAME_HEADER) == (192, 576, 24000)
+        assert parse_frame_header(b"\xff\xfb\x90\xc4") == (417, 1152, 44100)
+        assert parse_frame_header(b"\xff\xfb\xf0\xc4") is None  # bad bitrate
+        assert parse_frame_header(b"RIFF") is None
+
+    def test_duration_from_frame_headers(self):
+        assert mp3_duration_ms(_mp3(125)) == 3000
+        assert mp3_duration_ms(b"\xff\xfb\x90\xc4" + bytes(413)) == 26
+        assert mp3_duration_ms(b"not mp3 at all") == 0
+
+    def test_concat_keeps_only_audio_frames(self):
+        joined = concat_mp3([_mp3(10), _mp3(20) + b"TAG" + bytes(125)])
+
+        assert joined == FRAME * 30
+        assert len(list(iter_frames(joined))) == 30
+
+    def test_truncated_last_frame_is_dropped(self):
+        assert concat_mp3([FRAME * 3 + FRAME[:50]]) == FRAME * 3
+
+
+class TestSplitText:
+    """Long text is packed into pieces at sentence boundaries."""
+
+    def test_sentences_are_packed_under_limit(self):
+        text = _long_text(10)
+
+        pieces = split_text(text, 100)
+
+        assert all(len(p) <= 100 for p in pieces)
+        assert " ".join(pieces) == text
+        assert all(p.endswith(".") for p in pieces)
+
+    def test_long_sentence_is_split_between_words(self):
+        sentence = " ".join(["слово"] * 50) + "."
+
+        pieces = split_text(sentence, 40)
+
+        assert all(len(p) <= 40 for p in pieces)
+        assert " ".join(pieces) == sentence
+
+
+class TestChunkedTTS:
+    """Long text is synthesized as concurrent pieces joined into one MP3."""
+
+    async def test_short_text_is_synthesized_whole(self):
+        provider = SlowTTSAdapter()
+
+        result = await ChunkedTTSAdapter(provider, max_chars=500).synthesize("Привет.")
+
+        assert provider.texts == ["Привет."]
+        assert result.audio == _mp3(7)
+
+    async def test_long_text_is_joined_with_real_duration(self):
+        provider = SlowTTSAdapter()
+        text = _long_text(10)
+
+        result = await ChunkedTTSAdapter(provider, max_chars=500).synthesize(text)
+
+        # Capped at the provider's MAX_TEXT_LENGTH
+        assert len(provider.texts) > 1
+        assert " ".join(provider.texts) == text
+        total_chars = sum(len(t) for t in provider.texts)
+        assert result.audio == FRAME * total_chars
+        assert result.duration_ms == total_chars * 24
+        assert result.provider == "openai"
+
+    async def test_pieces_run_concurrently(self):
+        provider = SlowTTSAdapter(delay=0.2)
+        adapter = ChunkedTTSAdapter(provider, max_chars=100, concurrency=8)
+
+        started = asyncio.get_running_loop().time()
+        await adapter.synthesize(_long_text(10))
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert provider.max_active == len(provider.texts)
+        assert elapsed < 0.2 * 2
+
+    async def test_stream_yields_one_mp3(self):
+        provider = SlowTTSAdapter()
+        adapter = ChunkedTTSAdapter(provider, max_chars=100)
+
+        audio = b"".join([chunk async for chunk in adapter.synthesize_stream(_long_text(10))])
+
+        total_chars = sum(len(t) for t in provider.texts)
+        assert audio == _mp3(len(provider.texts[0])) + FRAME * (total_chars - len(provider.texts[0]))
+        assert mp3_duration_ms(audio) == total_chars * 24
@@ -0,0 +1,130 @@
+"""Tests for single-flight TTS coalescing.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 5.1**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+
+import pytest
+
+from src.adapters.tts.base import TTSAdapter, TTSError, TTSResult
+from src.adapters.tts.coalescing import CoalescingTTSAdapter, SingleFlight
+
+
+class SlowTTSAdapter(TTSAdapter):
+    """Fake TTS taking a while, counting upstream calls."""
+
+    def __init__(self, delay: float = 0.05, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def synthesize(self, text, language="ru", voice=None, speed=1.0):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise TTSError("down", "openai")
+        return TTSResult(audio=text.encode(), format="mp3", duration_ms=1000, latency_ms=50)
+
+    def get_provider_name(self):
+        return "openai"
+
+
+class TestCoalescing:
+    """Identical concurrent requests share one upstream call."""
+
+    async def test_burst_of_same_phrase_makes_one_call(self):
+        upstream = SlowTTSAdapter()
+        flight = SingleFlight()
+        adapter = CoalescingTTSAdapter(upstream, flight)
+
+        results = await asyncio.gather(
+            *(adapter.synthesize("Здравствуйте! Чем могу помочь?") for _ in range(50))
+        )
+
+        assert upstream.calls == 1
+        assert {r.audio for r in results} == {"Здравствуйте! Чем могу помочь?".encode()}
+        assert len({id(r) for r in results}) == 50  # each caller gets its own copy
+        stats = flight.stats()
+        assert stats["coalesced"] == 49
+        assert stats["max_waiters"] == 50
+        assert stats["in_flight"] == 0
+        assert stats["waiting"] == 0
+
+    async def test_distinct_keys_are_not_coalesced(self):
+        upstream = SlowTTSAdapter()
+        adapter = CoalescingTTSAdapter(upstream, SingleFlight())
+
+        await asyncio.gather(
+            adapter.synthesize("Привет"),
+            adapter.synthesize("Привет", language="kk"),
+            adapter.synthesize("Привет", voice="alloy"),
+            adapter.synthesize("Привет", speed=1.25),
+            adapter.synthesize("Пока"),
+        )
+
+        assert upstream.calls == 5
+
+    async def test_sequential_requests_call_again(self):
+        upstream = SlowTTSAdapter(delay=0)
+        adapter = CoalescingTTSAdapter(upstream, SingleFlight())
+
+        await adapter.synthesize("Привет")
+        await adapter.synthesize("Привет")
+
+        assert upstream.calls == 2
+
+    async def test_failure_reaches_all_waiters(self):
+        upstream = SlowTTSAdapter(fail=True)
+        adapter = CoalescingTTSAdapter(upstream, SingleFlight())
+
+        results = await asyncio.gather(
+            *(adapter.synthesize("Привет") for _ in range(3)), return_exceptions=True
+        )
+
+        assert upstream.calls == 1
+        assert all(isinstance(r, TTSError) for r in results)
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        upstream = SlowTTSAdapter()
+        adapter = CoalescingTTSAdapter(upstream, SingleFlight())
+
+        leader = asyncio.create_task(adapter.synthesize("Привет"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(adapter.synthesize("Привет"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        result = await follower
+
+        assert result.audio == "Привет".encode()
+        assert upstream.calls == 1
+        assert upstream.cancelled == 0
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_upstream_call_cancelled_when_all_waiters_leave(self):
+        upstream = SlowTTSAdapter()
+        flight = SingleFlight()
+        adapter = CoalescingTTSAdapter(upstream, flight)
+
+        tasks = [asyncio.create_task(adapter.synthesize("Привет")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert upstream.cancelled == 1
+        assert flight.stats()["in_flight"] == 0
@@ -0,0 +1,56 @@
+"""Tests for sentence splitting used by chunked TTS.
+
+**Feature: voice-assistant-pipeline**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from hypothesis import given, settings, strategies as st
+
+from src.adapters.tts.sentences import split_sentences
+
+
+class TestSplitSentences:
+    """Test that splitting keeps text intact and in order."""
+
+    def test_splits_on_terminal_punctuation(self):
+        """Russian sentences are split after . ! ? and closing quotes."""
+        text = "Здравствуйте! Чем могу помочь? «Да!» Сегодня хорошая погода."
+
+        assert split_sentences(text) == [
+            "Здравствуйте!",
+            "Чем могу помочь?",
+            "«Да!»",
+            "Сегодня хорошая погода.",
+        ]
+
+    def test_text_without_punctuation_is_one_sentence(self):
+        """Text without sentence ends is kept whole."""
+        assert split_sentences("Мен сізге көмектесуге дайынмын") == [
+            "Мен сізге көмектесуге дайынмын"
+        ]
+
+    def test_empty_text(self):
+        """Whitespace-only text has no sentences."""
+        assert split_sentences("   ") == []
+
+    @given(
+        sentences=st.lists(
+            st.text(alphabet="абвгдеёжз ", min_size=1, max_size=20).filter(str.strip),
+            min_size=1,
+            max_size=10,
+        ),
+        ending=st.sampled_from([".", "!", "?", "…"]),
+    )
+    @settings(max_examples=100)
+    def test_no_words_lost(self, sentences: list[str], ending: str):
+        """Splitting never drops or reorders words."""
+        text = " ".join(s.strip() + ending for s in sentences)
+
+        result = split_sentences(text)
+
+        assert " ".join(result).split() == text.split()
+        assert len(result) == len(sentences)
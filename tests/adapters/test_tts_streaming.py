@@ -0,0 +1,232 @@
+"""Tests for streaming TTS synthesis.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 5.1, 12.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from types import SimpleNamespace
+from typing import Optional
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from src.adapters.routing import ProviderRouter, RoutedTTSAdapter
+from src.adapters.tts.base import TTSAdapter, TTSError, TTSResult
+from src.adapters.tts.openai_adapter import OpenAITTSAdapter
+from src.emulator import EmulatorConfig, EndpointProfile, create_emulator_app
+
+
+class WholeTTSAdapter(TTSAdapter):
+    """Provider without native streaming."""
+
+    async def synthesize(self, text, language="ru", voice=None, speed=1.0):
+        return TTSResult(audio=text.encode(), format="mp3", duration_ms=1000, latency_ms=5)
+
+    def get_provider_name(self):
+        return "whole"
+
+
+class ChunkedTTSAdapter(TTSAdapter):
+    """Provider streaming fixed chunks, optionally failing midway."""
+
+    def __init__(self, name: str, fail_after: Optional[int] = None):
+        self.name = name
+        self.fail_after = fail_after
+        self.closed = False
+
+    async def synthesize(self, text, language="ru", voice=None, speed=1.0):
+        raise NotImplementedError
+
+    async def synthesize_stream(self, text, language="ru", voice=None, speed=1.0):
+        try:
+            for i in range(3):
+                if i == self.fail_after:
+                    raise TTSError("down", self.name)
+                yield f"{self.name}-{i}".encode()
+        finally:
+            self.closed = True
+
+    def get_provider_name(self):
+        return self.name
+
+
+class ClosingStream(httpx.AsyncByteStream):
+    """Response body that records whether it was closed."""
+
+    def __init__(self, inner: httpx.AsyncByteStream):
+        self.inner = inner
+        self.closed = False
+
+    async def __aiter__(self):
+        async for chunk in self.inner:
+            yield chunk
+
+    async def aclose(self) -> None:
+        self.closed = True
+        await self.inner.aclose()
+
+
+class TrackingTransport(httpx.AsyncBaseTransport):
+    """ASGI transport to the emulator keeping the response bodies it returned."""
+
+    def __init__(self):
+        fast = EndpointProfile(latency_p50_ms=0, latency_p95_ms=0)
+        self.inner = httpx.ASGITransport(app=create_emulator_app(EmulatorConfig(speech=fast)))
+        self.streams: list[ClosingStream] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.inner.handle_async_request(request)
+        stream = ClosingStream(response.stream)
+        self.streams.append(stream)
+        return httpx.Response(response.status_code, headers=response.headers, stream=stream)
+
+
+async def _collect(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+class TestDefaultStream:
+    """Adapters without native streaming yield the synthesize() audio."""
+
+    async def test_yields_whole_audio_once(self):
+        chunks = await _collect(WholeTTSAdapter().synthesize_stream("Привет"))
+
+        assert chunks == ["Привет".encode()]
+
+
+class TestRoutedStream:
+    """Streaming fails over only before the first chunk."""
+
+    def _routed(self, adapters: dict[str, TTSAdapter], preferred: str) -> RoutedTTSAdapter:
+        router = ProviderRouter(min_calls=4, cooldown_seconds=60)
+        return RoutedTTSAdapter(router, preferred, adapters.__getitem__)
+
+    async def test_chunks_are_forwarded_in_order(self):
+        adapters = {"openai": ChunkedTTSAdapter("openai"), "google": ChunkedTTSAdapter("google")}
+
+        chunks = await _collect(self._routed(adapters, "openai").synthesize_stream("text"))
+
+        assert chunks == [b"openai-0", b"openai-1", b"openai-2"]
+        assert adapters["openai"].closed
+
+    async def test_fails_over_before_first_chunk(self):
+        adapters = {
+            "openai": ChunkedTTSAdapter("openai", fail_after=0),
+            "google": ChunkedTTSAdapter("google"),
+        }
+        routed = self._routed(adapters, "openai")
+
+        chunks = await _collect(routed.synthesize_stream("text"))
+
+        assert chunks == [b"google-0", b"google-1", b"google-2"]
+        assert routed.router.health("tts", "openai").error_rate == 1.0
+
+    async def test_error_after_first_chunk_is_raised(self):
+        adapters = {
+            "openai": ChunkedTTSAdapter("openai", fail_after=1),
+            "google": ChunkedTTSAdapter("google"),
+        }
+        received = []
+
+        with pytest.raises(TTSError):
+            async for chunk in self._routed(adapters, "openai").synthesize_stream("text"):
+                received.append(chunk)
+
+        assert received == [b"openai-0"]
+        assert not adapters["google"].closed
+
+    async def test_consumer_closing_early_closes_provider_stream(self):
+        adapter = ChunkedTTSAdapter("openai")
+        stream = self._routed({"openai": adapter, "google": adapter}, "openai").synthesize_stream("t")
+
+        assert await anext(stream) == b"openai-0"
+        await stream.aclose()
+
+        assert adapter.closed
+
+
+class TestOpenAIStream:
+    """The streamed HTTP response is closed however the consumer stops."""
+
+    def _adapter(self, transport: TrackingTransport) -> OpenAITTSAdapter:
+        adapter = OpenAITTSAdapter(api_key="test")
+        adapter.client = AsyncOpenAI(
+            api_key="test",
+            base_url="http://emulator/v1",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=transport),
+        )
+        return adapter
+
+    async def test_response_closed_after_full_read(self):
+        transport = TrackingTransport()
+
+        chunks = await _collect(self._adapter(transport).synthesize_stream("Привет " * 50))
+
+        assert b"".join(chunks)
+        assert [s.closed for s in transport.streams] == [True]
+
+    async def test_response_closed_when_consumer_stops_early(self):
+        transport = TrackingTransport()
+        stream = self._adapter(transport).synthesize_stream("Привет " * 50)
+
+        assert await anext(stream)
+        await stream.aclose()
+
+        assert [s.closed for s in transport.streams] == [True]
+
+
+class FakeCommunicate:
+    """edge_tts.Communicate stand-in that connects on the first read."""
+
+    connected_in_scheduler: list[bool] = []
+
+    def __init__(self, text, voice):
+        self.text = text
+
+    async def stream(self):
+        FakeCommunicate.connected_in_scheduler.append(RecordingScheduler.running)
+        yield {"type": "WordBoundary"}
+        for i in range(3):
+            yield {"type": "audio", "data": f"edge-{i}".encode()}
+
+
+class RecordingScheduler:
+    """Provider scheduler that records when a call is running under it."""
+
+    running = False
+
+    def __init__(self):
+        self.providers: list[str] = []
+
+    async def run(self, provider, call):
+        self.providers.append(provider)
+        RecordingScheduler.running = True
+        try:
+            return await call()
+        finally:
+            RecordingScheduler.running = False
+
+
+class TestEdgeStream:
+    """The edge-tts connection is made inside the scheduled call."""
+
+    async def test_first_chunk_is_read_under_the_scheduler(self, monkeypatch):
+        from src.adapters.tts import google_adapter
+
+        scheduler = RecordingScheduler()
+        FakeCommunicate.connected_in_scheduler = []
+        monkeypatch.setitem(sys.modules, "edge_tts", SimpleNamespace(Communicate=FakeCommunicate))
+        monkeypatch.setattr(google_adapter, "get_provider_scheduler", lambda: scheduler)
+
+        chunks = await _collect(google_adapter.GoogleTTSAdapter().synthesize_stream("Привет"))
+
+        assert chunks == [b"edge-0", b"edge-1", b"edge-2"]
+        assert scheduler.providers == ["edge"]
+        assert FakeCommunicate.connected_in_scheduler == [True]
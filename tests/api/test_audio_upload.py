@@ -0,0 +1,68 @@
+"""Tests for audio upload ingestion limits.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 11.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from src.api.routers import voice
+
+
+def _upload(content: bytes, known_size: bool) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        size=len(content) if known_size else None,
+        filename="audio.wav",
+    )
+
+
+class TestReadAudioUpload:
+    """Uploads are size-checked before being read into memory."""
+
+    @pytest.mark.parametrize("known_size", [True, False])
+    async def test_reads_audio(self, known_size):
+        content = b"\x01" * 3000
+
+        assert await voice._read_audio_upload(_upload(content, known_size)) == content
+
+    @pytest.mark.parametrize("known_size", [True, False])
+    async def test_rejects_too_large(self, monkeypatch, known_size):
+        monkeypatch.setattr(voice, "MAX_AUDIO_BYTES", 1000)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await voice._read_audio_upload(_upload(b"\x01" * 5000, known_size))
+
+        assert exc_info.value.status_code == 413
+
+    async def test_oversized_upload_is_not_read(self, monkeypatch):
+        """Unknown-size uploads are measured in the spooled file, not read."""
+        monkeypatch.setattr(voice, "MAX_AUDIO_BYTES", 1000)
+        upload = _upload(b"\x01" * 100_000, known_size=False)
+        reads = []
+        original_read = upload.read
+
+        async def read(size: int = -1) -> bytes:
+            reads.append(size)
+            return await original_read(size)
+
+        upload.read = read
+
+        with pytest.raises(HTTPException):
+            await voice._read_audio_upload(upload)
+
+        assert reads == []
+
+    async def test_rejects_too_short(self):
+        with pytest.raises(HTTPException) as exc_info:
+            await voice._read_audio_upload(_upload(b"\x01" * 10, known_size=True))
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,302 @@
+"""Query-count regression tests for voice API endpoints.
+
+Runs the voice router against an in-memory SQLite database with fake
+providers and fails when an endpoint issues more SQL statements than its
+budget. Lower a budget when an optimization lands; never raise it casually.
+
+**Feature: voice-assistant-pipeline**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.models.entities_ext  # noqa: F401 - register all tables
+from src.adapters.stt.base import STTResult, STTWord
+from src.adapters.tts.base import TTSAdapter, TTSResult
+from src.api.routers import voice
+from src.models.database import Base, get_db
+from src.models.entities import User
+from src.services import storage, voice_session, work_queue
+from src.services.entity_context import EntityContext
+
+DEMO_USER_ID = "00000000-0000-0000-0000-000000000001"
+
+# Maximum SQL statements per request
+QUERY_BUDGETS = {
+    "session": 3,
+    "process": 7,
+    "process_text": 5,
+    "process_events": 7,
+    "respond_stream": 5,
+    "stream_turn": 9,
+}
+
+
+class FakeSTTAdapter:
+    async def transcribe(self, audio, language="ru", hints=None):
+        return STTResult(
+            text="привет как дела",
+            confidence=0.95,
+            words=[STTWord(word="привет", start=0.0, end=0.3, confidence=0.9)],
+            language=language,
+            latency_ms=10,
+        )
+
+    def get_provider_name(self):
+        return "google"
+
+
+class FakeTTSAdapter(TTSAdapter):
+    async def synthesize(self, text, language="ru", voice=None, speed=1.0):
+        return TTSResult(audio=b"\xff\xfb" * 64, format="mp3", duration_ms=1000, latency_ms=5)
+
+    async def synthesize_stream(self, text, language="ru", voice=None, speed=1.0):
+        for _ in range(4):
+            yield b"\xff\xfb" * 16
+
+    def get_provider_name(self):
+        return "google"
+
+
+class FakeLLMService:
+    async def generate_response(self, user_message, system_prompt=None, language="ru"):
+        return "Здравствуйте! Чем могу помочь?"
+
+    async def generate_response_stream(self, user_message, system_prompt=None, language="ru"):
+        for delta in ("Здравствуйте!", " Чем могу помочь?"):
+            yield delta
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+@pytest.fixture
+async def app_client(monkeypatch, tmp_path):
+    database_url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_maker() as db:
+        db.add(User(
+            id=DEMO_USER_ID,
+            name="Demo User",
+            email="demo@example.com",
+            username="demo",
+            hashed_password="x",
+            stt_provider="google",
+            tts_provider="google",
+        ))
+        await db.commit()
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+            await session.commit()
+
+    monkeypatch.setattr(storage, "LOCAL_STORAGE_DIR", tmp_path)
+    monkeypatch.setattr(storage.StorageService, "__init__", _local_storage_init)
+    monkeypatch.setattr(
+        voice_session.AdapterFactory, "get_stt_adapter", staticmethod(lambda p: FakeSTTAdapter())
+    )
+    monkeypatch.setattr(
+        voice_session.AdapterFactory, "get_tts_adapter", staticmethod(lambda p: FakeTTSAdapter())
+    )
+    monkeypatch.setattr(voice, "get_llm_service", lambda: FakeLLMService())
+    monkeypatch.setattr(voice, "async_session_maker", session_maker)
+    monkeypatch.setattr(voice_session, "async_session_maker", session_maker)
+    # Deferred writes run after the response on their own engine, uncounted
+    worker_engine = create_async_engine(database_url)
+    queue = work_queue.WorkQueue(
+        session_maker=async_sessionmaker(worker_engine, class_=AsyncSession, expire_on_commit=False)
+    )
+    monkeypatch.setattr(work_queue, "_work_queue", queue)
+
+    app = FastAPI()
+    app.include_router(voice.router)
+    app.dependency_overrides[get_db] = override_get_db
+
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client, counter
+
+    await queue.stop()
+    await worker_engine.dispose()
+    await engine.dispose()
+
+
+def _local_storage_init(self):
+    self.settings = voice_session.get_settings()
+    self.client = None
+    self.bucket = self.settings.s3_bucket_name
+    self.use_local = True
+
+
+class RecordingWebSocket:
+    """WebSocket stand-in keeping what the server sent."""
+
+    def __init__(self):
+        self.sent: list = []
+
+    async def send_json(self, data: dict) -> None:
+        self.sent.append(data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+async def _create_session(client) -> str:
+    response = await client.post("/api/voice/session", json={})
+    assert response.status_code == 200
+    return response.json()["session_id"]
+
+
+class TestQueryBudgets:
+    """Each endpoint must stay within its SQL statement budget."""
+
+    async def test_create_session(self, app_client):
+        client, counter = app_client
+
+        counter.count = 0
+        await _create_session(client)
+
+        assert counter.count <= QUERY_BUDGETS["session"], counter.count
+
+    async def test_process_full_pipeline(self, app_client):
+        client, counter = app_client
+        session_id = await _create_session(client)
+
+        counter.count = 0
+        response = await client.post(
+            f"/api/voice/process/{session_id}",
+            files={"audio": ("audio.wav", b"\x00" * 2000, "audio/wav")},
+        )
+
+        assert response.status_code == 200, response.text
+        assert counter.count <= QUERY_BUDGETS["process"], counter.count
+
+    async def test_process_text_pipeline(self, app_client):
+        client, counter = app_client
+        session_id = await _create_session(client)
+
+        counter.count = 0
+        response = await client.post(
+            f"/api/voice/process-text/{session_id}",
+            json={"text": "привет", "language": "ru"},
+        )
+
+        assert response.status_code == 200, response.text
+        assert counter.count <= QUERY_BUDGETS["process_text"], counter.count
+
+    async def test_process_events_stream(self, app_client):
+        client, counter = app_client
+        session_id = await _create_session(client)
+
+        counter.count = 0
+        response = await client.post(
+            f"/api/voice/process/{session_id}/events",
+            files={"audio": ("audio.wav", b"\x00" * 2000, "audio/wav")},
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.removeprefix("event: ")
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert events == [
+            "transcript", "assistant_delta", "assistant_delta", "assistant_text", "audio_url",
+        ]
+        assert '"text": "Здравствуйте! Чем могу помочь?"' in response.text
+        assert counter.count <= QUERY_BUDGETS["process_events"], counter.count
+
+    async def test_respond_stream(self, app_client):
+        client, counter = app_client
+        session_id = await _create_session(client)
+        turn = await client.post(
+            f"/api/voice/process-text/{session_id}",
+            json={"text": "привет", "language": "ru"},
+        )
+        turn_id = turn.json()["turn_id"]
+
+        counter.count = 0
+        response = await client.post(
+            f"/api/voice/respond/{session_id}/stream",
+            json={"turn_id": turn_id, "assistant_text": "Первое предложение. Второе."},
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.headers["x-turn-id"] == turn_id
+        assert response.content == b"\xff\xfb" * 64 + b"\xff\xfb" * 64
+        assert counter.count <= QUERY_BUDGETS["respond_stream"], counter.count
+
+    async def test_websocket_turn_streams_sentences(self, app_client):
+        client, counter = app_client
+        session_id = await _create_session(client)
+        websocket = RecordingWebSocket()
+
+        counter.count = 0
+        await voice._stream_turn(websocket, session_id, DEMO_USER_ID, b"\x00" * 2000)
+
+        types = [m["type"] if isinstance(m, dict) else "audio" for m in websocket.sent]
+        assert types[:2] == ["transcript", "assistant_text"], websocket.sent
+        assert "audio" in types[2:-1]
+        audio_end = websocket.sent[-1]
+        assert audio_end["type"] == "audio_end"
+        assert audio_end["format"] == "mp3"
+        assert audio_end["audio_url"].endswith("output.mp3")
+        assert counter.count <= QUERY_BUDGETS["stream_turn"], counter.count
+
+    async def test_unknown_session_skips_transcription(self, app_client, monkeypatch):
+        client, counter = app_client
+        calls = []
+
+        class CountingSTTAdapter(FakeSTTAdapter):
+            async def transcribe(self, audio, language="ru", hints=None):
+                calls.append(audio)
+                return await super().transcribe(audio, language, hints)
+
+        monkeypatch.setattr(
+            voice_session.AdapterFactory,
+            "get_stt_adapter",
+            staticmethod(lambda p: CountingSTTAdapter()),
+        )
+        get_conversation = EntityContext.get_conversation
+
+        async def slow_get_conversation(self, conversation_id):
+            await asyncio.sleep(0.5)  # long enough for STT to start
+            return await get_conversation(self, conversation_id)
+
+        monkeypatch.setattr(EntityContext, "get_conversation", slow_get_conversation)
+
+        response = await client.post(
+            "/api/voice/process/00000000-0000-0000-0000-00000000dead",
+            files={"audio": ("audio.wav", b"\x00" * 2000, "audio/wav")},
+        )
+
+        assert response.status_code == 404, response.text
+        assert calls == []
@@ -0,0 +1,64 @@
+"""Tests for the WebSocket streaming pipeline protocol.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 11.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import voice
+
+SESSION_URL = "/api/voice/stream/00000000-0000-0000-0000-000000000002"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client whose pipeline echoes the size of each utterance it gets."""
+    async def fake_stream_turn(websocket, session_id, user_id, audio_content):
+        await websocket.send_json({"type": "audio_end", "audio_bytes": len(audio_content)})
+
+    monkeypatch.setattr(voice, "_stream_turn", fake_stream_turn)
+    monkeypatch.setattr(voice, "MAX_AUDIO_BYTES", 2000)
+    app = FastAPI()
+    app.include_router(voice.router)
+    return TestClient(app)
+
+
+class TestStreamPipeline:
+    """Utterances are buffered up to "end"; oversized ones are dropped whole."""
+
+    def test_utterance_is_processed_on_end(self, client):
+        with client.websocket_connect(SESSION_URL) as websocket:
+            websocket.send_bytes(b"\x01" * 600)
+            websocket.send_bytes(b"\x01" * 600)
+            websocket.send_json({"type": "end"})
+
+            assert websocket.receive_json() == {"type": "audio_end", "audio_bytes": 1200}
+            websocket.send_json({"type": "close"})
+
+    def test_short_utterance_is_rejected(self, client):
+        with client.websocket_connect(SESSION_URL) as websocket:
+            websocket.send_bytes(b"\x01" * 10)
+            websocket.send_json({"type": "end"})
+
+            assert websocket.receive_json() == {"type": "error", "detail": "Audio too short."}
+
+    def test_overflowing_utterance_is_dropped_then_stream_recovers(self, client):
+        with client.websocket_connect(SESSION_URL) as websocket:
+            for _ in range(5):
+                websocket.send_bytes(b"\x01" * 600)  # limit hit on the 4th frame
+            websocket.send_json({"type": "end"})
+            assert websocket.receive_json() == {"type": "error", "detail": "Audio too long."}
+
+            # The tail of the long utterance is not processed; the next one is
+            websocket.send_bytes(b"\x02" * 700)
+            websocket.send_json({"type": "end"})
+
+            assert websocket.receive_json() == {"type": "audio_end", "audio_bytes": 700}
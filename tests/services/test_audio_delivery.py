@@ -0,0 +1,176 @@
+"""Tests for TTS output format negotiation and delivery.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 5.1, 5.3**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import io
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from src.audio_formats import opus_available
+from src.services.audio_delivery import (
+    deliver_audio,
+    negotiate_output_format,
+    variant_key,
+    variant_keys,
+)
+
+BOTH = ["ogg", "mp3"]
+
+
+def _speech_mp3(seconds: float = 5.0, sample_rate: int = 24000) -> bytes:
+    import soundfile
+
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.02 * rng.standard_normal(len(t))
+    buffer = io.BytesIO()
+    soundfile.write(
+        buffer,
+        samples.astype(np.float32),
+        sample_rate,
+        format="MP3",
+        subtype="MPEG_LAYER_III",
+        compression_level=0.0,
+    )
+    return buffer.getvalue()
+
+
+class MemoryStorage:
+    """Storage keeping files in a dict."""
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.writes = 0
+
+    async def put_audio(self, key: str, audio: bytes, content_type: str = "audio/wav") -> str:
+        self.files[key] = audio
+        self.writes += 1
+        return key
+
+    async def download_audio(self, key: str) -> Optional[bytes]:
+        return self.files.get(key)
+
+
+class TestNegotiation:
+    """Format comes from Accept, then device_info, else MP3."""
+
+    @pytest.mark.parametrize(
+        "accept,expected",
+        [
+            ("audio/ogg", "ogg"),
+            ("audio/ogg; codecs=opus", "ogg"),
+            ("application/json, audio/opus", "ogg"),
+            ("audio/mpeg", "mp3"),
+            ("audio/ogg;q=0.5, audio/mpeg", "mp3"),
+            ("audio/mpeg, audio/ogg", "ogg"),
+            ("audio/webm", "mp3"),
+            ("*/*", "mp3"),
+            (None, "mp3"),
+        ],
+    )
+    def test_accept_header(self, accept, expected):
+        assert negotiate_output_format(accept, available=BOTH) == expected
+
+    def test_device_info_when_accept_names_no_audio(self):
+        device = {"audio_formats": ["audio/ogg", "mp3"]}
+
+        assert negotiate_output_format("application/json", device, available=BOTH) == "ogg"
+        assert negotiate_output_format("audio/mpeg", device, available=BOTH) == "mp3"
+        assert negotiate_output_format(None, {"audio_formats": ["mp3"]}, available=BOTH) == "mp3"
+
+    def test_ogg_not_offered_when_unavailable(self):
+        assert negotiate_output_format("audio/ogg", available=["mp3"]) == "mp3"
+
+
+@pytest.mark.skipif(not opus_available(), reason="libsndfile without Opus")
+class TestDelivery:
+    """MP3 is transcoded to Opus/OGG once and the variant is stored."""
+
+    async def test_ogg_variant_is_several_times_smaller(self):
+        import soundfile
+
+        storage = MemoryStorage()
+        mp3 = _speech_mp3()
+
+        delivered = await deliver_audio(storage, "tts-cache/openai/abc.mp3", mp3, "ogg")
+
+        assert delivered.format == "ogg"
+        assert delivered.content_type == "audio/ogg"
+        assert delivered.audio_key == "tts-cache/openai/abc.ogg"
+        assert len(delivered.audio) * 3 < len(mp3)
+        assert abs(soundfile.info(io.BytesIO(delivered.audio)).duration - 5.0) < 0.1
+
+    async def test_variant_is_transcoded_once(self):
+        storage = MemoryStorage()
+        mp3 = _speech_mp3(seconds=1.0)
+
+        first = await deliver_audio(storage, "a/output.mp3", mp3, "ogg")
+        second = await deliver_audio(storage, "a/output.mp3", mp3, "ogg")
+
+        assert storage.writes == 1
+        assert second.audio == first.audio
+
+    async def test_same_format_and_undecodable_audio_are_passed_through(self):
+        storage = MemoryStorage()
+        mp3 = _speech_mp3(seconds=1.0)
+
+        same = await deliver_audio(storage, "a/output.mp3", mp3, "mp3")
+        broken = await deliver_audio(storage, "b/output.mp3", b"\xff\xfb" * 64, "ogg")
+
+        assert same.audio_key == "a/output.mp3"
+        assert broken.audio_key == "b/output.mp3"
+        assert broken.format == "mp3"
+        assert storage.writes == 0
+
+    def test_variant_key(self):
+        assert variant_key("users/1/turns/2/output.mp3", "ogg") == "users/1/turns/2/output.ogg"
+        assert variant_keys("users/1/turns/2/output.ogg") == [
+            "users/1/turns/2/output.ogg",
+            "users/1/turns/2/output.mp3",
+        ]
+
+
+class TestServeAudio:
+    """The public audio endpoint only serves variants, it never produces them."""
+
+    @pytest.fixture
+    def client(self, monkeypatch, tmp_path):
+        from fastapi.testclient import TestClient
+
+        from src.api.main import create_app
+        from src.services import storage
+
+        monkeypatch.setattr(storage, "LOCAL_STORAGE_DIR", tmp_path)
+        return TestClient(create_app())
+
+    def test_does_not_transcode(self, client, tmp_path):
+        mp3 = b"\xff\xfb\x90\x00" + b"\x00" * 413
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "output.mp3").write_bytes(mp3)
+
+        response = client.get("/api/audio/a/output.mp3", headers={"Accept": "audio/ogg"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.content == mp3
+        assert not (tmp_path / "a" / "output.ogg").exists()
+
+    @pytest.mark.skipif(not opus_available(), reason="libsndfile without Opus")
+    def test_serves_stored_variant(self, client, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "output.mp3").write_bytes(b"\xff\xfb\x90\x00" + b"\x00" * 413)
+        (tmp_path / "a" / "output.ogg").write_bytes(b"OggS" + b"\x00" * 60)
+
+        response = client.get("/api/audio/a/output.mp3", headers={"Accept": "audio/ogg"})
+
+        assert response.headers["content-type"] == "audio/ogg"
+        assert response.content.startswith(b"OggS")
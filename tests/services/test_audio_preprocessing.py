@@ -0,0 +1,96 @@
+"""Tests for audio preprocessing before STT.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.4**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import io
+import wave
+
+import numpy as np
+import soundfile
+
+from src.services.audio_preprocessing import preprocess_audio
+
+
+def _wav(samples: np.ndarray, sample_rate: int, channels: int = 1) -> bytes:
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def _read(audio: bytes) -> tuple[int, int, int]:
+    with wave.open(io.BytesIO(audio), "rb") as wav:
+        return wav.getnchannels(), wav.getframerate(), wav.getnframes()
+
+
+def _tone(seconds: float, sample_rate: int) -> np.ndarray:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return 0.5 * np.sin(2 * np.pi * 440 * t)
+
+
+class TestPreprocessAudio:
+    """WAV input is downmixed, downsampled and trimmed."""
+
+    def test_stereo_48k_becomes_mono_16k(self):
+        mono = _tone(1.0, 48000)
+        stereo = np.column_stack([mono, mono]).ravel()
+
+        result = preprocess_audio(_wav(stereo, 48000, channels=2))
+
+        channels, sample_rate, _ = _read(result.audio)
+        assert result.processed
+        assert (channels, sample_rate) == (1, 16000)
+        assert result.original_duration_ms == 1000
+        assert len(result.audio) < len(_wav(stereo, 48000, channels=2)) / 5
+
+    def test_trims_leading_and_trailing_silence(self):
+        silence = np.zeros(16000)
+        samples = np.concatenate([silence, _tone(1.0, 16000), silence])
+
+        result = preprocess_audio(_wav(samples, 16000), padding_ms=100)
+
+        assert result.original_duration_ms == 3000
+        assert 1000 <= result.duration_ms <= 1240
+
+    def test_all_silence_is_kept(self):
+        result = preprocess_audio(_wav(np.zeros(16000), 16000))
+
+        assert result.duration_ms == 1000
+
+    def test_low_sample_rate_is_not_upsampled(self):
+        result = preprocess_audio(_wav(_tone(0.5, 8000), 8000))
+
+        assert _read(result.audio)[1] == 8000
+
+    def test_ogg_and_mp3_are_decoded(self):
+        tone = np.concatenate([np.zeros(24000), _tone(1.0, 48000), np.zeros(24000)])
+        for file_format, subtype in (("OGG", "OPUS"), ("MP3", "MPEG_LAYER_III")):
+            buffer = io.BytesIO()
+            soundfile.write(buffer, tone, 48000, format=file_format, subtype=subtype)
+
+            result = preprocess_audio(buffer.getvalue())
+
+            assert result.processed, file_format
+            assert _read(result.audio)[:2] == (1, 16000)
+            assert abs(result.original_duration_ms - 2000) < 100, file_format
+            assert result.duration_ms < result.original_duration_ms
+
+    def test_webm_passes_through(self):
+        webm = b"\x1a\x45\xdf\xa3" + b"\x00" * 1000
+
+        result = preprocess_audio(webm)
+
+        assert result.audio == webm
+        assert not result.processed
+        assert result.duration_ms is None
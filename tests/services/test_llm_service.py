@@ -0,0 +1,179 @@
+"""Tests for LLMService against the provider emulator.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 12.1**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from typing import Optional
+
+import httpx
+
+from src.adapters.scheduler import ProviderScheduler
+from src.cache import TieredCache
+from src.emulator import EmulatorConfig, EndpointProfile, create_emulator_app
+from src.services.llm import LLMService
+from src.services.llm_cache import LLMResponseCache, classify_intent, normalize_utterance
+
+FAST = EndpointProfile(latency_p50_ms=0, latency_p95_ms=0)
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    """ASGI transport to the emulator counting requests."""
+
+    def __init__(self, config: EmulatorConfig):
+        self.inner = httpx.ASGITransport(app=create_emulator_app(config))
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        return await self.inner.handle_async_request(request)
+
+
+def _service(
+    transport: CountingTransport,
+    response_cache: Optional[LLMResponseCache] = None,
+) -> LLMService:
+    service = LLMService(http_client=httpx.AsyncClient(transport=transport))
+    service.response_cache = response_cache
+    service.groq_api_key = "test"
+    service.groq_base_url = "http://emulator/v1"
+    return service
+
+
+def _response_cache() -> LLMResponseCache:
+    return LLMResponseCache(
+        cache=TieredCache(name="llm-test", max_bytes=1024 * 1024),
+        ttl_seconds={"greeting": 86400, "weather": 1800, "other": 3600},
+        never_cache=["time", "medication", "emergency"],
+    )
+
+
+class TestLLMService:
+    """Completions use the shared client, in full or streamed."""
+
+    async def test_completion_reuses_shared_client(self):
+        transport = CountingTransport(EmulatorConfig(chat=FAST, chat_response_text="Добрый день"))
+        service = _service(transport)
+        client = service.http_client
+
+        first = await service.generate_response("привет")
+        second = await service.generate_response("как дела")
+        await service.aclose()
+
+        assert first == second == "Добрый день"
+        assert transport.requests == 2
+        assert client.is_closed
+
+    async def test_server_errors_are_retried(self, monkeypatch):
+        from src.services import llm
+
+        scheduler = ProviderScheduler({}, transient_retries=2, backoff_seconds=0.01)
+        monkeypatch.setattr(llm, "get_provider_scheduler", lambda: scheduler)
+        transport = CountingTransport(
+            EmulatorConfig(chat=EndpointProfile(latency_p50_ms=0, error_rate=1.0))
+        )
+        service = _service(transport)
+
+        reply = await service.generate_response("привет")
+        await service.aclose()
+
+        assert reply == "Здравствуйте! Чем могу помочь?"  # simple reply after retries
+        assert transport.requests == 3
+
+    async def test_stream_yields_deltas(self):
+        text = "Здравствуйте! Чем могу помочь?"
+        service = _service(CountingTransport(EmulatorConfig(chat=FAST, chat_response_text=text)))
+
+        deltas = [delta async for delta in service.generate_response_stream("привет")]
+        await service.aclose()
+
+        assert len(deltas) == len(text.split())
+        assert "".join(deltas).strip() == text
+
+    async def test_stream_falls_back_to_simple_reply_on_error(self):
+        config = EmulatorConfig(chat=EndpointProfile(latency_p50_ms=0, error_rate=1.0))
+        service = _service(CountingTransport(config))
+
+        deltas = [delta async for delta in service.generate_response_stream("привет")]
+        await service.aclose()
+
+        assert deltas == ["Здравствуйте! Чем могу помочь?"]
+
+    async def test_stream_without_api_key_yields_simple_reply(self):
+        service = LLMService()
+        service.groq_api_key = ""
+
+        deltas = [delta async for delta in service.generate_response_stream("спасибо")]
+
+        assert deltas == ["Пожалуйста! Рада помочь!"]
+
+
+class TestResponseCache:
+    """Repeated questions skip the LLM; some intents are never cached."""
+
+    def test_normalization_and_intents(self):
+        assert normalize_utterance("  Какая ПОГОДА сегодня?! ") == "какая погода сегодня"
+        assert normalize_utterance("Ещё раз") == normalize_utterance("еще раз")
+        assert classify_intent("какая погода сегодня") == "weather"
+        assert classify_intent("который час") == "time"
+        assert classify_intent("когда пить таблетки") == "medication"
+        assert classify_intent("расскажи сказку") == "other"
+
+    async def test_repeated_question_skips_llm(self):
+        transport = CountingTransport(EmulatorConfig(chat=FAST, chat_response_text="Солнечно"))
+        cache = _response_cache()
+        service = _service(transport, cache)
+
+        answers = [
+            await service.generate_response(question)
+            for question in ("Какая погода?", "какая погода", "КАКАЯ ПОГОДА!")
+        ]
+        streamed = [delta async for delta in service.generate_response_stream("какая погода?")]
+        await service.aclose()
+
+        assert answers == ["Солнечно"] * 3
+        assert streamed == ["Солнечно"]
+        assert transport.requests == 1
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["by_intent"]["weather"]["hit_rate"] == 0.75
+
+    async def test_language_is_part_of_key(self):
+        transport = CountingTransport(EmulatorConfig(chat=FAST))
+        service = _service(transport, _response_cache())
+
+        await service.generate_response("сәлем", language="kk")
+        await service.generate_response("сәлем", language="ru")
+        await service.aclose()
+
+        assert transport.requests == 2
+
+    async def test_never_cached_intents_always_call_llm(self):
+        transport = CountingTransport(EmulatorConfig(chat=FAST))
+        cache = _response_cache()
+        service = _service(transport, cache)
+
+        for _ in range(2):
+            await service.generate_response("Который час?")
+            await service.generate_response("Когда пить таблетки от давления?")
+        await service.aclose()
+
+        assert transport.requests == 4
+        assert cache.stats()["bypassed"] == 4
+        assert cache.stats()["hits"] == 0
+
+    async def test_streamed_answer_is_cached(self):
+        transport = CountingTransport(EmulatorConfig(chat=FAST, chat_response_text="Добрый день!"))
+        service = _service(transport, _response_cache())
+
+        streamed = [delta async for delta in service.generate_response_stream("привет")]
+        answer = await service.generate_response("привет")
+        await service.aclose()
+
+        assert "".join(streamed) == answer
+        assert transport.requests == 1
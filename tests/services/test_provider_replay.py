@@ -0,0 +1,185 @@
+"""Tests for the offline provider replay runner.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 9.4**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+import functools
+import uuid
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.models.entities_ext  # noqa: F401 - register all tables
+from src.adapters.stt.base import STTResult
+from src.models.database import Base
+from src.models.entities import User, Conversation, Turn
+from src.models.entities_ext import ProviderComparison
+from src.services import voice_session
+from src.services import provider_replay
+from src.services.provider_replay import ProviderReplayRunner
+
+
+class FakeStorage:
+    def __init__(self, missing: set[str]):
+        self.missing = missing
+
+    async def download_audio(self, key):
+        return None if key in self.missing else b"audio"
+
+
+class SlowStorage(FakeStorage):
+    """Storage where one clip takes long; records clips started before it ends."""
+
+    def __init__(self, slow_key: str):
+        super().__init__(set())
+        self.slow_key = slow_key
+        self.started: list[str] = []
+        self.started_before_slow_done: list[str] = []
+
+    async def download_audio(self, key):
+        self.started.append(key)
+        if key == self.slow_key:
+            await asyncio.sleep(0.3)
+            self.started_before_slow_done = list(self.started)
+        return b"audio"
+
+
+class CountingSTTAdapter:
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, provider):
+        self.provider = provider
+
+    async def transcribe(self, audio, language="ru", hints=None):
+        cls = CountingSTTAdapter
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        if self.provider == "google":
+            return STTResult(text="привет как дела", confidence=0.9, latency_ms=20)
+        return STTResult(text="привет как дела ок", confidence=0.8, latency_ms=10)
+
+
+@pytest.fixture
+async def session_maker(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_maker() as db:
+        user = User(
+            id=str(uuid.uuid4()),
+            name="Test",
+            email="test@example.com",
+            username="test",
+            hashed_password="x",
+        )
+        conversation = Conversation(
+            id=str(uuid.uuid4()),
+            user_id=user.id,
+            stt_provider_used="google",
+            tts_provider_used="google",
+        )
+        db.add_all([user, conversation])
+        for number in range(1, 11):
+            db.add(Turn(
+                id=str(uuid.uuid4()),
+                conversation_id=conversation.id,
+                turn_number=number,
+                audio_input_url=f"turn-{number}.wav",
+            ))
+        await db.commit()
+
+    CountingSTTAdapter.in_flight = CountingSTTAdapter.max_in_flight = 0
+    monkeypatch.setattr(
+        voice_session.AdapterFactory, "get_stt_adapter", staticmethod(CountingSTTAdapter)
+    )
+    yield session_maker
+    await engine.dispose()
+
+
+async def _rows(session_maker, run_id) -> list[ProviderComparison]:
+    async with session_maker() as db:
+        result = await db.execute(
+            select(ProviderComparison).where(ProviderComparison.run_id == run_id)
+        )
+        return list(result.scalars())
+
+
+class TestProviderReplay:
+    """Stored turns are compared once per run, concurrently and resumably."""
+
+    async def test_writes_one_row_per_turn(self, session_maker):
+        runner = ProviderReplayRunner(session_maker, FakeStorage(set()), concurrency=3, page_size=4)
+
+        summary = await runner.run("run-1")
+
+        rows = await _rows(session_maker, "run-1")
+        assert summary.processed == 10
+        assert len(rows) == 10
+        assert all(row.openai_text and row.google_text for row in rows)
+        assert float(rows[0].provider_wer) == pytest.approx(0.25)
+        assert CountingSTTAdapter.max_in_flight <= 3 * 2
+
+    async def test_resumes_from_checkpoint(self, session_maker):
+        runner = ProviderReplayRunner(session_maker, FakeStorage(set()), page_size=3)
+
+        await runner.run("run-1", limit=4)
+        assert len(await _rows(session_maker, "run-1")) == 4
+
+        summary = await runner.run("run-1")
+        rows = await _rows(session_maker, "run-1")
+        assert summary.processed == 6
+        assert len({row.turn_id for row in rows}) == 10
+
+    async def test_missing_audio_is_skipped(self, session_maker):
+        runner = ProviderReplayRunner(session_maker, FakeStorage({"turn-1.wav"}))
+
+        summary = await runner.run("run-1")
+
+        assert summary.missing_audio == 1
+        assert len(await _rows(session_maker, "run-1")) == 9
+
+    async def test_slow_clip_does_not_stall_the_page(self, session_maker):
+        async with session_maker() as db:
+            first = await db.scalar(
+                select(Turn.audio_input_url).order_by(Turn.id).limit(1)
+            )
+        storage = SlowStorage(first)
+        runner = ProviderReplayRunner(session_maker, storage, concurrency=2, page_size=3)
+
+        summary = await runner.run("run-1")
+
+        assert summary.processed == 10
+        # Clips of the next page started while the first clip was still slow
+        assert len(storage.started_before_slow_done) > 3
+        assert len(await _rows(session_maker, "run-1")) == 10
+
+    async def test_background_runs_are_cancelled_on_stop(self, session_maker, monkeypatch):
+        monkeypatch.setattr(
+            provider_replay,
+            "ProviderReplayRunner",
+            functools.partial(ProviderReplayRunner, session_maker, SlowStorage("turn-1.wav")),
+        )
+
+        provider_replay.start_background_replay("run-bg")
+        task, _ = provider_replay.get_background_replay("run-bg")
+        await asyncio.sleep(0.05)
+        await provider_replay.stop_background_replays()
+
+        assert task.cancelled()
+        assert provider_replay.get_background_replay("run-bg") is None
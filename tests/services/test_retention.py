@@ -0,0 +1,105 @@
+"""Tests for the audio retention policy.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 10.5**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.models.entities_ext  # noqa: F401 - register all tables
+from src.models.database import Base
+from src.models.entities import User, Conversation, Turn
+from src.services import retention
+from src.services.retention import RetentionPolicyService
+
+
+class MemoryStorage:
+    """Storage keeping files in a dict."""
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+
+    async def delete_audio(self, key: str) -> bool:
+        return self.files.pop(key, None) is not None
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = MemoryStorage()
+    monkeypatch.setattr(retention, "StorageService", lambda: storage)
+    return storage
+
+
+async def _turns(db, outputs: list[str], age_days: int) -> list[Turn]:
+    user = User(
+        id=str(uuid.uuid4()),
+        name="Test",
+        email=f"{uuid.uuid4()}@example.com",
+        username=str(uuid.uuid4()),
+        hashed_password="x",
+    )
+    conversation = Conversation(
+        id=str(uuid.uuid4()),
+        user_id=user.id,
+        stt_provider_used="google",
+        tts_provider_used="google",
+    )
+    turns = [
+        Turn(
+            conversation_id=conversation.id,
+            turn_number=number,
+            timestamp=datetime.utcnow() - timedelta(days=age_days),
+            audio_input_url=f"users/{user.id}/turns/{number}/input.wav",
+            audio_output_url=output,
+        )
+        for number, output in enumerate(outputs, start=1)
+    ]
+    db.add_all([user, conversation, *turns])
+    await db.flush()
+    return turns
+
+
+class TestCleanupOldAudio:
+    """Old turn audio is deleted, shared phrase audio is kept."""
+
+    async def test_shared_phrase_audio_survives_cleanup(self, db, storage):
+        shared_key = "tts-cache/openai/abc.mp3"
+        old = await _turns(db, [shared_key, "users/u/turns/2/output.mp3"], age_days=400)
+        recent = await _turns(db, [shared_key], age_days=1)
+        for turn in old + recent:
+            storage.files[turn.audio_input_url] = b"in"
+            storage.files[turn.audio_output_url] = b"out"
+        storage.files["users/u/turns/2/output.ogg"] = b"variant"
+
+        summary = await RetentionPolicyService(db).cleanup_old_audio()
+
+        assert summary["deleted_count"] == 2
+        assert shared_key in storage.files
+        assert "users/u/turns/2/output.mp3" not in storage.files
+        assert "users/u/turns/2/output.ogg" not in storage.files
+        assert all(turn.audio_input_url not in storage.files for turn in old)
+        assert all(turn.audio_output_url is None for turn in old)
+        assert recent[0].audio_output_url == shared_key
@@ -0,0 +1,118 @@
+"""Tests for the pipeline stage graph executor.
+
+**Feature: voice-assistant-pipeline**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+
+import pytest
+
+from src.services.stage_graph import StageGraph
+
+
+class TestStageGraph:
+    """Test dependency ordering, concurrency and timings."""
+
+    async def test_dependencies_see_results(self):
+        """A stage receives the results of the stages it depends on."""
+        graph = StageGraph()
+
+        async def first(results):
+            return 2
+
+        async def second(results):
+            return results["first"] * 10
+
+        graph.add("first", first)
+        graph.add("second", second, depends_on=("first",))
+        results = await graph.run()
+
+        assert results == {"first": 2, "second": 20}
+
+    async def test_independent_stages_run_concurrently(self):
+        """Independent stages overlap instead of running one after another."""
+        graph = StageGraph()
+
+        async def slow(results):
+            await asyncio.sleep(0.1)
+
+        graph.add("upload", slow)
+        graph.add("stt", slow)
+        await graph.run()
+
+        assert graph.timings_ms["total"] < 180
+
+    async def test_db_stages_are_serialized(self):
+        """Stages flagged uses_db never run at the same time."""
+        graph = StageGraph()
+        active = 0
+        max_active = 0
+
+        async def db_stage(results):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        for name in ("user", "conversation", "turn"):
+            graph.add(name, db_stage, uses_db=True)
+        await graph.run()
+
+        assert max_active == 1
+
+    async def test_timings_recorded_per_stage(self):
+        """Every stage gets a timing entry, plus the total."""
+        graph = StageGraph()
+
+        async def noop(results):
+            return None
+
+        graph.add("a", noop)
+        graph.add("b", noop, depends_on=("a",))
+        await graph.run()
+
+        assert set(graph.timings_ms) == {"a", "b", "total"}
+        assert all(v >= 0 for v in graph.timings_ms.values())
+
+    async def test_error_propagates_and_cancels_pending(self):
+        """The first failing stage's exception is raised and others are cancelled."""
+        graph = StageGraph()
+        cancelled = False
+
+        async def fail(results):
+            raise ValueError("Session not found")
+
+        async def slow(results):
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        graph.add("conversation", fail)
+        graph.add("stt", slow)
+        graph.add("turn", slow, depends_on=("conversation",))
+
+        with pytest.raises(ValueError, match="Session not found"):
+            await graph.run()
+        assert cancelled
+
+    async def test_cycle_is_rejected(self):
+        """Cyclic dependencies are reported before anything runs."""
+        graph = StageGraph()
+
+        async def noop(results):
+            return None
+
+        graph.add("a", noop, depends_on=("b",))
+        graph.add("b", noop, depends_on=("a",))
+
+        with pytest.raises(ValueError, match="cycle"):
+            await graph.run()
@@ -0,0 +1,156 @@
+"""Tests for the pre-synthesized TTS phrase cache.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 3.5, 5.3**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import time
+from typing import Optional
+
+from src.adapters.tts.base import TTSAdapter, TTSResult
+from src.services.llm import canned_responses
+from src.services.tts_cache import TTSPhraseCache
+
+
+class MemoryStorage:
+    """Storage keeping files in a dict."""
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.writes = 0
+
+    async def put_audio(self, key: str, audio: bytes, content_type: str = "audio/wav") -> str:
+        self.files[key] = audio
+        self.writes += 1
+        return key
+
+    async def download_audio(self, key: str) -> Optional[bytes]:
+        return self.files.get(key)
+
+
+class CountingTTSAdapter(TTSAdapter):
+    """Fake TTS returning the text as audio."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def synthesize(self, text, language="ru", voice=None, speed=1.0):
+        self.calls += 1
+        return TTSResult(audio=text.encode(), format="mp3", duration_ms=1000, latency_ms=300)
+
+    def get_provider_name(self):
+        return "openai"
+
+
+def _phrases() -> dict[str, list[str]]:
+    return {language: canned_responses(language) for language in ("ru", "kk")}
+
+
+class TestWarmUp:
+    """Canned phrases are synthesized once and stored once."""
+
+    async def test_warm_synthesizes_all_canned_phrases(self):
+        storage = MemoryStorage()
+        adapter = CountingTTSAdapter()
+        cache = TTSPhraseCache(storage=storage)
+
+        synthesized = await cache.warm(_phrases(), ["openai"], lambda provider: adapter)
+
+        total = len(canned_responses("ru")) + len(canned_responses("kk"))
+        assert synthesized == adapter.calls == total
+        assert storage.writes == total
+
+        phrase = await cache.get("Здравствуйте! Чем могу помочь?", "ru", "openai")
+        assert phrase.audio == "Здравствуйте! Чем могу помочь?".encode()
+        assert phrase.audio_key.startswith("tts-cache/openai/")
+
+    async def test_warm_after_restart_reads_storage(self):
+        storage = MemoryStorage()
+        await TTSPhraseCache(storage=storage).warm(
+            _phrases(), ["openai"], lambda provider: CountingTTSAdapter()
+        )
+
+        adapter = CountingTTSAdapter()
+        synthesized = await TTSPhraseCache(storage=storage).warm(
+            _phrases(), ["openai"], lambda provider: adapter
+        )
+
+        assert synthesized == 0
+        assert adapter.calls == 0
+
+    async def test_failing_provider_does_not_stop_others(self):
+        class FailingAdapter(CountingTTSAdapter):
+            async def synthesize(self, text, language="ru", voice=None, speed=1.0):
+                raise RuntimeError("no API key")
+
+        working = CountingTTSAdapter()
+        cache = TTSPhraseCache(storage=MemoryStorage())
+
+        await cache.warm(
+            _phrases(),
+            ["openai", "google"],
+            lambda provider: FailingAdapter() if provider == "openai" else working,
+        )
+
+        assert working.calls > 0
+        assert await cache.get("Извините, не понял.", "ru", "google") is not None
+        assert cache.stats()["pinned"] == working.calls
+
+
+class TestLookup:
+    """Frequent answers are learned; hits skip TTS."""
+
+    async def test_frequent_text_is_learned(self):
+        cache = TTSPhraseCache(storage=MemoryStorage(), learn_threshold=3)
+        adapter = CountingTTSAdapter()
+        text = "Примите таблетку после еды."
+
+        for _ in range(3):
+            assert await cache.get(text, "ru", "openai") is None
+            result = await adapter.synthesize(text)
+            if cache.should_store(text, "ru", "openai"):
+                await cache.put(text, "ru", "openai", result)
+
+        phrase = await cache.get(text, "ru", "openai")
+        assert phrase is not None
+        assert adapter.calls == 3
+        assert cache.stats()["hits"] == 1
+
+    async def test_hit_is_served_in_single_digit_milliseconds(self):
+        cache = TTSPhraseCache(storage=MemoryStorage())
+        await cache.warm(_phrases(), ["openai"], lambda provider: CountingTTSAdapter())
+
+        started = time.perf_counter()
+        phrase = await cache.get("Сейчас дневное время.", "ru", "openai")
+
+        assert phrase is not None
+        assert (time.perf_counter() - started) * 1000 < 10
+
+    async def test_key_covers_voice_speed_and_provider(self):
+        base = TTSPhraseCache.key("Привет", "ru", "openai")
+
+        assert TTSPhraseCache.key("Привет ", "ru", "openai") == base
+        assert TTSPhraseCache.key("Привет", "kk", "openai") != base
+        assert TTSPhraseCache.key("Привет", "ru", "google") != base
+        assert TTSPhraseCache.key("Привет", "ru", "openai", voice="alloy") != base
+        assert TTSPhraseCache.key("Привет", "ru", "openai", speed=1.25) != base
+
+    async def test_lru_eviction_keeps_canned_phrases(self):
+        cache = TTSPhraseCache(storage=MemoryStorage(), max_entries=15, learn_threshold=1)
+        await cache.warm(_phrases(), ["openai"], lambda provider: CountingTTSAdapter())
+        adapter = CountingTTSAdapter()
+
+        for i in range(10):
+            text = f"Ответ номер {i}"
+            await cache.get(text, "ru", "openai")
+            await cache.put(text, "ru", "openai", await adapter.synthesize(text))
+
+        assert cache.stats()["entries"] == 15
+        assert cache._entries.get(cache.key("Ответ номер 0", "ru", "openai")) is None
+        assert await cache.get("Ответ номер 9", "ru", "openai") is not None
+        assert await cache.get("Извините, не понял.", "ru", "openai") is not None
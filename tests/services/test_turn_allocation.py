@@ -0,0 +1,86 @@
+"""Tests for per-conversation turn number allocation.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 5.1**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import uuid
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.models.entities_ext  # noqa: F401 - register all tables
+from src.models.database import Base
+from src.models.entities import User, Conversation, Turn
+from src.services.voice_session import VoiceSessionService
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def conversation(db):
+    user = User(
+        id=str(uuid.uuid4()),
+        name="Test",
+        email="test@example.com",
+        username="test",
+        hashed_password="x",
+    )
+    conversation = Conversation(
+        id=str(uuid.uuid4()),
+        user_id=user.id,
+        stt_provider_used="google",
+        tts_provider_used="google",
+    )
+    db.add_all([user, conversation])
+    await db.flush()
+    return conversation
+
+
+class TestTurnNumberAllocation:
+    """Turn numbers come from the conversation counter."""
+
+    async def test_numbers_are_sequential(self, db, conversation):
+        """Each allocation returns the next number and advances the counter."""
+        service = VoiceSessionService(db)
+
+        numbers = [await service._get_next_turn_number(conversation.id) for _ in range(5)]
+
+        assert numbers == [1, 2, 3, 4, 5]
+        assert conversation.turn_count == 5
+
+    async def test_turns_created_from_text_use_counter(self, db, conversation):
+        """create_turn_from_text numbers turns through the counter."""
+        service = VoiceSessionService(db)
+
+        first = await service.create_turn_from_text(conversation.id, conversation.user_id, "а")
+        second = await service.create_turn_from_text(conversation.id, conversation.user_id, "б")
+
+        assert (await db.get(Turn, first)).turn_number == 1
+        assert (await db.get(Turn, second)).turn_number == 2
+
+    async def test_duplicate_turn_number_rejected(self, db, conversation):
+        """(conversation_id, turn_number) is unique."""
+        db.add(Turn(id=str(uuid.uuid4()), conversation_id=conversation.id, turn_number=1))
+        db.add(Turn(id=str(uuid.uuid4()), conversation_id=conversation.id, turn_number=1))
+
+        with pytest.raises(IntegrityError):
+            await db.flush()
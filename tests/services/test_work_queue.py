@@ -0,0 +1,103 @@
+"""Tests for the deferred work queue.
+
+**Feature: voice-assistant-pipeline**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import asyncio
+import uuid
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.models.entities_ext  # noqa: F401 - register all tables
+from src.models.database import Base
+from src.models.entities_ext import AuditLog
+from src.services import work_queue
+from src.services.work_queue import WorkQueue, defer
+
+
+@pytest.fixture
+async def session_maker():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def queue(monkeypatch, session_maker):
+    queue = WorkQueue(max_size=2, batch_size=10, session_maker=session_maker)
+    monkeypatch.setattr(work_queue, "_work_queue", queue)
+    yield queue
+    await queue.stop()
+
+
+def _audit_job(action: str):
+    async def job(db):
+        db.add(AuditLog(id=str(uuid.uuid4()), action=action, resource_type="test"))
+    return job
+
+
+async def _actions(session_maker) -> list[str]:
+    async with session_maker() as db:
+        result = await db.execute(select(AuditLog.action).order_by(AuditLog.action))
+        return list(result.scalars())
+
+
+class TestDefer:
+    """Jobs are handed to the worker only after the request commits."""
+
+    async def test_job_runs_after_commit(self, queue, session_maker):
+        """The worker starts on first defer(); no lifespan is needed."""
+        async with session_maker() as db:
+            await defer(db, _audit_job("a"))
+            await asyncio.sleep(0.01)
+            assert queue.size == 0
+            assert queue.processed_count == 0
+            await db.commit()
+
+        await queue.stop()
+
+        assert await _actions(session_maker) == ["a"]
+        assert queue.processed_count == 1
+
+    async def test_rollback_drops_jobs_and_frees_slots(self, queue, session_maker):
+        async with session_maker() as db:
+            await defer(db, _audit_job("a"))
+            await defer(db, _audit_job("b"))
+            await db.rollback()
+
+        assert queue.size == 0
+        # Both slots are free again: these would block otherwise
+        async with session_maker() as db:
+            await asyncio.wait_for(defer(db, _audit_job("c")), timeout=1)
+            await asyncio.wait_for(defer(db, _audit_job("d")), timeout=1)
+            await db.commit()
+        await queue.stop()
+
+        assert await _actions(session_maker) == ["c", "d"]
+
+    async def test_failed_job_does_not_roll_back_batch(self, queue, session_maker):
+        async def broken(db):
+            raise RuntimeError("boom")
+
+        async with session_maker() as db:
+            await defer(db, _audit_job("a"))
+            await defer(db, broken)
+            await db.commit()
+
+        await queue.stop()
+
+        assert await _actions(session_maker) == ["a"]
+        assert queue.processed_count == 1
+        assert queue.failed_count == 1
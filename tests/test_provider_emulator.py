@@ -0,0 +1,103 @@
+"""Tests for the provider emulator and adapters pointed at it.
+
+**Feature: voice-assistant-pipeline**
+**Validates: Requirements 12.1, 12.2**
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import pytest
+
+from src.adapters.stt.base import STTError
+from src.adapters.stt.google_adapter import GoogleSTTAdapter
+from src.emulator import EmulatorConfig, EndpointProfile, create_emulator_app
+
+FAST = EndpointProfile(latency_p50_ms=0, latency_p95_ms=0)
+
+
+def _client(config: EmulatorConfig) -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=create_emulator_app(config))
+    return httpx.AsyncClient(transport=transport, base_url="http://emulator/v1")
+
+
+def _config(**kwargs) -> EmulatorConfig:
+    kwargs.setdefault("transcription", FAST)
+    kwargs.setdefault("speech", FAST)
+    kwargs.setdefault("chat", FAST)
+    return EmulatorConfig(**kwargs)
+
+
+class TestProviderEmulator:
+    """Endpoints answer in the provider formats our clients parse."""
+
+    async def test_transcription_verbose_json(self):
+        async with _client(_config(transcript_text="раз два")) as client:
+            response = await client.post(
+                "/audio/transcriptions",
+                files={"file": ("audio.wav", b"\x00" * 100, "audio/wav")},
+                data={"model": "whisper-1", "response_format": "verbose_json"},
+            )
+
+        assert response.status_code == 200
+        assert [w["word"] for w in response.json()["words"]] == ["раз", "два"]
+
+    async def test_speech_payload_scales_with_text(self):
+        async with _client(_config(speech_ms_per_char=100)) as client:
+            short = await client.post("/audio/speech", json={"input": "а" * 10})
+            long = await client.post("/audio/speech", json={"input": "а" * 100})
+
+        assert short.headers["content-type"] == "audio/mpeg"
+        assert short.content[:2] == b"\xff\xfb"
+        assert len(long.content) > 5 * len(short.content)
+
+    async def test_chat_completion(self):
+        async with _client(_config(chat_response_text="Добрый день")) as client:
+            response = await client.post("/chat/completions", json={"messages": []})
+
+        assert response.json()["choices"][0]["message"]["content"] == "Добрый день"
+
+    async def test_rate_limit_returns_retry_after(self):
+        config = _config(rate_limit_rps=0.001, rate_limit_burst=2, retry_after_seconds=7)
+        async with _client(config) as client:
+            statuses = [
+                (await client.post("/chat/completions", json={})).status_code for _ in range(3)
+            ]
+            limited = await client.post("/chat/completions", json={})
+
+        assert statuses == [200, 200, 429]
+        assert limited.headers["retry-after"] == "7"
+
+    async def test_error_rate(self):
+        config = _config(chat=EndpointProfile(latency_p50_ms=0, error_rate=1.0))
+        async with _client(config) as client:
+            response = await client.post("/chat/completions", json={})
+
+        assert response.status_code == 500
+
+
+class TestAdaptersAgainstEmulator:
+    """Adapters work unchanged against the emulator via base URL settings."""
+
+    async def test_google_stt_adapter(self, monkeypatch):
+        async with _client(_config(transcript_text="привет мир")) as client:
+            adapter = GoogleSTTAdapter(http_client=client)
+            monkeypatch.setattr(adapter, "api_key", "test")
+            monkeypatch.setattr(adapter, "base_url", "http://emulator/v1")
+
+            result = await adapter.transcribe(b"\x00" * 100)
+
+        assert result.text == "привет мир"
+
+    async def test_google_stt_adapter_raises_on_provider_error(self, monkeypatch):
+        config = _config(transcription=EndpointProfile(latency_p50_ms=0, error_rate=1.0))
+        async with _client(config) as client:
+            adapter = GoogleSTTAdapter(http_client=client)
+            monkeypatch.setattr(adapter, "api_key", "test")
+            monkeypatch.setattr(adapter, "base_url", "http://emulator/v1")
+
+            with pytest.raises(STTError):
+                await adapter.transcribe(b"\x00" * 100)